@@ -1,7 +1,13 @@
 from urllib.parse import urlparse
 from datetime import date
-
-from flask import Flask, jsonify, redirect, render_template, request, session, url_for
+from http.cookiejar import CookieJar
+import json
+import urllib.error
+import urllib.request
+
+from flask import Flask, current_app, has_app_context, jsonify, redirect, render_template, request, session, url_for
+from werkzeug.local import LocalProxy
+import os
 import secrets
 
 from i18n import (
@@ -14,12 +20,19 @@ from i18n import (
     normalize_locale,
     translate,
 )
-
-app = Flask(__name__)
-app.secret_key = secrets.token_hex(16)
-
-# Mock database
-users_db = {
+import click
+
+from catalog import OrjsonProvider, encode_product, encode_product_orjson
+from catalog_generator import generate_products
+from catalog_import import DEFAULT_BATCH_SIZE, FORMATS, detect_format, import_products, import_stream, write_rows
+from metrics import Metrics
+from profiling import Profiler
+from server_timing import ServerTiming, measure as measure_phase
+from store import PRISTINE, Store
+from suggest import TOP_K as SUGGEST_LIMIT
+
+# Mock database: the seed data every app created by create_app() starts from
+default_users = {
     'testuser': {'password': 'password123', 'email': 'test@example.com', 'role': 'user'},
     'admin': {'password': 'admin123', 'email': 'admin@example.com', 'role': 'admin'}
 }
@@ -33,12 +46,41 @@ products_db = [
     {'id': 6, 'name': 'Webcam HD', 'price': 79.99, 'category': 'Electronics', 'stock': 60},
 ]
 
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+# (rule, options, view) for every page and API route; create_app() registers them
+ROUTES = []
+
+
+def route(rule: str, **options):
+    """Like app.route, but collects the view for create_app() instead of binding it to one app"""
+    def decorator(view):
+        ROUTES.append((rule, options, view))
+        return view
+    return decorator
+
+
+def current_store() -> Store:
+    """Storage of the app handling the request (the module-level app outside a request)"""
+    return (current_app if has_app_context() else app).extensions["store"]
+
+
+def current_extension(name: str):
+    return (current_app if has_app_context() else app).extensions[name]
+
+
+# Module-level names kept for views, scripts and tests; each resolves to the current app's object
+catalog = LocalProxy(lambda: current_store().catalog)
+users_db = LocalProxy(lambda: current_store().users)
+server_timing = LocalProxy(lambda: current_extension("server_timing"))
+metrics = LocalProxy(lambda: current_extension("metrics"))
+profiler = LocalProxy(lambda: current_extension("profiler"))
+
 
 def current_locale() -> str:
     return normalize_locale(session.get("locale", DEFAULT_LOCALE))
 
 
-@app.before_request
 def setup_locale():
     query_locale = request.args.get("lang")
     if query_locale:
@@ -49,7 +91,6 @@ def setup_locale():
         session["locale"] = detect_locale_from_header(request.headers.get("Accept-Language"))
 
 
-@app.context_processor
 def inject_i18n():
     locale = current_locale()
     demo_date = date(2026, 2, 16)
@@ -68,7 +109,7 @@ def inject_i18n():
     }
 
 
-@app.route("/set-locale/<locale>")
+@route("/set-locale/<locale>")
 def set_locale(locale):
     session["locale"] = normalize_locale(locale)
     next_path = request.args.get("next") or url_for("home")
@@ -76,27 +117,28 @@ def set_locale(locale):
     safe_path = parsed.path if parsed.path.startswith("/") else url_for("home")
     return redirect(safe_path)
 
-@app.route('/')
+@route('/')
 def home():
     return render_template('home.html')
 
-@app.route('/login')
+@route('/login')
 def login_page():
     return render_template('login.html')
 
-@app.route('/api/login', methods=['POST'])
+@route('/api/login', methods=['POST'])
 def login():
     data = request.json
     username = data.get('username')
     password = data.get('password')
     
-    if username in users_db and users_db[username]['password'] == password:
+    user = users_db.authenticate(username, password)
+    if user is not None:
         session['user'] = username
-        session['role'] = users_db[username]['role']
+        session['role'] = user['role']
         return jsonify({
             'success': True,
             'message': translate("api.login.success", current_locale()),
-            'role': users_db[username]['role']
+            'role': user['role']
         })
     
     return jsonify({
@@ -104,64 +146,93 @@ def login():
         'message': translate("api.login.invalid", current_locale())
     }), 401
 
-@app.route('/register')
+@route('/register')
 def register_page():
     return render_template('register.html')
 
-@app.route('/api/register', methods=['POST'])
+@route('/api/register', methods=['POST'])
 def register():
     data = request.json
     username = data.get('username')
     email = data.get('email')
     password = data.get('password')
     
-    if username in users_db:
+    if not users_db.create(username, {'password': password, 'email': email, 'role': 'user'}):
         return jsonify({
             'success': False,
             'message': translate("api.register.user_exists", current_locale())
         }), 400
     
-    users_db[username] = {'password': password, 'email': email, 'role': 'user'}
     return jsonify({'success': True, 'message': translate("api.register.success", current_locale())})
 
-@app.route('/products')
+@route('/products')
 def products_page():
     category = request.args.get('category', 'all')
-    return render_template('products.html', category=category)
+    category_counts = catalog.facet_counts()['facets']['category']
+    return render_template('products.html', category=category, category_counts=category_counts)
 
-@app.route('/api/products')
+@route('/api/products')
 def get_products():
-    category = request.args.get('category', 'all')
-    search = request.args.get('search', '').lower()
+    filters = product_filters()
     
-    filtered_products = products_db
+    if request.accept_mimetypes.best_match(['application/json', NDJSON_MIMETYPE]) == NDJSON_MIMETYPE:
+        return ndjson_products(filters)
     
-    if category != 'all':
-        filtered_products = [p for p in filtered_products if p['category'] == category]
-    
-    if search:
-        filtered_products = [p for p in filtered_products if search in p['name'].lower()]
-    
-    return jsonify(filtered_products)
+    # filter() selects the rows eagerly, so the scan counts as "view", not serialization
+    filtered_products = catalog.filter(**filters)
+    body = measure_phase("json", catalog.encode_list, filtered_products)
+    return current_app.response_class(body, mimetype='application/json')
+
+@route('/api/products/facets')
+def product_facets():
+    """Category, price bucket and stock counts for the current search and filters"""
+    return jsonify(catalog.facet_counts(**product_filters()))
+
+@route('/api/products/suggest')
+def suggest_products():
+    """Autocomplete for the search box: top completions for ?q=, most viewed first"""
+    limit = max(1, min(request.args.get('limit', 8, type=int), SUGGEST_LIMIT))
+    matches = catalog.suggest(request.args.get('q', '').strip(), limit)
+    return jsonify([{'id': product['id'], 'name': product['name']} for product in matches])
+
+@route('/api/products/stream')
+def stream_products():
+    return ndjson_products(product_filters())
+
+def product_filters() -> dict:
+    """category/search plus the optional min_price, max_price and in_stock range filters"""
+    in_stock = request.args.get('in_stock')
+    return {
+        'category': request.args.get('category', 'all'),
+        'search': request.args.get('search', '').lower(),
+        'min_price': request.args.get('min_price', type=float),
+        'max_price': request.args.get('max_price', type=float),
+        'in_stock': None if in_stock is None else in_stock.lower() in ('1', 'true', 'yes'),
+    }
 
-@app.route('/product/<int:product_id>')
+def ndjson_products(filters: dict):
+    """Newline-delimited JSON sent with chunked transfer; memory stays flat for any catalog size"""
+    return current_app.response_class(catalog.iter_ndjson(catalog.filter(**filters)), mimetype=NDJSON_MIMETYPE)
+
+@route('/product/<int:product_id>')
 def product_detail(product_id):
-    product = next((p for p in products_db if p['id'] == product_id), None)
+    product = catalog.get(product_id)
     if product:
+        catalog.record_view(product_id)
         return render_template('product_detail.html', product=product)
     return translate("api.product.not_found", current_locale()), 404
 
-@app.route('/cart')
+@route('/cart')
 def cart_page():
     return render_template('cart.html')
 
-@app.route('/checkout')
+@route('/checkout')
 def checkout_page():
     if 'user' not in session:
         return render_template('login.html')
     return render_template('checkout.html')
 
-@app.route('/api/place-order', methods=['POST'])
+@route('/api/place-order', methods=['POST'])
 def place_order():
     if 'user' not in session:
         return jsonify({
@@ -176,20 +247,20 @@ def place_order():
         'order_id': 'ORD-12345'
     })
 
-@app.route('/dashboard')
+@route('/dashboard')
 def dashboard():
     if 'user' not in session:
         return render_template('login.html')
     return render_template('dashboard.html', username=session['user'], role=session.get('role', 'user'))
 
-@app.route('/profile')
+@route('/profile')
 def profile():
     if 'user' not in session:
         return render_template('login.html')
-    user_data = users_db.get(session['user'], {})
+    user_data = users_db.get(session['user']) or {}
     return render_template('profile.html', username=session['user'], email=user_data.get('email', ''))
 
-@app.route('/api/update-profile', methods=['POST'])
+@route('/api/update-profile', methods=['POST'])
 def update_profile():
     if 'user' not in session:
         return jsonify({
@@ -201,22 +272,144 @@ def update_profile():
     username = session['user']
     
     if 'email' in data:
-        users_db[username]['email'] = data['email']
+        users_db.update(username, email=data['email'])
     
     return jsonify({'success': True, 'message': translate("api.profile.updated", current_locale())})
 
-@app.route('/logout')
+@route('/logout')
 def logout():
     session.clear()
     return render_template('home.html')
 
-@app.route('/forms')
+@route('/forms')
 def forms_demo():
     return render_template('forms_demo.html')
 
-@app.route('/components')
+@route('/components')
 def components_demo():
     return render_template('components_demo.html')
 
+def current_user_is_admin() -> bool:
+    user = users_db.get(session.get('user'))
+    return user is not None and user['role'] == 'admin'
+
+def admin_forbidden():
+    return jsonify({
+        'success': False,
+        'message': translate("api.admin.forbidden", current_locale())
+    }), 403
+
+@route('/api/admin/products/import', methods=['POST'])
+def import_catalog():
+    """Stream CSV (text/csv) or NDJSON (application/x-ndjson) rows into the catalog"""
+    if not current_user_is_admin():
+        return admin_forbidden()
+    
+    fmt = request.args.get('format') or detect_format(content_type=request.content_type)
+    if fmt not in FORMATS:
+        return jsonify({'success': False, 'message': f"Unknown format {fmt!r}"}), 400
+    if request.args.get('mode') == 'replace':
+        catalog.replace([])
+    
+    batch_size = request.args.get('batch_size', DEFAULT_BATCH_SIZE, type=int)
+    result = import_stream(catalog, request.stream, fmt, batch_size)
+    return jsonify({'success': True, **result.to_dict(), 'total': len(catalog)})
+
+catalog_cli = click.Group('catalog', help='Generate and load product catalogs.')
+
+@catalog_cli.command('generate')
+@click.argument('output', type=click.File('w'))
+@click.option('--count', default=100_000, show_default=True, help='Number of products.')
+@click.option('--seed', default=42, show_default=True, help='Same seed, same catalog.')
+@click.option('--start-id', default=1, show_default=True)
+@click.option('--format', 'fmt', type=click.Choice(FORMATS), help='Default: from the file extension.')
+def generate_catalog(output, count, seed, start_id, fmt):
+    """Write a synthetic catalog to OUTPUT (use - for stdout)."""
+    fmt = fmt or detect_format(filename=output.name)
+    written = write_rows(generate_products(count, seed, start_id), output, fmt)
+    click.echo(f"wrote {written} products ({fmt})", err=True)
+
+@catalog_cli.command('import')
+@click.argument('source', type=click.File('rb'))
+@click.option('--url', default='http://127.0.0.1:5000', show_default=True, help='Running server to load into.')
+@click.option('--username', default='admin', show_default=True)
+@click.option('--password', default='admin123', show_default=True)
+@click.option('--replace', is_flag=True, help='Drop the current catalog first.')
+@click.option('--batch-size', default=DEFAULT_BATCH_SIZE, show_default=True)
+def import_catalog_command(source, url, username, password, replace, batch_size):
+    """Stream SOURCE (CSV or NDJSON) into a running server's catalog."""
+    opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(CookieJar()))
+    login_request = urllib.request.Request(
+        f"{url}/api/login", data=json.dumps({'username': username, 'password': password}).encode(),
+        headers={'Content-Type': 'application/json'},
+    )
+    fmt = detect_format(filename=source.name)
+    query = f"format={fmt}&batch_size={batch_size}" + ('&mode=replace' if replace else '')
+    upload = urllib.request.Request(f"{url}/api/admin/products/import?{query}", data=source, method='POST')
+    upload.add_header('Content-Type', 'text/csv' if fmt == 'csv' else NDJSON_MIMETYPE)
+    try:
+        opener.open(login_request)
+        with opener.open(upload) as response:
+            click.echo(response.read().decode())
+    except urllib.error.HTTPError as error:
+        step = 'login' if error.url.endswith('/api/login') else 'import'
+        raise click.ClickException(f"{step} failed: HTTP {error.code} {api_message(error)}")
+    except urllib.error.URLError as error:
+        raise click.ClickException(f"cannot reach {url}: {error.reason}")
+
+def api_message(error: urllib.error.HTTPError) -> str:
+    """The 'message' of a JSON error response, else the HTTP reason"""
+    try:
+        return json.loads(error.read())['message']
+    except (ValueError, KeyError, TypeError):
+        return error.reason
+
+def preload_catalog(catalog):
+    """CATALOG_IMPORT_FILE / CATALOG_SYNTHETIC_COUNT fill the catalog at startup (for load tests)"""
+    path = os.environ.get('CATALOG_IMPORT_FILE')
+    if path:
+        with open(path, 'rb') as source:
+            import_stream(catalog, source, detect_format(filename=path))
+    count = int(os.environ.get('CATALOG_SYNTHETIC_COUNT', 0))
+    if count:
+        import_products(catalog, generate_products(count, int(os.environ.get('CATALOG_SEED', 42)), catalog.next_id()))
+
+def create_app(config: dict | None = None) -> Flask:
+    """
+    Build an app with its own catalog, users and extensions
+    `config` is applied on top of the defaults, e.g. create_app({'TESTING': True})
+    """
+    app = Flask(__name__)
+    app.secret_key = secrets.token_hex(16)
+    app.config.update(config or {})
+    # JSON_PROVIDER=orjson swaps in the faster encoder (needs the orjson package)
+    if app.config.setdefault("JSON_PROVIDER", os.environ.get("JSON_PROVIDER", "default")) == "orjson":
+        app.json = OrjsonProvider(app)
+    
+    store = Store(
+        app, products_db, default_users,
+        encode=encode_product_orjson if isinstance(app.json, OrjsonProvider) else encode_product,
+    )
+    app.before_request(setup_locale)
+    app.context_processor(inject_i18n)
+    for rule, options, view in ROUTES:
+        app.add_url_rule(rule, view_func=view, **options)
+    app.cli.add_command(catalog_cli)
+    if app.config.setdefault('PRELOAD_CATALOG', True):
+        preload_catalog(store.catalog)
+    
+    # Each instrumentation layer can be switched off, e.g. to measure its overhead
+    if app.config.setdefault('SERVER_TIMING', True):
+        ServerTiming(app)
+    if app.config.setdefault('METRICS', True):
+        app_metrics = Metrics(app)
+        store.catalog.on_lookup = lambda hits, misses: app_metrics.record_cache_lookups("product_json", hits, misses)
+    if app.config.setdefault('PROFILER', True):
+        Profiler(app, is_admin=current_user_is_admin, forbidden=admin_forbidden)
+    store.checkpoints[PRISTINE] = store.checkpoint()
+    return app
+
+app = create_app()
+
 if __name__ == '__main__':
     app.run(debug=True, port=5000)
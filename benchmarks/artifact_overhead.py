@@ -0,0 +1,44 @@
+"""
+Suite overhead of trace/screenshot capture: off vs always vs on-failure
+
+Runs the suite once per mode under the perf profile (headless, no slow_mo) with
+--timing-report, then prints suite wall time and overhead relative to "off":
+
+    python -m benchmarks.artifact_overhead                     # whole suite
+    python -m benchmarks.artifact_overhead tests/specs/forms   # any pytest args
+"""
+import json
+import subprocess
+import sys
+
+from tests.plugins.timing_report import TIMINGS_DIR
+
+MODES = {
+    "off": ["--tracing", "off", "--screenshot", "off"],
+    "always": ["--tracing", "on", "--screenshot", "on"],
+    "on-failure": ["--tracing", "retain-on-failure", "--screenshot", "only-on-failure"],
+}
+
+
+def run_mode(label: str, mode_args: list[str], pytest_args: list[str]) -> dict:
+    command = [
+        sys.executable, "-m", "pytest", *pytest_args, "-q",
+        "--run-profile", "perf", "--timing-report", "--timing-label", f"artifacts-{label}", *mode_args,
+    ]
+    subprocess.run(command, check=False, stdout=subprocess.DEVNULL)
+    return json.loads((TIMINGS_DIR / f"artifacts-{label}.json").read_text())
+
+
+def main() -> None:
+    pytest_args = sys.argv[1:] or ["tests/"]
+    results = {label: run_mode(label, args, pytest_args) for label, args in MODES.items()}
+    baseline = results["off"]["suite_seconds"]
+    print(f"{'mode':<12}{'suite':>10}{'overhead':>11}")
+    for label, result in results.items():
+        seconds = result["suite_seconds"]
+        print(f"{label:<12}{seconds:>9.2f}s{(seconds - baseline) / baseline:>+10.1%}")
+    print(f"per-test detail: python -m benchmarks.compare_timings {TIMINGS_DIR}/artifacts-*.json")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Memory per product and range-filter latency: dict list vs columnar catalog
+
+Builds a synthetic catalog, then compares the bytes per product held by a list
+of dicts (the old storage) with a whole ProductCatalog (columns, facet index and
+all), and the median time of /api/products range filters evaluated per dict, as
+array map/compress masks, and (when installed) as NumPy masks:
+
+    python -m benchmarks.columnar_store
+    python -m benchmarks.columnar_store --size 1000000 --repeats 5
+"""
+import argparse
+import statistics
+import time
+import tracemalloc
+
+import product_columns
+from catalog_generator import generate_products
+from catalog import ProductCatalog
+
+FILTERS = {
+    "price 50-150": {"min_price": 50.0, "max_price": 150.0},
+    "in stock": {"in_stock": True},
+    "Audio, under 40": {"category": "Audio", "max_price": 40.0},
+    "'pro', in stock, over 500": {"search": "pro", "in_stock": True, "min_price": 500.0},
+}
+
+
+def dict_filter(products: list[dict], category: str = "all", search: str = "", min_price: float | None = None,
+                max_price: float | None = None, in_stock: bool | None = None) -> list[int]:
+    """The per-item loop the columns replace"""
+    matches = []
+    for row, product in enumerate(products):
+        if category != "all" and product["category"] != category:
+            continue
+        if search and search not in product["name"].lower():
+            continue
+        if min_price is not None and product["price"] < min_price:
+            continue
+        if max_price is not None and product["price"] > max_price:
+            continue
+        if in_stock is not None and (product["stock"] > 0) != in_stock:
+            continue
+        matches.append(row)
+    return matches
+
+
+def median_ms(run, repeats: int) -> tuple[float, int]:
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        matches = len(list(run()))
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples), matches
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Dict list vs columnar product store")
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    tracemalloc.start()
+    products = list(generate_products(args.size))
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    tracemalloc.start()
+    catalog = ProductCatalog(generate_products(args.size))
+    catalog_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    columns = catalog.columns
+
+    print(f"{args.size:,} products")
+    print(f"  dict list  {dict_bytes / args.size:>8.1f} bytes/product")
+    print(f"  catalog    {catalog_bytes / args.size:>8.1f} bytes/product  "
+          f"(columns {columns.nbytes() / args.size:.1f}, {len(columns.names):,} distinct names)")
+
+    numpy = product_columns.np
+    print(f"\n  {'filter':<28}{'matches':>9}{'dicts':>11}{'arrays':>11}{'numpy':>11}")
+    for label, filters in FILTERS.items():
+        dict_ms, matches = median_ms(lambda: dict_filter(products, **filters), args.repeats)
+        product_columns.np = None
+        array_ms, _ = median_ms(lambda: columns.select(len(columns), **filters), args.repeats)
+        product_columns.np = numpy
+        numpy_cell = "-"
+        if numpy is not None:
+            numpy_ms, _ = median_ms(lambda: columns.select(len(columns), **filters), args.repeats)
+            numpy_cell = f"{numpy_ms:.1f}ms"
+        print(f"  {label:<28}{matches:>9,}{dict_ms:>9.1f}ms{array_ms:>9.1f}ms{numpy_cell:>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Compare per-test durations saved by `pytest --timing-report`
+
+    pytest tests/ --timing-report --run-profile debug
+    pytest tests/ --timing-report --run-profile ci
+    pytest tests/ --timing-report --run-profile perf
+    python -m benchmarks.compare_timings perf-results/timings/*.json
+
+Fixture cost on its own (setup + teardown), e.g. fresh contexts against the pool:
+
+    pytest tests/ --timing-report --timing-label fresh-context --context-pool-size 0
+    pytest tests/ --timing-report --timing-label pooled
+    python -m benchmarks.compare_timings --phase overhead perf-results/timings/{fresh-context,pooled}.json
+"""
+import argparse
+import json
+from pathlib import Path
+
+from tests.plugins.timing_report import total_seconds
+
+PHASES = {
+    "total": total_seconds,
+    "setup": lambda entry: entry["setup"],
+    "call": lambda entry: entry["call"],
+    "teardown": lambda entry: entry["teardown"],
+    "overhead": lambda entry: entry["setup"] + entry["teardown"],
+}
+
+
+def load_runs(paths: list[Path]) -> list[dict]:
+    return [json.loads(path.read_text()) for path in paths]
+
+
+def render_table(runs: list[dict], phase: str = "total") -> str:
+    seconds = PHASES[phase]
+    labels = [run["label"] for run in runs]
+    nodeids = sorted({nodeid for run in runs for nodeid in run["tests"]})
+    width = max(10, *(len(label) for label in labels)) + 2
+    lines = ["".join(f"{label:>{width}}" for label in labels) + "  test"]
+    for nodeid in nodeids:
+        cells = []
+        for run in runs:
+            entry = run["tests"].get(nodeid)
+            cells.append(f"{seconds(entry):>{width - 1}.3f}s" if entry else f"{'-':>{width}}")
+        lines.append("".join(cells) + f"  {nodeid}")
+    lines.append("".join(f"{sum(seconds(e) for e in run['tests'].values()):>{width - 1}.2f}s" for run in runs) + f"  sum ({phase})")
+    lines.append("".join(f"{run['suite_seconds']:>{width - 1}.2f}s" for run in runs) + "  suite wall time")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("timings", nargs="+", type=Path, help="timing JSON files, one per run")
+    parser.add_argument("--phase", choices=sorted(PHASES), default="total", help="which part of each test to compare")
+    args = parser.parse_args()
+    print(render_table(load_runs(args.timings), args.phase))
+
+
+if __name__ == "__main__":
+    main()
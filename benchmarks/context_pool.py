@@ -0,0 +1,92 @@
+"""
+Per-test browser overhead: a new context per test vs the warm context pool
+
+Serves the app on a free local port, then times what the page fixture spends
+around each test body: creating a context and page and closing them afterwards,
+against ContextPool.acquire/release. Each is measured for a test that never
+leaves about:blank and for one that loads an app page:
+
+    python -m benchmarks.context_pool
+    python -m benchmarks.context_pool --tests 100
+
+Needs Chromium (playwright install chromium); without it nothing is measured.
+"""
+import argparse
+import statistics
+import threading
+import time
+
+from playwright.sync_api import Error, sync_playwright
+from werkzeug.serving import make_server
+
+from app import create_app
+from tests.fixtures.context_pool import ContextPool
+
+SCENARIOS = {
+    "stays on about:blank": None,
+    "loads /login": "/login",
+}
+
+
+def fresh_overhead(browser, base_url: str, path: str | None, tests: int) -> list[float]:
+    samples = []
+    for _ in range(tests):
+        started = time.perf_counter()
+        context = browser.new_context()
+        page = context.new_page()
+        setup = time.perf_counter() - started
+        if path:
+            page.goto(base_url + path)
+        started = time.perf_counter()
+        context.close()
+        samples.append(setup + time.perf_counter() - started)
+    return samples
+
+
+def pooled_overhead(browser, base_url: str, path: str | None, tests: int) -> tuple[list[float], int]:
+    """Per-test seconds and how many contexts the pool had to create"""
+    pool = ContextPool(browser, base_url, size=1)
+    samples = []
+    for _ in range(tests):
+        started = time.perf_counter()
+        context, page = pool.acquire()
+        setup = time.perf_counter() - started
+        if path:
+            page.goto(base_url + path)
+        started = time.perf_counter()
+        pool.release(context, page)
+        samples.append(setup + time.perf_counter() - started)
+    created = pool.created
+    pool.close()
+    return samples, created
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="New context per test vs pooled contexts")
+    parser.add_argument("--tests", type=int, default=50, help="Simulated tests per scenario")
+    args = parser.parse_args()
+
+    server = make_server("127.0.0.1", 0, create_app(), threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    try:
+        with sync_playwright() as playwright:
+            try:
+                browser = playwright.chromium.launch()
+            except Error as error:
+                print(f"Chromium is not available, nothing measured: {error.message.splitlines()[0]}")
+                return
+            print(f"median per-test overhead over {args.tests} tests")
+            print(f"{'scenario':<24}{'new context':>14}{'pooled':>12}{'saved':>12}{'contexts':>10}")
+            for label, path in SCENARIOS.items():
+                fresh = statistics.median(fresh_overhead(browser, base_url, path, args.tests)) * 1000
+                pooled, created = pooled_overhead(browser, base_url, path, args.tests)
+                pooled = statistics.median(pooled) * 1000
+                print(f"{label:<24}{fresh:>11.1f} ms{pooled:>9.1f} ms{fresh - pooled:>9.1f} ms{created:>10}")
+            browser.close()
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
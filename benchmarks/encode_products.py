@@ -0,0 +1,64 @@
+"""
+Encode time of one /api/products response body at large catalog sizes
+
+Compares jsonify (the default provider), the orjson provider, and joining
+cached per-product fragments (first request after a change vs steady state):
+
+    python -m benchmarks.encode_products
+    python -m benchmarks.encode_products --sizes 10000 100000 1000000 --repeats 9
+"""
+import argparse
+import statistics
+import time
+
+from flask import Flask
+
+from benchmarks.microbench import synthetic_catalog
+from catalog import OrjsonProvider, ProductCatalog, encode_product, encode_product_orjson, orjson
+
+
+def median_ms(run, repeats: int) -> float:
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def strategies(products: list[dict]) -> dict:
+    default_app = Flask("default-json")
+    cases = {"jsonify (default provider)": lambda: default_app.json.response(products).get_data()}
+    if orjson is not None:
+        orjson_app = Flask("orjson")
+        orjson_app.json = OrjsonProvider(orjson_app)
+        cases["jsonify (orjson provider)"] = lambda: orjson_app.json.response(products).get_data()
+
+    for label, encode in (("json", encode_product), ("orjson", encode_product_orjson if orjson else None)):
+        if encode is None:
+            continue
+        cold = ProductCatalog(products, encode=encode)
+        cases[f"fragments/{label}, cold cache"] = lambda cold=cold: (cold.clear_cache(), cold.encode_list(cold.filter()))
+        warm = ProductCatalog(products, encode=encode)
+        warm.encode_list(warm.filter())
+        cases[f"fragments/{label}, warm cache"] = lambda warm=warm: warm.encode_list(warm.filter())
+    return cases
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Encode time of /api/products bodies")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeats", type=int, default=7)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        products = synthetic_catalog(size)
+        print(f"\n{size:,} products")
+        results = {label: median_ms(run, args.repeats) for label, run in strategies(products).items()}
+        baseline = results["jsonify (default provider)"]
+        for label, ms in results.items():
+            print(f"  {label:<30}{ms:>10.2f} ms  {baseline / ms:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
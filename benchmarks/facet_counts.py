@@ -0,0 +1,78 @@
+"""
+Facet query latency vs catalog size
+
+Compares /api/products/facets answered from the incremental index (first query
+after a write, and repeated) with counting by scanning every product, plus what
+maintaining the index adds to a product update. The last table shows how each
+cost grows with the catalog: only unfiltered and repeated queries stay flat;
+the bitsets are as wide as the largest id, and a new search scans the names.
+
+    python -m benchmarks.facet_counts
+    python -m benchmarks.facet_counts --sizes 10000 100000 1000000
+"""
+import argparse
+import statistics
+import time
+from collections import Counter
+
+from catalog import ProductCatalog
+from catalog_generator import generate_products
+from facets import FACETS
+
+QUERIES = {
+    "unfiltered": {},
+    "category + in stock": {"category": "Audio", "in_stock": True},
+    "price range": {"min_price": 50.0, "max_price": 500.0},
+    "search": {"search": "pro"},
+    "search + price range": {"search": "pro", "min_price": 50.0, "max_price": 500.0},
+}
+
+
+def scan_counts(products: list[dict]) -> dict:
+    return {facet: Counter(map(value_of, products)) for facet, value_of in FACETS.items()}
+
+
+def median_us(run, repeats: int, before=None) -> float:
+    samples = []
+    for _ in range(repeats):
+        if before is not None:
+            before()
+        started = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - started) * 1_000_000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Facet query latency vs catalog size")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeats", type=int, default=21)
+    args = parser.parse_args()
+
+    scaling = {}
+    for size in args.sizes:
+        catalog = ProductCatalog(generate_products(size))
+        products = list(catalog)
+        print(f"\n{size:,} products (full scan: {median_us(lambda: scan_counts(products), 3) / 1000:.1f} ms)")
+        catalog.facet_counts(min_price=0.0)  # build the price index outside the timings
+        for label, filters in QUERIES.items():
+            query = lambda: catalog.facet_counts(**filters)
+            cold = median_us(query, args.repeats, before=catalog.facets.cache.clear)
+            warm = median_us(query, args.repeats)
+            scaling.setdefault(f"{label} (first)", []).append(cold)
+            print(f"  {label:<24} first {cold:>10.1f} us   repeated {warm:>6.1f} us")
+        old = catalog.get(size // 2)
+        new = {**old, "price": old["price"] + 1000, "stock": 0}
+        update = median_us(lambda: (catalog.facets.update(old, new), catalog.facets.update(new, old)), args.repeats)
+        scaling.setdefault("index update (x2)", []).append(update)
+        print(f"  {'index update (x2)':<24}       {update:>10.1f} us")
+
+    if len(args.sizes) > 1:
+        growth = args.sizes[-1] / args.sizes[0]
+        print(f"\ngrowth from {args.sizes[0]:,} to {args.sizes[-1]:,} products ({growth:,.0f}x)")
+        for label, samples in scaling.items():
+            print(f"  {label:<32}{samples[-1] / samples[0]:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
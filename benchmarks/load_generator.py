@@ -0,0 +1,436 @@
+"""
+HTTP load generator for the demo store
+
+Replays shopper journeys (browse, search, product detail, login, checkout) with an
+asyncio HTTP/1.1 client against a locally launched Flask server, then reports
+throughput, error rate and HDR-style latency histograms per endpoint:
+
+    python -m benchmarks.load_generator                                # closed loop, 16 users, 30s
+    python -m benchmarks.load_generator --rate 200 --duration 60       # open loop, Poisson arrivals
+    python -m benchmarks.load_generator --url http://127.0.0.1:5000    # use a running server
+    python -m benchmarks.load_generator --compare perf-results/load/a.json perf-results/load/b.json
+
+Results are saved to perf-results/load/<label>.json (label defaults to the git commit).
+In open-loop mode latency is measured from the scheduled arrival time, so queueing
+behind a saturated server is counted instead of hidden (no coordinated omission).
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+from urllib.parse import urlencode, urlparse
+
+LOAD_DIR = Path("perf-results") / "load"
+DEMO_PRODUCTS = 6
+SEARCH_TERMS = ["laptop", "mouse", "cable", "key", "monitor", "cam", "zzz"]
+CATEGORIES = ["all", "Electronics", "Accessories"]
+CREDENTIALS = {"username": "testuser", "password": "password123"}
+
+
+class LatencyHistogram:
+    """
+    Log-linear histogram of microsecond latencies (HDR-style)
+    Each power-of-two range is split into 2**sub_bucket_bits buckets, so any
+    recorded value is reported within 1 / 2**sub_bucket_bits of its true value
+    """
+
+    def __init__(self, sub_bucket_bits: int = 5):
+        self.sub_bucket_bits = sub_bucket_bits
+        self.counts = Counter()
+        self.total = 0
+        self.sum_us = 0
+        self.max_us = 0
+
+    def bucket_floor(self, value_us: int) -> int:
+        shift = max(0, value_us.bit_length() - self.sub_bucket_bits)
+        return (value_us >> shift) << shift
+
+    def bucket_width(self, floor_us: int) -> int:
+        return 1 << max(0, floor_us.bit_length() - self.sub_bucket_bits)
+
+    def record(self, value_us: int):
+        value_us = max(0, int(value_us))
+        self.counts[self.bucket_floor(value_us)] += 1
+        self.total += 1
+        self.sum_us += value_us
+        self.max_us = max(self.max_us, value_us)
+
+    def merge(self, other: "LatencyHistogram"):
+        self.counts.update(other.counts)
+        self.total += other.total
+        self.sum_us += other.sum_us
+        self.max_us = max(self.max_us, other.max_us)
+
+    def percentile(self, pct: float) -> int:
+        """Upper edge of the bucket holding the pct-th percentile, capped at the max seen"""
+        if not self.total:
+            return 0
+        target = max(1, pct / 100 * self.total)
+        seen = 0
+        for floor in sorted(self.counts):
+            seen += self.counts[floor]
+            if seen >= target:
+                return min(floor + self.bucket_width(floor) - 1, self.max_us)
+        return self.max_us
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.total,
+            "mean_ms": round(self.sum_us / self.total / 1000, 3) if self.total else 0,
+            "p50_ms": self.percentile(50) / 1000,
+            "p90_ms": self.percentile(90) / 1000,
+            "p99_ms": self.percentile(99) / 1000,
+            "p999_ms": self.percentile(99.9) / 1000,
+            "max_ms": self.max_us / 1000,
+            "buckets_us": sorted(self.counts.items()),
+        }
+
+
+class EndpointStats:
+    """Latency histogram plus status/error counts for one endpoint"""
+
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.statuses = Counter()
+        self.errors = 0
+
+    def to_dict(self, elapsed: float) -> dict:
+        requests = self.latency.total
+        return {
+            "requests": requests,
+            "throughput_rps": round(requests / elapsed, 2) if elapsed else 0,
+            "errors": self.errors,
+            "error_rate": round(self.errors / requests, 4) if requests else 0,
+            "statuses": {str(status): count for status, count in sorted(self.statuses.items())},
+            "latency": self.latency.to_dict(),
+        }
+
+
+class HttpConnection:
+    """Minimal keep-alive HTTP/1.1 client with a per-user cookie jar"""
+
+    def __init__(self, host: str, port: int, timeout: float):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.reader = None
+        self.writer = None
+        self.cookies = {}
+
+    async def request(self, method: str, path: str, body: dict | None = None) -> tuple[int, bytes]:
+        payload = json.dumps(body).encode() if body is not None else b""
+        headers = [
+            f"{method} {path} HTTP/1.1",
+            f"Host: {self.host}:{self.port}",
+            "Connection: keep-alive",
+            "Accept-Language: en",
+        ]
+        if self.cookies:
+            headers.append("Cookie: " + "; ".join(f"{key}={value}" for key, value in self.cookies.items()))
+        if body is not None:
+            headers += ["Content-Type: application/json", f"Content-Length: {len(payload)}"]
+        message = ("\r\n".join(headers) + "\r\n\r\n").encode() + payload
+
+        for attempt in (1, 2):
+            fresh = self.writer is None
+            if fresh:
+                self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+            try:
+                self.writer.write(message)
+                await self.writer.drain()
+                return await asyncio.wait_for(self.read_response(), self.timeout)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                self.close()
+                # A reused connection may have been closed by the server between requests
+                if fresh or attempt == 2:
+                    raise
+        raise ConnectionError("unreachable")
+
+    async def read_response(self) -> tuple[int, bytes]:
+        status_line = await self.reader.readuntil(b"\r\n")
+        version, status = status_line.split(b" ", 2)[:2]
+        headers = {}
+        while (line := await self.reader.readuntil(b"\r\n")) != b"\r\n":
+            name, _, value = line.decode("latin-1").partition(":")
+            name, value = name.strip().lower(), value.strip()
+            if name == "set-cookie":
+                cookie_name, _, cookie_value = value.split(";", 1)[0].partition("=")
+                self.cookies[cookie_name] = cookie_value
+            headers[name] = value
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            body = bytearray()
+            while size := int((await self.reader.readuntil(b"\r\n")).strip() or b"0", 16):
+                body += await self.reader.readexactly(size + 2)
+                del body[-2:]
+            await self.reader.readuntil(b"\r\n")
+        elif "content-length" in headers:
+            body = await self.reader.readexactly(int(headers["content-length"]))
+        else:
+            body = await self.reader.read()
+            self.close()
+
+        if version == b"HTTP/1.0" or headers.get("connection", "").lower() == "close":
+            self.close()
+        return int(status), bytes(body)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+
+# Each step: (endpoint label, method, path, JSON body, expected statuses)
+def browse(product_count: int) -> list:
+    return [
+        ("GET /products", "GET", "/products", None, {200}),
+        ("GET /api/products", "GET", "/api/products", None, {200}),
+    ]
+
+def search(product_count: int) -> list:
+    query = {"search": random.choice(SEARCH_TERMS), "category": random.choice(CATEGORIES)}
+    return [("GET /api/products?search", "GET", f"/api/products?{urlencode(query)}", None, {200})]
+
+def product(product_count: int) -> list:
+    return [("GET /product/<id>", "GET", f"/product/{random.randint(1, product_count)}", None, {200})]
+
+def login(product_count: int) -> list:
+    return [("POST /api/login", "POST", "/api/login", CREDENTIALS, {200})]
+
+def checkout(product_count: int) -> list:
+    return login(product_count) + [
+        ("GET /checkout", "GET", "/checkout", None, {200}),
+        ("POST /api/place-order", "POST", "/api/place-order", {"items": [1, 2]}, {200}),
+    ]
+
+SCENARIOS = {"browse": browse, "search": search, "product": product, "login": login, "checkout": checkout}
+DEFAULT_MIX = "browse=4,search=3,product=3,login=1,checkout=1"
+
+
+def parse_mix(spec: str) -> dict[str, float]:
+    mix = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip() not in SCENARIOS:
+            raise ValueError(f"Unknown scenario {name!r}; choose from {', '.join(SCENARIOS)}")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+class LoadRun:
+    """Drives scenarios against one server and collects per-endpoint stats"""
+
+    def __init__(self, host: str, port: int, mix: dict[str, float], timeout: float = 10.0,
+                 product_count: int = DEMO_PRODUCTS):
+        self.host = host
+        self.port = port
+        self.product_count = product_count
+        self.names = list(mix)
+        self.weights = list(mix.values())
+        self.timeout = timeout
+        self.stats = defaultdict(EndpointStats)
+        self.scenarios = Counter()
+
+    async def run_scenario(self, connection: HttpConnection, scheduled: float | None = None):
+        name = random.choices(self.names, self.weights)[0]
+        self.scenarios[name] += 1
+        for index, (label, method, path, body, expected) in enumerate(SCENARIOS[name](self.product_count)):
+            # Only the first step of an open-loop arrival carries its queueing delay
+            started = scheduled if scheduled is not None and index == 0 else time.perf_counter()
+            stats = self.stats[label]
+            try:
+                status, _ = await connection.request(method, path, body)
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError):
+                connection.close()
+                stats.statuses["error"] += 1
+                stats.errors += 1
+                stats.latency.record((time.perf_counter() - started) * 1_000_000)
+                return
+            stats.latency.record((time.perf_counter() - started) * 1_000_000)
+            stats.statuses[status] += 1
+            if status not in expected:
+                stats.errors += 1
+
+    async def closed_loop(self, concurrency: int, duration: float):
+        deadline = time.perf_counter() + duration
+
+        async def user():
+            connection = HttpConnection(self.host, self.port, self.timeout)
+            while time.perf_counter() < deadline:
+                await self.run_scenario(connection)
+            connection.close()
+
+        await asyncio.gather(*(user() for _ in range(concurrency)))
+
+    async def open_loop(self, rate: float, concurrency: int, duration: float):
+        """Poisson arrivals at `rate`/s served by up to `concurrency` connections"""
+        idle = asyncio.Queue()
+        for _ in range(concurrency):
+            idle.put_nowait(HttpConnection(self.host, self.port, self.timeout))
+        pending = set()
+
+        async def arrival(scheduled: float):
+            connection = await idle.get()
+            # Each arrival is a new shopper: start from an empty cookie jar
+            connection.cookies = {}
+            try:
+                await self.run_scenario(connection, scheduled)
+            finally:
+                idle.put_nowait(connection)
+
+        start = time.perf_counter()
+        next_arrival = start
+        while next_arrival < start + duration:
+            delay = next_arrival - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            task = asyncio.create_task(arrival(next_arrival))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+            next_arrival += random.expovariate(rate)
+        await asyncio.gather(*pending)
+        while not idle.empty():
+            idle.get_nowait().close()
+
+    def report(self, elapsed: float, config: dict) -> dict:
+        overall = EndpointStats()
+        for stats in self.stats.values():
+            overall.latency.merge(stats.latency)
+            overall.statuses.update(stats.statuses)
+            overall.errors += stats.errors
+        return {
+            "config": config,
+            "elapsed_seconds": round(elapsed, 3),
+            "scenarios": dict(self.scenarios),
+            "overall": overall.to_dict(elapsed),
+            "endpoints": {label: stats.to_dict(elapsed) for label, stats in sorted(self.stats.items())},
+        }
+
+
+def free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def start_server(port: int, catalog_size: int = 0) -> subprocess.Popen:
+    """Launch app.py on a local port (optionally with a synthetic catalog) and wait until it accepts connections"""
+    server = subprocess.Popen(
+        [sys.executable, "-m", "flask", "--app", "app", "run", "--port", str(port), "--with-threads"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        env={**os.environ, "CATALOG_SYNTHETIC_COUNT": str(catalog_size)},
+    )
+    deadline = time.time() + 15 + catalog_size / 100_000
+    while time.time() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return server
+        except OSError:
+            if server.poll() is not None:
+                break
+            time.sleep(0.1)
+    server.kill()
+    raise RuntimeError(f"Flask server did not start on port {port}")
+
+
+def git_commit() -> str:
+    result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True)
+    return result.stdout.strip() or "local"
+
+
+def print_report(result: dict):
+    print(f"{'endpoint':<28}{'req':>8}{'rps':>9}{'err%':>7}{'p50':>9}{'p90':>9}{'p99':>9}{'max':>9}  (ms)")
+    rows = list(result["endpoints"].items()) + [("overall", result["overall"])]
+    for label, stats in rows:
+        latency = stats["latency"]
+        print(
+            f"{label:<28}{stats['requests']:>8}{stats['throughput_rps']:>9.1f}{stats['error_rate']:>7.1%}"
+            f"{latency['p50_ms']:>9.2f}{latency['p90_ms']:>9.2f}{latency['p99_ms']:>9.2f}{latency['max_ms']:>9.2f}"
+        )
+
+
+def compare(old_path: Path, new_path: Path):
+    """Side-by-side p50/p99/throughput of two saved runs"""
+    old, new = (json.loads(path.read_text()) for path in (old_path, new_path))
+    print(f"{'endpoint':<28}{'p50 old':>9}{'p50 new':>9}{'p99 old':>9}{'p99 new':>9}{'rps old':>9}{'rps new':>9}")
+    for label in sorted(set(old["endpoints"]) | set(new["endpoints"])):
+        cells = []
+        for key in ("p50_ms", "p99_ms"):
+            for run in (old, new):
+                stats = run["endpoints"].get(label)
+                cells.append(f"{stats['latency'][key]:>9.2f}" if stats else f"{'-':>9}")
+        for run in (old, new):
+            stats = run["endpoints"].get(label)
+            cells.append(f"{stats['throughput_rps']:>9.1f}" if stats else f"{'-':>9}")
+        print(f"{label:<28}" + "".join(cells))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", help="Target a running server instead of launching app.py")
+    parser.add_argument("--concurrency", type=int, default=16, help="Connections / virtual users (default 16)")
+    parser.add_argument("--rate", type=float, help="Open-loop arrivals per second (default: closed loop)")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds of load (default 30)")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"Scenario weights (default {DEFAULT_MIX})")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for scenario choice")
+    parser.add_argument("--catalog-size", type=int, default=0,
+                        help="Synthetic products added to the launched server (CATALOG_SYNTHETIC_COUNT)")
+    parser.add_argument("--label", help="Result file name (default: git commit)")
+    parser.add_argument("--compare", nargs=2, type=Path, metavar=("OLD", "NEW"), help="Diff two saved runs")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    random.seed(args.seed)
+    server = None
+    if args.url:
+        target = urlparse(args.url)
+        host, port = target.hostname, target.port or 80
+    else:
+        host, port = "127.0.0.1", free_port()
+        server = start_server(port, args.catalog_size)
+
+    run = LoadRun(host, port, parse_mix(args.mix), product_count=DEMO_PRODUCTS + args.catalog_size)
+    started = time.perf_counter()
+    try:
+        if args.rate:
+            asyncio.run(run.open_loop(args.rate, args.concurrency, args.duration))
+        else:
+            asyncio.run(run.closed_loop(args.concurrency, args.duration))
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+    elapsed = time.perf_counter() - started
+
+    label = args.label or git_commit()
+    config = {
+        "label": label,
+        "mode": "open" if args.rate else "closed",
+        "rate": args.rate,
+        "concurrency": args.concurrency,
+        "duration": args.duration,
+        "mix": args.mix,
+        "seed": args.seed,
+        "catalog_size": args.catalog_size,
+    }
+    result = run.report(elapsed, config)
+    LOAD_DIR.mkdir(parents=True, exist_ok=True)
+    path = LOAD_DIR / f"{label}.json"
+    path.write_text(json.dumps(result, indent=2))
+    print_report(result)
+    print(f"saved {path}")
+
+
+if __name__ == "__main__":
+    main()
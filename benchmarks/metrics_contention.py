@@ -0,0 +1,136 @@
+"""
+Cost of recording a metric under concurrent writers
+
+Times Counter.inc from several threads at once, either from long-lived worker
+threads or from one short-lived thread per "request" (what the threaded dev
+server does). The per-thread shards of metrics.ShardedValues are compared
+against one dict behind one lock, and the shard count left afterwards shows
+whether memory stays bounded:
+
+    python -m benchmarks.metrics_contention
+    python -m benchmarks.metrics_contention --threads 16 --increments 20000 --metrics 5
+"""
+import argparse
+import statistics
+import threading
+import time
+from collections import defaultdict
+
+from metrics import Counter, ShardedValues
+
+
+class LockedValues:
+    """Baseline: every write takes the same lock"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values = defaultdict(float)
+
+    def totals(self) -> dict:
+        with self._lock:
+            return dict(self._values)
+
+
+class LockedCounter(Counter):
+    def inc(self, *labelvalues: str, amount: float = 1.0) -> None:
+        values = self.values
+        with values._lock:
+            values._values[labelvalues] += amount
+
+
+def long_lived(counters: list[Counter], threads: int, increments: int) -> float:
+    """Wall time of every thread's increments, in seconds"""
+    def work():
+        for _ in range(increments):
+            for counter in counters:
+                counter.inc("GET")
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - started
+
+
+def thread_per_request(counters: list[Counter], threads: int, increments: int) -> float:
+    """
+    threads concurrent lanes, each starting a fresh thread for every request
+    Only the increment is timed (thread start-up would swamp it), so this is
+    the cost of a thread's first write: shard lookup, lease or allocation
+    """
+    spent = []
+
+    def request():
+        started = time.perf_counter()
+        for counter in counters:
+            counter.inc("GET")
+        spent.append(time.perf_counter() - started)
+
+    def lane():
+        for _ in range(increments):
+            worker = threading.Thread(target=request)
+            worker.start()
+            worker.join()
+
+    lanes = [threading.Thread(target=lane) for _ in range(threads)]
+    for worker in lanes:
+        worker.start()
+    for worker in lanes:
+        worker.join()
+    return sum(spent)
+
+
+MODES = {"long-lived": long_lived, "thread-per-request": thread_per_request}
+
+
+def new_counters(implementation: str, metrics: int) -> list[Counter]:
+    if implementation == "sharded":
+        return [Counter("bench_total", "", ("label",)) for _ in range(metrics)]
+    counters = [LockedCounter("bench_total", "", ("label",)) for _ in range(metrics)]
+    for counter in counters:
+        counter.values = LockedValues()
+    return counters
+
+
+def run(threads: int, increments: int, metrics: int, repeats: int) -> dict:
+    """
+    {mode: {implementation: (ns_per_request, shards_left)}}
+    A "request" writes once to each of `metrics` counters; median over repeats,
+    and every run checks the totals
+    """
+    results = {}
+    for mode, workload in MODES.items():
+        # thread creation dominates the per-request mode, so it gets fewer requests
+        count = increments if mode == "long-lived" else max(increments // 20, 1)
+        results[mode] = {}
+        for implementation in ("sharded", "single lock"):
+            timings = []
+            for _ in range(repeats):
+                counters = new_counters(implementation, metrics)
+                timings.append(workload(counters, threads, count) / (threads * count) * 1e9)
+                assert all(counter.values.totals()[("GET",)] == threads * count for counter in counters)
+            shards = max((len(c.values._shards) for c in counters if isinstance(c.values, ShardedValues)), default=1)
+            results[mode][implementation] = (statistics.median(timings), shards)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Metric recording cost under concurrent threads")
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--increments", type=int, default=50_000, help="Requests per thread, long-lived mode")
+    parser.add_argument("--metrics", type=int, default=3, help="Counters each request writes (latency, requests, cache)")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    results = run(args.threads, args.increments, args.metrics, args.repeats)
+    print(f"per request, {args.metrics} metrics")
+    print(f"{'mode':<22}{'sharded':>26}{'single lock':>16}")
+    for mode, by_implementation in results.items():
+        (sharded, shards), (locked, _) = by_implementation["sharded"], by_implementation["single lock"]
+        print(f"{mode:<22}{sharded:>10.0f} ns ({shards:>3} shards){locked:>13.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""
+Per-route microbenchmarks through Flask's test client (no network, no browser)
+
+Times /api/products across catalog sizes and filters, every HTML route in each
+supported locale, and the login/register/update-profile APIs:
+
+    python -m benchmarks.microbench                                   # print results
+    python -m benchmarks.microbench --save-baseline                   # store perf-results/microbench/baseline.json
+    python -m benchmarks.microbench --compare --threshold 10          # exit 1 if a route got >10% slower
+    python -m benchmarks.microbench --filter api/products --repeats 30
+
+Each case is warmed up, then timed in batches sized to at least --min-batch-ms;
+the median per-call time over --repeats batches is reported with its median
+absolute deviation (MAD). A case only counts as a regression when its median is
+both more than --threshold percent and more than 3 MADs above the baseline.
+"""
+import argparse
+import copy
+import itertools
+import json
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+import app as app_module
+from i18n import SUPPORTED_LOCALES
+
+MICROBENCH_DIR = Path("perf-results") / "microbench"
+BASELINE_PATH = MICROBENCH_DIR / "baseline.json"
+CATALOG_SIZES = (6, 1_000, 10_000)
+FILTERS = {
+    "all": "",
+    "category": "?category=Electronics",
+    "search": "?search=pro",
+    "category+search": "?category=Accessories&search=cable",
+}
+HTML_ROUTES = ("/", "/login", "/register", "/products", "/product/1", "/cart", "/forms", "/components")
+LOGGED_IN_ROUTES = ("/checkout", "/dashboard", "/profile")
+CATEGORIES = ("Electronics", "Accessories", "Audio", "Storage")
+
+
+@dataclass
+class Case:
+    name: str
+    call: Callable
+    expected_status: int = 200
+    catalog_size: int | None = None
+
+
+def synthetic_catalog(size: int) -> list[dict]:
+    """The six demo products followed by generated ones, in products_db's shape"""
+    base = copy.deepcopy(app_module.products_db[:6])
+    return base + [
+        {
+            "id": product_id,
+            "name": f"Product {product_id} Pro" if product_id % 7 == 0 else f"Product {product_id}",
+            "price": round(5 + product_id * 0.37 % 500, 2),
+            "category": CATEGORIES[product_id % len(CATEGORIES)],
+            "stock": product_id % 250,
+        }
+        for product_id in range(7, size + 1)
+    ]
+
+
+def logged_in_client(locale: str = "en"):
+    client = app_module.app.test_client()
+    client.get(f"/set-locale/{locale}")
+    client.post("/api/login", json={"username": "testuser", "password": "password123"})
+    return client
+
+
+def build_cases() -> list[Case]:
+    cases = []
+    anonymous = app_module.app.test_client()
+    for size in CATALOG_SIZES:
+        for query in FILTERS.values():
+            cases.append(Case(
+                f"GET /api/products{query} [n={size}]",
+                lambda query=query: anonymous.get(f"/api/products{query}"),
+                catalog_size=size,
+            ))
+
+    for locale in SUPPORTED_LOCALES:
+        client = logged_in_client(locale)
+        for route in HTML_ROUTES + LOGGED_IN_ROUTES:
+            cases.append(Case(f"GET {route} [{locale}]", lambda client=client, route=route: client.get(route)))
+
+    credentials = {"username": "testuser", "password": "password123"}
+    cases.append(Case("POST /api/login ok", lambda: anonymous.post("/api/login", json=credentials)))
+    cases.append(Case(
+        "POST /api/login invalid",
+        lambda: anonymous.post("/api/login", json={"username": "testuser", "password": "wrong"}),
+        expected_status=401,
+    ))
+    usernames = (f"bench_user_{index}" for index in itertools.count())
+    cases.append(Case(
+        "POST /api/register",
+        lambda: anonymous.post(
+            "/api/register", json={"username": next(usernames), "email": "bench@example.com", "password": "pw"}
+        ),
+    ))
+    member = logged_in_client()
+    cases.append(Case(
+        "POST /api/update-profile",
+        lambda: member.post("/api/update-profile", json={"email": "bench@example.com"}),
+    ))
+    return cases
+
+
+def timed_batch(call: Callable, batch: int) -> float:
+    """Seconds per call averaged over one batch"""
+    started = time.perf_counter()
+    for _ in range(batch):
+        call()
+    return (time.perf_counter() - started) / batch
+
+
+def measure(case: Case, warmup: int, repeats: int, min_batch_seconds: float) -> dict:
+    response = case.call()
+    if response.status_code != case.expected_status:
+        raise RuntimeError(f"{case.name}: expected {case.expected_status}, got {response.status_code}")
+    for _ in range(warmup):
+        case.call()
+
+    batch = 1
+    while timed_batch(case.call, batch) * batch < min_batch_seconds:
+        batch *= 2
+
+    samples = [timed_batch(case.call, batch) * 1_000_000 for _ in range(repeats)]
+    median = statistics.median(samples)
+    return {
+        "median_us": round(median, 2),
+        "mad_us": round(statistics.median(abs(sample - median) for sample in samples), 2),
+        "min_us": round(min(samples), 2),
+        "batch": batch,
+        "repeats": repeats,
+    }
+
+
+def run(cases: list[Case], warmup: int, repeats: int, min_batch_seconds: float) -> dict:
+    store = app_module.app.extensions["store"]
+    checkpoint = store.checkpoint()
+    results = {}
+    try:
+        for case in cases:
+            if case.catalog_size is not None:
+                store.catalog.replace(synthetic_catalog(case.catalog_size))
+            results[case.name] = measure(case, warmup, repeats, min_batch_seconds)
+            if case.catalog_size is not None:
+                store.restore(checkpoint)
+            print(f"{results[case.name]['median_us']:>12.1f} us  ±{results[case.name]['mad_us']:<8.1f} {case.name}")
+    finally:
+        store.restore(checkpoint)
+    return results
+
+
+def find_regressions(results: dict, baseline: dict, threshold: float) -> list[str]:
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        slowdown = current["median_us"] / previous["median_us"] - 1
+        noise = 3 * max(current["mad_us"], previous["mad_us"])
+        if slowdown * 100 > threshold and current["median_us"] - previous["median_us"] > noise:
+            regressions.append(
+                f"{name}: {previous['median_us']:.1f} -> {current['median_us']:.1f} us ({slowdown:+.1%})"
+            )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-route microbenchmarks through the Flask test client")
+    parser.add_argument("--filter", default="", help="Only run cases whose name contains this text")
+    parser.add_argument("--warmup", type=int, default=20, help="Untimed calls per case (default 20)")
+    parser.add_argument("--repeats", type=int, default=15, help="Timed batches per case (default 15)")
+    parser.add_argument("--min-batch-ms", type=float, default=20.0, help="Minimum batch duration (default 20ms)")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help=f"Baseline file (default {BASELINE_PATH})")
+    parser.add_argument("--save-baseline", action="store_true", help="Write these results as the new baseline")
+    parser.add_argument("--compare", action="store_true", help="Fail when a case regressed against the baseline")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Allowed slowdown in percent (default 10)")
+    args = parser.parse_args()
+
+    cases = [case for case in build_cases() if args.filter in case.name]
+    results = run(cases, args.warmup, args.repeats, args.min_batch_ms / 1000)
+
+    MICROBENCH_DIR.mkdir(parents=True, exist_ok=True)
+    (MICROBENCH_DIR / "latest.json").write_text(json.dumps(results, indent=2))
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(results, indent=2))
+        print(f"baseline saved to {args.baseline}")
+
+    if args.compare:
+        regressions = find_regressions(results, json.loads(args.baseline.read_text()), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} case(s) slower than baseline by more than {args.threshold}%:")
+            print("\n".join(f"  {line}" for line in regressions))
+            sys.exit(1)
+        print(f"\nno regressions beyond {args.threshold}% against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Latency added by the instrumentation layers (Server-Timing, /metrics, profiler)
+
+Builds one app per configuration with create_app and times the same routes
+through Flask's test client, reporting each route's median and its overhead
+over the bare app with every layer switched off:
+
+    python -m benchmarks.middleware_overhead
+    python -m benchmarks.middleware_overhead --routes / /api/products --rounds 9
+"""
+import argparse
+import statistics
+
+from app import create_app
+from benchmarks.microbench import Case, measure
+
+BASE_CONFIG = {"SERVER_TIMING": False, "METRICS": False, "PROFILER": False}
+CONFIGS = {
+    "bare": {},
+    "metrics": {"METRICS": True},
+    "profiler": {"PROFILER": True},
+    "server-timing 1%": {"SERVER_TIMING": True, "SERVER_TIMING_SAMPLE_RATE": 0.01},
+    "server-timing 100%": {"SERVER_TIMING": True, "SERVER_TIMING_SAMPLE_RATE": 1.0},
+    "all (defaults)": {"SERVER_TIMING": True, "METRICS": True, "PROFILER": True},
+}
+ROUTES = ("/", "/products", "/api/products", "/api/products?category=Electronics")
+
+
+def run(routes: tuple[str, ...], rounds: int, repeats: int, min_batch_seconds: float) -> dict:
+    """
+    {config: {route: median_us}}
+    Configurations are measured in interleaved rounds, so machine noise drifts
+    across all of them alike; the reported value is the median over rounds
+    """
+    clients = {name: create_app({**BASE_CONFIG, **overrides}).test_client() for name, overrides in CONFIGS.items()}
+    samples = {name: {route: [] for route in routes} for name in CONFIGS}
+    for _ in range(rounds):
+        for name, client in clients.items():
+            for route in routes:
+                case = Case(route, lambda client=client, route=route: client.get(route))
+                samples[name][route].append(measure(case, 20, repeats, min_batch_seconds)["median_us"])
+    return {name: {route: statistics.median(values) for route, values in by_route.items()}
+            for name, by_route in samples.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-request cost of each instrumentation layer")
+    parser.add_argument("--routes", nargs="+", default=list(ROUTES))
+    parser.add_argument("--rounds", type=int, default=5, help="Interleaved passes over every configuration")
+    parser.add_argument("--repeats", type=int, default=7)
+    parser.add_argument("--min-batch-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    results = run(tuple(args.routes), args.rounds, args.repeats, args.min_batch_ms / 1000)
+    bare = results["bare"]
+    width = max(map(len, args.routes)) + 2
+    print(f"{'configuration':<20}" + "".join(f"{route:>{width + 10}}" for route in args.routes))
+    for name, medians in results.items():
+        cells = "".join(
+            f"{medians[route]:>{width}.1f} us{medians[route] / bare[route] - 1:>+7.1%}" for route in args.routes
+        )
+        print(f"{name:<20}{cells}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Registrations per second as the number of registering threads grows
+
+Each thread registers its own batch of new usernames, interleaved with a pool of
+usernames that every thread races for, where exactly one attempt per name may
+win. Striped locks are compared with a single global lock (stripes=1):
+
+    python -m benchmarks.registry_throughput
+    python -m benchmarks.registry_throughput --threads 1 2 4 8 16 32 --users 20000
+"""
+import argparse
+import random
+import threading
+import time
+
+from user_registry import DEFAULT_STRIPES, UserRegistry
+
+
+def stress(registry: UserRegistry, threads: int, users: int, contended: int = 500, seed: int = 0) -> dict:
+    """
+    Each of `threads` threads registers `users` names of its own plus every name
+    in a shared pool of `contended`; returns the winners' counts and the rate
+    """
+    shared = [f"shared{index}" for index in range(contended)]
+    barrier = threading.Barrier(threads + 1)
+    created: list[list[str]] = [[] for _ in range(threads)]
+
+    def worker(slot: int):
+        names = [f"t{slot}-user{index}" for index in range(users)] + shared
+        random.Random(seed + slot).shuffle(names)
+        won = created[slot]
+        barrier.wait()
+        for name in names:
+            if registry.create(name, {"password": "pw", "email": f"{name}@example.com", "role": "user"}):
+                won.append(name)
+
+    workers = [threading.Thread(target=worker, args=(slot,)) for slot in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    winners = [name for won in created for name in won]
+    return {
+        "threads": threads,
+        "expected": threads * users + contended,
+        "created": len(winners),
+        "unique": len(set(winners)),
+        "seconds": elapsed,
+        "registrations_per_second": len(winners) / elapsed,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="User registry throughput vs thread count")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--users", type=int, default=20_000, help="New usernames per thread")
+    args = parser.parse_args()
+
+    print(f"{'threads':>8}{'stripes':>9}{'registrations/s':>18}{'duplicates':>12}")
+    for threads in args.threads:
+        for stripes in (DEFAULT_STRIPES, 1):
+            result = stress(UserRegistry(stripes=stripes), threads, args.users)
+            print(f"{threads:>8}{stripes:>9}{result['registrations_per_second']:>18,.0f}"
+                  f"{result['created'] - result['unique']:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Makespan of duration-balanced shards against naive file-based splitting
+
+    pytest tests/ --store-durations          # build .test_durations.json first
+    python -m benchmarks.shard_makespan --max-shards 8
+"""
+import argparse
+from pathlib import Path
+
+from tests.plugins.sharding import (
+    DURATIONS_PATH,
+    load_durations,
+    makespan,
+    partition_by_file,
+    partition_lpt,
+)
+
+
+def compare(weights: dict[str, float], max_shards: int) -> list[tuple[int, float, float]]:
+    """(shards, file-based makespan, LPT makespan) for 1..max_shards"""
+    return [
+        (n, makespan(partition_by_file(weights, n), weights), makespan(partition_lpt(weights, n), weights))
+        for n in range(1, max_shards + 1)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--durations-path", type=Path, default=DURATIONS_PATH)
+    parser.add_argument("--max-shards", type=int, default=8)
+    args = parser.parse_args()
+
+    weights = load_durations(args.durations_path)
+    if not weights:
+        parser.error(f"{args.durations_path} is empty or missing; run pytest with --store-durations first")
+
+    total = sum(weights.values())
+    print(f"{len(weights)} tests, {total:.1f}s serial")
+    print(f"{'shards':>6}  {'by file':>9}  {'LPT':>9}  {'ideal':>9}  {'saved':>6}")
+    for n, by_file, lpt in compare(weights, args.max_shards):
+        saved = 1 - lpt / by_file if by_file else 0.0
+        print(f"{n:>6}  {by_file:>8.1f}s  {lpt:>8.1f}s  {total / n:>8.1f}s  {saved:>6.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Keystroke latency of search-box autocomplete
+
+Types sampled product names one character at a time and times each lookup:
+the radix trie with cached top-k lists, a linear scan that ranks every match,
+and the full /api/products/suggest round trip through Flask's test client:
+
+    python -m benchmarks.suggest_latency
+    python -m benchmarks.suggest_latency --sizes 10000 100000 --words 50
+"""
+import argparse
+import random
+import statistics
+import time
+
+from app import create_app
+from catalog_generator import generate_products
+from suggest import TOP_K, SuggestIndex, name_keys
+
+
+def scan_suggest(products: list[dict], keys: list[set[str]], views: dict, prefix: str) -> list[int]:
+    matches = [product for product, product_keys in zip(products, keys)
+               if any(key.startswith(prefix) for key in product_keys)]
+    matches.sort(key=lambda product: (-views.get(product["id"], 0), product["name"], product["id"]))
+    return [product["id"] for product in matches[:TOP_K]]
+
+
+def keystrokes(products: list[dict], words: int, seed: int) -> list[str]:
+    """Every prefix of `words` randomly chosen words from product names, as typed"""
+    rng = random.Random(seed)
+    typed = []
+    for product in rng.sample(products, words):
+        word = rng.choice(product["name"].lower().split())
+        typed += [word[:length] for length in range(1, len(word) + 1)]
+    return typed
+
+
+def timings_us(lookup, prefixes: list[str]) -> list[float]:
+    samples = []
+    for prefix in prefixes:
+        started = time.perf_counter()
+        lookup(prefix)
+        samples.append((time.perf_counter() - started) * 1_000_000)
+    return samples
+
+
+def summary(samples: list[float]) -> str:
+    ordered = sorted(samples)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return f"p50 {statistics.median(ordered):>9.1f} us   p99 {p99:>9.1f} us"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Autocomplete keystroke latency")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--words", type=int, default=40, help="Sampled words typed per size")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        products = list(generate_products(size))
+        rng = random.Random(args.seed)
+        views = {rng.randint(1, size): rng.randint(1, 500) for _ in range(size // 10)}
+        started = time.perf_counter()
+        index = SuggestIndex(products, popularity=views)
+        build_s = time.perf_counter() - started
+        prefixes = keystrokes(products, args.words, args.seed)
+
+        print(f"\n{size:,} products ({len(prefixes)} keystrokes, trie built in {build_s:.2f}s)")
+        print(f"  {'radix trie':<16}{summary(timings_us(index.suggest, prefixes))}")
+        keys = [name_keys(product["name"]) for product in products]
+        scan_prefixes = prefixes[::max(1, len(prefixes) // 20)]
+        print(f"  {'linear scan':<16}{summary(timings_us(lambda p: scan_suggest(products, keys, views, p), scan_prefixes))}")
+
+        bench_app = create_app({"PRELOAD_CATALOG": False})
+        bench_catalog = bench_app.extensions["store"].catalog
+        bench_catalog.replace(products)
+        bench_catalog.views.update(views)
+        client = bench_app.test_client()
+        client.get("/api/products/suggest?q=a")
+        http = timings_us(lambda p: client.get("/api/products/suggest", query_string={"q": p}), prefixes)
+        print(f"  {'HTTP round trip':<16}{summary(http)}")
+
+
+if __name__ == "__main__":
+    main()
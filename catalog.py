@@ -0,0 +1,350 @@
+"""
+Product catalog stored as columns, with pre-serialized JSON fragments.
+
+Products live only in a ProductColumns table; dicts are built when a row is
+read. Each product's JSON encoding is cached as bytes together with the row's
+write version, so /api/products responses are assembled by joining fragments
+instead of building and encoding a dict per product. Rows are replaced on a
+copy of the columns (never mutated under a reader), and a cached fragment is
+only used while its version matches the row being served.
+"""
+import json
+import threading
+from itertools import count
+from typing import Callable, Iterable, Iterator
+
+from flask.json.provider import JSONProvider, _default
+
+from facets import MAX_CACHED_QUERIES, FacetIndex, PriceIndex, bitset
+from product_columns import FIELDS, ProductColumns, ProductRows
+from suggest import TOP_K, SuggestIndex
+
+# Larger batches drop the price index instead of inserting into it one by one
+MAX_PRICE_INDEX_PATCH = 64
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+
+def encode_product(product: dict) -> bytes:
+    """Same bytes jsonify produces for a product outside debug mode"""
+    return json.dumps(product, sort_keys=True, separators=(",", ":")).encode()
+
+
+def encode_product_orjson(product: dict) -> bytes:
+    return orjson.dumps(product, option=orjson.OPT_SORT_KEYS)
+
+
+class ProductCatalog:
+    """
+    In-memory products in columns, with an id lookup and a fragment cache.
+
+    Reads are lock-free; writers serialize on a lock and publish new objects.
+    Product views never wait for that lock.
+    on_lookup(hits, misses) is called once per encode_list call. Facet counts
+    are updated by every write. The autocomplete trie and the price index are
+    built on first use and then maintained by every write (and, for the trie,
+    every product view).
+    """
+
+    def __init__(self, products: Iterable[dict] = (), encode: Callable[[dict], bytes] = encode_product,
+                 on_lookup: Callable[[int, int], None] | None = None):
+        self.encode = encode
+        self.on_lookup = on_lookup
+        self.views: dict[int, int] = {}
+        self._lock = threading.Lock()
+        # Views are counted under their own lock; ids still to be re-ranked in
+        # the autocomplete trie wait in _viewed until the catalog lock is free
+        self._views_lock = threading.Lock()
+        self._viewed: set[int] = set()
+        # Write versions are never reused, so a fragment cached for one version
+        # can never be mistaken for another, even across replace and restore
+        self._versions = count(1)
+        self._fragments: dict[int, tuple[int, bytes]] = {}
+        self.replace(products)
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(self.filter())
+
+    def get(self, product_id: int) -> dict | None:
+        columns = self.columns
+        row = columns.row_of(product_id, len(columns))
+        return None if row is None else columns.row(row)
+
+    def replace(self, products: Iterable[dict]) -> None:
+        """Swap in a whole new catalog"""
+        with self._lock:
+            self.columns = ProductColumns(products, next(self._versions))
+            self._fragments = {}
+            self.facets = FacetIndex(self)
+            self._suggest = None
+            self._prices = None
+
+    def checkpoint(self) -> tuple[ProductColumns, int, dict[int, int]]:
+        """
+        Pin the current state without copying products.
+
+        The columns are only ever appended to in place (update and delete publish
+        a patched copy), so their first `count` rows stay exactly this state.
+        """
+        with self._lock:
+            return self.columns, len(self.columns), dict(self.views)
+
+    def restore(self, checkpoint: tuple[ProductColumns, int, dict[int, int]]) -> None:
+        """Return to a checkpoint; fragments are kept since they are checked by version"""
+        columns, rows, views = checkpoint
+        columns = columns.head(rows)
+        with self._lock:
+            self.columns = columns
+            self.facets = FacetIndex(self)
+            self._suggest = None
+            self._prices = None
+            with self._views_lock:
+                self.views = dict(views)
+                self._viewed = set()
+
+    def clear_cache(self) -> None:
+        self._fragments = {}
+
+    def add(self, product: dict) -> dict:
+        product = {field: product[field] for field in FIELDS}
+        if self.add_many([product]) == 0:
+            raise ValueError(f"Product {product['id']} already exists")
+        return product
+
+    def add_many(self, products: Iterable[dict]) -> int:
+        """
+        Append a batch under one lock acquisition, updating the indexes once.
+
+        Products whose id already exists are skipped; returns how many were added.
+        Readers work on a length-bounded snapshot, so appending in place is safe.
+        """
+        with self._lock:
+            columns = self.columns
+            batch = []
+            seen = set()
+            for product in products:
+                product_id = product["id"]
+                if product_id not in seen and (product_id > columns.max_id or columns.row_of(product_id) is None):
+                    seen.add(product_id)
+                    batch.append(product)
+            columns.extend(batch, next(self._versions))
+            self.facets.add_many(batch)
+            if self._prices is not None:
+                self._prices = self._prices.patched(added=batch) if len(batch) <= MAX_PRICE_INDEX_PATCH else None
+            if self._suggest is not None:
+                for product in batch:
+                    self._suggest.add(product)
+                self._rerank_viewed()
+        return len(batch)
+
+    def next_id(self) -> int:
+        return max(self.columns.ids, default=0) + 1
+
+    def update(self, product_id: int, **changes) -> dict:
+        unknown = changes.keys() - set(FIELDS)
+        if unknown:
+            raise TypeError(f"Unknown product fields: {', '.join(sorted(unknown))}")
+        with self._lock:
+            columns = self.columns.copy()
+            row = columns.row_of(product_id)
+            if row is None:
+                raise KeyError(product_id)
+            current = columns.row(row)
+            updated = {**current, **changes, "id": product_id}
+            columns.set_row(row, updated, next(self._versions))
+            self.columns = columns
+            self._fragments.pop(product_id, None)
+            self.facets.update(current, updated)
+            if self._prices is not None and updated["price"] != current["price"]:
+                self._prices = self._prices.patched(removed=[current], added=[updated])
+            if self._suggest is not None:
+                if updated["name"] != current["name"]:
+                    self._suggest.remove(current)
+                    self._suggest.add(updated)
+                self._rerank_viewed()
+        return columns.row(row)
+
+    def delete(self, product_id: int) -> None:
+        with self._lock:
+            columns = self.columns.copy()
+            row = columns.row_of(product_id)
+            if row is None:
+                raise KeyError(product_id)
+            current = columns.row(row)
+            columns.delete_row(row)
+            self.columns = columns
+            self._fragments.pop(product_id, None)
+            self.facets.remove(current)
+            if self._prices is not None:
+                self._prices = self._prices.patched(removed=[current])
+            if self._suggest is not None:
+                self._suggest.remove(current)
+                self._rerank_viewed()
+
+    def filter(self, category: str = "all", search: str = "", min_price: float | None = None,
+               max_price: float | None = None, in_stock: bool | None = None) -> ProductRows:
+        """Products matching the /api/products filters, from a snapshot of the catalog"""
+        columns = self.columns
+        rows = columns.select(len(columns), category, search, min_price, max_price, in_stock)
+        return ProductRows(columns, rows if isinstance(rows, (list, range)) else list(rows))
+
+    def facet_counts(self, category: str = "all", search: str = "", min_price: float | None = None,
+                     max_price: float | None = None, in_stock: bool | None = None) -> dict:
+        """
+        Counts per category, price bucket and stock status for the given filters.
+
+        A price range is read from the price index; a search needs one scan of
+        the names. The result is cached on the facet index until the next write.
+        """
+        facets = self.facets
+        key = (category, search, min_price, max_price, in_stock)
+        cached = facets.cache.get(key)
+        if cached is not None:
+            return cached
+        price_bits = search_bits = None
+        if min_price is not None or max_price is not None:
+            price_bits = bitset(self._price_index().ids_between(min_price, max_price))
+        if search:
+            search_bits = bitset(self.filter(search=search).ids())
+        result = facets.query(category, in_stock, price_bits, search_bits)
+        if len(facets.cache) >= MAX_CACHED_QUERIES:
+            facets.cache.clear()
+        facets.cache[key] = result
+        return result
+
+    def record_view(self, product_id: int) -> None:
+        """
+        Popularity signal for autocomplete ranking.
+
+        The count is taken under the views lock only. Re-ranking the trie has
+        to be serialized with the catalog writers, so it happens now if the
+        catalog lock is free and otherwise at the next write, view or suggest.
+        """
+        with self._views_lock:
+            self.views[product_id] = self.views.get(product_id, 0) + 1
+            self._viewed.add(product_id)
+        self._try_rerank_viewed()
+
+    def _try_rerank_viewed(self) -> None:
+        if self._suggest is not None and self._viewed and self._lock.acquire(blocking=False):
+            try:
+                self._rerank_viewed()
+            finally:
+                self._lock.release()
+
+    def _rerank_viewed(self) -> None:
+        """Apply counted views to the trie; the caller holds the catalog lock"""
+        with self._views_lock:
+            viewed, self._viewed = self._viewed, set()
+        for product_id in viewed:
+            self._suggest.bump(product_id, amount=0)
+
+    def suggest(self, prefix: str, limit: int = TOP_K) -> list[dict]:
+        """Most viewed products whose name, or a word in it, starts with prefix"""
+        index = self._suggest
+        if index is None:
+            with self._lock:
+                if self._suggest is None:
+                    # The new trie ranks by the current counts; views counted
+                    # while it is built are queued again and re-ranked later
+                    with self._views_lock:
+                        self._viewed = set()
+                    self._suggest = SuggestIndex(self, popularity=self.views)
+                index = self._suggest
+        else:
+            self._try_rerank_viewed()
+        products = (self.get(product_id) for product_id in index.suggest(prefix, limit))
+        return [product for product in products if product is not None]
+
+    def _price_index(self) -> PriceIndex:
+        index = self._prices
+        if index is None:
+            with self._lock:
+                if self._prices is None:
+                    self._prices = PriceIndex.build(self.columns.prices, self.columns.ids)
+                index = self._prices
+        return index
+
+    def _fragments_of(self, products: ProductRows, store: bool) -> Iterator[tuple[bytes, bool]]:
+        """(fragment, was cached) per row; a fragment is reused only for the same write version"""
+        fragments = self._fragments
+        columns = products.columns
+        ids, versions = columns.ids, columns.versions
+        for row in products.rows:
+            product_id, version = ids[row], versions[row]
+            cached = fragments.get(product_id)
+            if cached is not None and cached[0] == version:
+                yield cached[1], True
+                continue
+            encoded = self.encode(columns.row(row))
+            if store:
+                fragments[product_id] = (version, encoded)
+            yield encoded, False
+
+    def encode_list(self, products: ProductRows | Iterable[dict]) -> bytes:
+        """
+        JSON array of the given products.
+
+        Rows from filter() are served from cached fragments; plain dicts are
+        encoded as they are.
+        """
+        if isinstance(products, ProductRows):
+            parts = []
+            misses = 0
+            for encoded, cached in self._fragments_of(products, store=True):
+                parts.append(encoded)
+                misses += not cached
+        else:
+            parts = [self.encode(product) for product in products]
+            misses = len(parts)
+        if self.on_lookup is not None:
+            self.on_lookup(len(parts) - misses, misses)
+        return b"[" + b",".join(parts) + b"]\n"
+
+    def iter_ndjson(self, products: ProductRows, batch_size: int = 256) -> Iterator[bytes]:
+        """
+        One JSON document per line, yielded in chunks of batch_size lines.
+
+        Misses are encoded without being cached, so a full export does not grow
+        the fragment cache and memory stays bounded by one batch.
+        """
+        batch = []
+        for encoded, _ in self._fragments_of(products, store=False):
+            batch.append(encoded)
+            if len(batch) == batch_size:
+                yield b"\n".join(batch) + b"\n"
+                batch = []
+        if batch:
+            yield b"\n".join(batch) + b"\n"
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    app.json backed by orjson (enable with JSON_PROVIDER=orjson).
+
+    Keys are sorted like the default provider; output is always compact.
+    """
+
+    mimetype = "application/json"
+
+    def __init__(self, app):
+        if orjson is None:
+            raise RuntimeError("JSON_PROVIDER=orjson needs the orjson package")
+        super().__init__(app)
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=_default, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
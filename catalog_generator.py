@@ -0,0 +1,49 @@
+"""
+Deterministic synthetic product catalogs for load tests.
+
+generate_products(count, seed) lazily yields products in the products_db shape;
+the same seed always produces the same catalog. Categories are weighted, names
+come from per-category vocabularies, prices are log-normal around a category
+base price and stock has a share of sold-out items.
+"""
+import random
+from math import exp
+from typing import Iterator
+
+# category: (weight, base price, price spread (sigma), nouns)
+CATEGORIES = {
+    "Electronics": (0.30, 250.0, 0.9, ("Laptop", "Monitor", "Webcam", "Tablet", "Router", "Projector", "Drone")),
+    "Accessories": (0.30, 25.0, 0.7, ("Mouse", "Keyboard", "Cable", "Charger", "Stand", "Hub", "Sleeve")),
+    "Audio": (0.15, 80.0, 0.8, ("Headphones", "Speaker", "Earbuds", "Microphone", "Soundbar", "Amplifier")),
+    "Storage": (0.15, 60.0, 0.8, ("SSD", "Hard Drive", "Flash Drive", "Memory Card", "NAS", "Enclosure")),
+    "Gaming": (0.10, 120.0, 0.9, ("Controller", "Headset", "Chair", "Mousepad", "Console", "Racing Wheel")),
+}
+ADJECTIVES = ("Pro", "Ultra", "Compact", "Wireless", "Smart", "Portable", "Premium", "Slim", "Rugged", "Mini")
+BRANDS = ("Acme", "Nova", "Zenith", "Orbit", "Vertex", "Pulse", "Aero", "Quanta", "Lumen", "Forge")
+SOLD_OUT_SHARE = 0.08
+
+
+def generate_products(count: int, seed: int = 42, start_id: int = 1) -> Iterator[dict]:
+    """Yield `count` products without holding them in memory"""
+    rng = random.Random(seed)
+    names = list(CATEGORIES)
+    weights = [CATEGORIES[name][0] for name in names]
+    random_floats = rng.random
+    # Draw in blocks: one choices() call per field is far cheaper than one per product
+    block = 4096
+    for first in range(0, count, block):
+        size = min(block, count - first)
+        categories = rng.choices(names, weights, k=size)
+        brands = rng.choices(BRANDS, k=size)
+        adjectives = rng.choices(ADJECTIVES, k=size)
+        for offset in range(size):
+            category = categories[offset]
+            _, base_price, sigma, nouns = CATEGORIES[category]
+            product_id = start_id + first + offset
+            yield {
+                "id": product_id,
+                "name": f"{brands[offset]} {adjectives[offset]} {nouns[int(random_floats() * len(nouns))]} {product_id % 1000}",
+                "price": round(max(0.99, exp(rng.gauss(0, sigma)) * base_price), 2),
+                "category": category,
+                "stock": 0 if random_floats() < SOLD_OUT_SHARE else int(rng.expovariate(1 / 80)) + 1,
+            }
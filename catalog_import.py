@@ -0,0 +1,128 @@
+"""
+Streaming bulk import of products from CSV or NDJSON.
+
+Rows are parsed lazily, normalized to the products_db shape and added to the
+catalog in batches, so indexes are updated once per batch and memory is bounded
+by the batch size rather than the file size.
+"""
+import csv
+import io
+import json
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import IO, Iterable, Iterator
+
+from catalog import ProductCatalog
+
+FORMATS = ("csv", "ndjson")
+CSV_FIELDS = ("id", "name", "price", "category", "stock")
+DEFAULT_BATCH_SIZE = 10_000
+MAX_REPORTED_ERRORS = 20
+
+
+@dataclass
+class ImportResult:
+    imported: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+    batches: int = 0
+    errors: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "imported": self.imported,
+            "duplicates": self.duplicates,
+            "invalid": self.invalid,
+            "batches": self.batches,
+            "errors": self.errors,
+        }
+
+
+def detect_format(filename: str | None = None, content_type: str | None = None) -> str:
+    if (content_type and "csv" in content_type) or (filename and filename.endswith(".csv")):
+        return "csv"
+    return "ndjson"
+
+
+def read_rows(stream: IO[str], fmt: str) -> Iterator[dict]:
+    """Yield raw rows from a text stream (NDJSON lines are decoded later, per row)"""
+    if fmt == "csv":
+        yield from csv.DictReader(stream)
+    elif fmt == "ndjson":
+        for line in stream:
+            if line.strip():
+                yield line
+    else:
+        raise ValueError(f"Unknown format {fmt!r}; expected one of {', '.join(FORMATS)}")
+
+
+def normalize(row: dict | str, next_id: int) -> dict:
+    """Coerce a raw row to {'id', 'name', 'price', 'category', 'stock'}"""
+    if isinstance(row, str):
+        row = json.loads(row)
+        if not isinstance(row, dict):
+            raise TypeError(f"expected a JSON object, got {type(row).__name__}")
+    product_id = row.get("id")
+    return {
+        "id": int(product_id) if product_id not in (None, "") else next_id,
+        "name": str(row["name"]).strip(),
+        "price": round(float(row["price"]), 2),
+        "category": str(row["category"]).strip(),
+        "stock": int(row.get("stock") or 0),
+    }
+
+
+def batched(rows: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(rows)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def import_products(catalog: ProductCatalog, rows: Iterable[dict | str],
+                    batch_size: int = DEFAULT_BATCH_SIZE) -> ImportResult:
+    """Normalize rows and add them to the catalog one batch at a time"""
+    result = ImportResult()
+    next_id = catalog.next_id()
+    for batch_index, raw_batch in enumerate(batched(rows, batch_size)):
+        products = []
+        for offset, row in enumerate(raw_batch, start=1):
+            try:
+                product = normalize(row, next_id)
+            except (KeyError, TypeError, ValueError) as error:
+                result.invalid += 1
+                if len(result.errors) < MAX_REPORTED_ERRORS:
+                    result.errors.append(f"row {batch_index * batch_size + offset}: {error!r}")
+                continue
+            next_id = max(next_id, product["id"] + 1)
+            products.append(product)
+        added = catalog.add_many(products)
+        result.imported += added
+        result.duplicates += len(products) - added
+        result.batches += 1
+    return result
+
+
+def import_stream(catalog: ProductCatalog, stream: IO[bytes], fmt: str,
+                  batch_size: int = DEFAULT_BATCH_SIZE) -> ImportResult:
+    """Import from a binary stream such as request.stream or an open file"""
+    if not isinstance(stream, io.BufferedIOBase):
+        stream = io.BufferedReader(stream)
+    text = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+    try:
+        return import_products(catalog, read_rows(text, fmt), batch_size)
+    finally:
+        text.detach()
+
+
+def write_rows(products: Iterable[dict], stream: IO[str], fmt: str) -> int:
+    """Write products as CSV or NDJSON; returns the number of rows"""
+    count = 0
+    if fmt == "csv":
+        writer = csv.DictWriter(stream, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        for count, product in enumerate(products, start=1):
+            writer.writerow(product)
+    else:
+        for count, product in enumerate(products, start=1):
+            stream.write(json.dumps(product, separators=(",", ":")) + "\n")
+    return count
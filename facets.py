@@ -0,0 +1,188 @@
+"""
+Facet counts for the products page, maintained on every catalog write.
+
+For each facet value (category, price bucket, stock status) the index keeps a
+count and a bitset of product ids (a Python int, bit n set for product id n).
+Unfiltered counts are read straight from the counters; with filters active,
+each count is the popcount of the value's bitset AND the other facets' filter
+bitsets. Results are memoized until the next write.
+
+The bitsets are as wide as the largest product id, so a filtered query and
+each facet move on update or delete do O(max_id / 64) word operations. A
+price range is cut from a sorted PriceIndex with bisect; a search substring
+still has to look at every name once per distinct query.
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from typing import Callable, Iterable, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+# (exclusive upper bound, label); None is open-ended
+PRICE_BUCKETS = ((25, "0-25"), (50, "25-50"), (100, "50-100"), (250, "100-250"), (500, "250-500"), (None, "500+"))
+MAX_CACHED_QUERIES = 256
+
+
+def price_bucket(price: float) -> str:
+    for upper, label in PRICE_BUCKETS:
+        if upper is None or price < upper:
+            return label
+
+
+def stock_status(stock: int) -> str:
+    return "in_stock" if stock > 0 else "sold_out"
+
+
+FACETS: dict[str, Callable[[dict], str]] = {
+    "category": lambda product: product["category"],
+    "price": lambda product: price_bucket(product["price"]),
+    "stock": lambda product: stock_status(product["stock"]),
+}
+
+
+def bitset(ids: Iterable[int]) -> int:
+    """Int with bit n set for every id n (built in a bytearray, not by repeated |=)"""
+    if np is not None and isinstance(ids, array):
+        if not ids:
+            return 0
+        values = np.frombuffer(ids, dtype=ids.typecode)
+        mask = np.zeros(int(values.max()) + 1, dtype=bool)
+        mask[values] = True
+        return int.from_bytes(np.packbits(mask, bitorder="little").tobytes(), "little")
+    ids = list(ids)
+    if not ids:
+        return 0
+    buffer = bytearray((max(ids) >> 3) + 1)
+    for product_id in ids:
+        buffer[product_id >> 3] |= 1 << (product_id & 7)
+    return int.from_bytes(buffer, "little")
+
+
+class PriceIndex:
+    """
+    Product ids ordered by price, so a price range is two bisects and a slice.
+
+    Writers publish patched copies (a memcpy plus a memmove per product) and
+    never change an index a reader may hold.
+    """
+
+    def __init__(self, prices: array, ids: array):
+        self.prices = prices
+        self.ids = ids
+
+    @classmethod
+    def build(cls, prices: Sequence[float], ids: Sequence[int]) -> "PriceIndex":
+        if np is not None:
+            order = np.argsort(np.frombuffer(prices, dtype="d"), kind="stable").tolist()
+        else:
+            order = sorted(range(len(prices)), key=prices.__getitem__)
+        return cls(array("d", map(prices.__getitem__, order)), array("q", map(ids.__getitem__, order)))
+
+    def patched(self, removed: Iterable[dict] = (), added: Iterable[dict] = ()) -> "PriceIndex":
+        prices, ids = self.prices[:], self.ids[:]
+        for product in removed:
+            row = bisect_left(prices, product["price"])
+            while ids[row] != product["id"]:
+                row += 1
+            del prices[row], ids[row]
+        for product in added:
+            row = bisect_right(prices, product["price"])
+            prices.insert(row, product["price"])
+            ids.insert(row, product["id"])
+        return PriceIndex(prices, ids)
+
+    def ids_between(self, min_price: float | None = None, max_price: float | None = None) -> array:
+        """Ids with min_price <= price <= max_price, the same bounds as the products filter"""
+        low = 0 if min_price is None else bisect_left(self.prices, min_price)
+        high = len(self.prices) if max_price is None else bisect_right(self.prices, max_price)
+        return self.ids[low:high]
+
+
+class FacetIndex:
+    """
+    Per-facet value -> (count, id bitset), updated by the catalog's writers.
+
+    Writers publish new per-facet dicts instead of mutating them, so readers can
+    iterate a facet without a lock.
+    """
+
+    def __init__(self, products: Iterable[dict] = ()):
+        self.bits: dict[str, dict[str, int]] = {facet: {} for facet in FACETS}
+        self.counts: dict[str, dict[str, int]] = {facet: {} for facet in FACETS}
+        self.cache: dict[tuple, dict] = {}
+        self.add_many(products)
+
+    def _apply(self, facet: str, changes: dict[str, tuple[int, int, int]]) -> None:
+        """changes: value -> (count delta, bits to set, bits to clear)"""
+        bits, counts = dict(self.bits[facet]), dict(self.counts[facet])
+        for value, (delta, added, removed) in changes.items():
+            counts[value] = counts.get(value, 0) + delta
+            bits[value] = (bits.get(value, 0) | added) & ~removed
+            if counts[value] <= 0:
+                del counts[value], bits[value]
+        self.bits[facet], self.counts[facet] = bits, counts
+
+    def add_many(self, products: Iterable[dict]) -> None:
+        self.cache = {}
+        groups = defaultdict(list)
+        for product in products:
+            for facet, value_of in FACETS.items():
+                groups[facet, value_of(product)].append(product["id"])
+        for facet in FACETS:
+            changes = {value: (len(ids), bitset(ids), 0) for (name, value), ids in groups.items() if name == facet}
+            if changes:
+                self._apply(facet, changes)
+
+    def remove(self, product: dict) -> None:
+        self.cache = {}
+        bit = 1 << product["id"]
+        for facet, value_of in FACETS.items():
+            self._apply(facet, {value_of(product): (-1, 0, bit)})
+
+    def update(self, old: dict, new: dict) -> None:
+        # Cached results also depend on name and exact price (search and price
+        # range filters), so every write invalidates them, not only facet moves
+        self.cache = {}
+        bit = 1 << new["id"]
+        for facet, value_of in FACETS.items():
+            before, after = value_of(old), value_of(new)
+            if before != after:
+                self._apply(facet, {before: (-1, 0, bit), after: (1, bit, 0)})
+
+    def query(self, category: str = "all", in_stock: bool | None = None, price_bits: int | None = None,
+              search_bits: int | None = None) -> dict:
+        """
+        {"total": matches, "facets": {facet: {value: count}}}
+
+        Each facet's counts apply every filter except its own, so the category
+        counts say how many products each category would show with the current
+        search, price range and stock filter.
+        """
+        filters = {
+            "category": None if category == "all" else self.bits["category"].get(category, 0),
+            "price": price_bits,
+            "stock": None if in_stock is None else self.bits["stock"].get(stock_status(int(in_stock)), 0),
+        }
+        facets = {}
+        for facet in FACETS:
+            mask = combine(search_bits, *(bits for name, bits in filters.items() if name != facet))
+            if mask is None:
+                facets[facet] = dict(self.counts[facet])
+            else:
+                facets[facet] = {value: (bits & mask).bit_count() for value, bits in self.bits[facet].items()}
+        mask = combine(search_bits, *filters.values())
+        total = sum(self.counts["category"].values()) if mask is None else mask.bit_count()
+        return {"total": total, "facets": facets}
+
+
+def combine(*bitsets: int | None) -> int | None:
+    """AND of the given bitsets, ignoring None (None if all are None)"""
+    mask = None
+    for bits in bitsets:
+        if bits is not None:
+            mask = bits if mask is None else mask & bits
+    return mask
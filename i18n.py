@@ -47,6 +47,7 @@ TRANSLATIONS = {
         "api.profile.unauthorized": "Unauthorized",
         "api.profile.updated": "Profile updated successfully",
         "api.product.not_found": "Product not found",
+        "api.admin.forbidden": "Admin role required",
         "i18n.demo_title": "Locale Formatting Demo",
         "i18n.demo_date": "Date",
         "i18n.demo_number": "Number",
@@ -92,6 +93,7 @@ TRANSLATIONS = {
         "api.profile.unauthorized": "No autorizado",
         "api.profile.updated": "Perfil actualizado con exito",
         "api.product.not_found": "Producto no encontrado",
+        "api.admin.forbidden": "Se requiere el rol de administrador",
         "i18n.demo_title": "Demo de Formato por Idioma",
         "i18n.demo_date": "Fecha",
         "i18n.demo_number": "Numero",
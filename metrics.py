@@ -0,0 +1,363 @@
+"""
+Prometheus-format metrics for the demo store.
+
+Counters and histograms are sharded per thread: the request path only touches
+its thread's dict, with no lock, and a scrape of /metrics sums the shards. With
+METRICS_MULTIPROC_DIR set, every worker process periodically writes its totals
+to that directory and /metrics merges all of them, so any worker can be scraped.
+"""
+import atexit
+import itertools
+import json
+import os
+import secrets
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from pathlib import Path
+
+from flask import Flask, Response, request, session
+from jinja2.utils import LRUCache
+
+MULTIPROC_DIR_ENV = "METRICS_MULTIPROC_DIR"
+FLUSH_INTERVAL_SECONDS = 5.0
+SESSION_WINDOW_SECONDS = 30 * 60
+SESSION_PRUNE_SECONDS = 60
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class _Slot(int):
+    """A thread's shard index; it goes back to the free pool when the thread ends."""
+
+    def __del__(self):
+        # runs when the thread exits and its thread-local is cleared
+        _free_slots.append(int(self))
+
+
+_free_slots = []
+_next_slot = itertools.count()
+_thread = threading.local()
+
+
+def _current_slot() -> int:
+    """
+    This thread's shard index, shared by every metric.
+
+    Leased from the free pool on a thread's first write (list.pop and
+    itertools.count are atomic under the GIL, so no lock is taken), and
+    returned when the thread ends, so a thread per request reuses the indexes
+    of finished threads instead of growing.
+    """
+    try:
+        return _thread.slot
+    except AttributeError:
+        try:
+            slot = _free_slots.pop()
+        except IndexError:
+            slot = next(_next_slot)
+        _thread.slot = _Slot(slot)
+        return slot
+
+
+class ShardedValues:
+    """
+    Values sharded per thread slot; reads sum every shard.
+
+    Recording is a plain dict update on this thread's shard, with no lock.
+    Shards outlive their thread and keep their values: the next thread leased
+    the same slot carries on adding to it. The shard count is bounded by peak
+    thread concurrency.
+    """
+
+    def __init__(self):
+        self._shards = []
+
+    def local(self) -> defaultdict:
+        slot = _current_slot()
+        try:
+            return self._shards[slot]
+        except IndexError:
+            # racing threads may both append; surplus shards just stay empty
+            while len(self._shards) <= slot:
+                self._shards.append(defaultdict(float))
+            return self._shards[slot]
+
+    def totals(self) -> dict:
+        merged = defaultdict(float)
+        for values in list(self._shards):
+            # dict.copy is a single C call, so a concurrent write can't interleave
+            for key, value in values.copy().items():
+                merged[key] += value
+        return merged
+
+
+class Counter:
+    """Monotonic counter; label values are passed positionally."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.values = ShardedValues()
+
+    def inc(self, *labelvalues: str, amount: float = 1.0) -> None:
+        self.values.local()[labelvalues] += amount
+
+    def samples(self, totals: dict):
+        for labelvalues, value in sorted(totals.items()):
+            yield self.name, dict(zip(self.labelnames, labelvalues)), value
+
+    def encode(self, totals: dict) -> list:
+        """JSON-friendly rows for the multiprocess snapshot"""
+        return [[list(labelvalues), value] for labelvalues, value in totals.items()]
+
+    def decode(self, rows: list) -> dict:
+        return {tuple(labelvalues): value for labelvalues, value in rows}
+
+
+class Histogram(Counter):
+    """Cumulative-bucket histogram (buckets in seconds)."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = (), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        values = self.values.local()
+        values[(labelvalues, bisect_left(self.buckets, value))] += 1
+        values[(labelvalues, "sum")] += value
+
+    def samples(self, totals: dict):
+        series = defaultdict(dict)
+        for (labelvalues, slot), value in totals.items():
+            series[labelvalues][slot] = value
+        for labelvalues, slots in sorted(series.items()):
+            labels = dict(zip(self.labelnames, labelvalues))
+            cumulative = 0
+            for index, bound in enumerate(self.buckets + (float("inf"),)):
+                cumulative += slots.get(index, 0)
+                yield f"{self.name}_bucket", {**labels, "le": format_bound(bound)}, cumulative
+            yield f"{self.name}_sum", labels, slots.get("sum", 0.0)
+            yield f"{self.name}_count", labels, cumulative
+
+    def encode(self, totals: dict) -> list:
+        return [[list(labelvalues), slot, value] for (labelvalues, slot), value in totals.items()]
+
+    def decode(self, rows: list) -> dict:
+        return {(tuple(labelvalues), slot): value for labelvalues, slot, value in rows}
+
+
+class SessionTracker:
+    """
+    Logged-in sessions seen within the last window, keyed by a random session id.
+
+    touch() drops expired sessions at most once per prune interval, so the
+    dict stays bounded by the sessions of one window even if /metrics is
+    never scraped.
+    """
+
+    def __init__(self, window_seconds: float = SESSION_WINDOW_SECONDS,
+                 prune_seconds: float = SESSION_PRUNE_SECONDS):
+        self.window_seconds = window_seconds
+        self.prune_seconds = prune_seconds
+        self.last_seen = {}
+        self._next_prune = time.time() + prune_seconds
+
+    def touch(self, sid: str) -> None:
+        now = time.time()
+        self.last_seen[sid] = now
+        if now >= self._next_prune:
+            self._next_prune = now + self.prune_seconds
+            self.prune(now - self.window_seconds)
+
+    def prune(self, cutoff: float) -> None:
+        for sid, seen in list(self.last_seen.items()):
+            if seen < cutoff:
+                self.last_seen.pop(sid, None)
+
+    def active(self, others: dict | None = None) -> dict:
+        cutoff = time.time() - self.window_seconds
+        self.prune(cutoff)
+        merged = dict(self.last_seen)
+        for sid, seen in (others or {}).items():
+            if seen >= cutoff and seen > merged.get(sid, 0):
+                merged[sid] = seen
+        return merged
+
+
+class CountingLRUCache(LRUCache):
+    """Jinja's template cache, counting hits and misses."""
+
+    def __init__(self, capacity: int, lookups: Counter):
+        super().__init__(capacity)
+        self.lookups = lookups
+
+    def get(self, key, default=None):
+        value = super().get(key, default)
+        self.lookups.inc("template", "miss" if value is default else "hit")
+        return value
+
+
+def format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(bound)
+
+
+def escape_label(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{escape_label(value)}"' for key, value in labels.items()) + "}"
+
+
+def format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+class Metrics:
+    """
+    Request, login, order, cache and session metrics plus the /metrics endpoint.
+
+    Login and order outcomes are derived from the endpoint and status code in
+    after_request, so the view functions stay untouched.
+    """
+
+    def __init__(self, app: Flask | None = None):
+        self.requests = Counter(
+            "http_requests_total", "HTTP requests by endpoint, method and status", ("endpoint", "method", "status")
+        )
+        self.latency = Histogram("http_request_duration_seconds", "Request latency by endpoint", ("endpoint",))
+        self.cache_lookups = Counter("cache_lookups_total", "Cache lookups by cache and result", ("cache", "result"))
+        self.logins = Counter("logins_total", "Login attempts by result", ("result",))
+        self.orders = Counter("orders_total", "Orders placed")
+        self.all_metrics = (self.requests, self.latency, self.cache_lookups, self.logins, self.orders)
+        self.sessions = SessionTracker()
+        self.multiproc_dir = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        app.before_request_funcs.setdefault(None, []).insert(0, self._start_timer)
+        app.after_request(self._record_request)
+        if app.jinja_env.cache is not None:
+            app.jinja_env.cache = CountingLRUCache(app.jinja_env.cache.capacity, self.cache_lookups)
+        app.add_url_rule("/metrics", "metrics", self.metrics_view)
+        app.extensions["metrics"] = self
+
+        directory = app.config.setdefault(MULTIPROC_DIR_ENV, os.environ.get(MULTIPROC_DIR_ENV))
+        if directory:
+            self.multiproc_dir = Path(directory)
+            self.multiproc_dir.mkdir(parents=True, exist_ok=True)
+            threading.Thread(target=self._flush_forever, name="metrics-flush", daemon=True).start()
+            atexit.register(self.flush)
+
+    def cache_lookup(self, cache: str, hit: bool) -> None:
+        """Record a lookup in an application cache (shown as cache_lookups_total)"""
+        self.cache_lookups.inc(cache, "hit" if hit else "miss")
+
+    def record_cache_lookups(self, cache: str, hits: int, misses: int) -> None:
+        """Record a batch of lookups at once"""
+        local = self.cache_lookups.values.local()
+        local[(cache, "hit")] += hits
+        local[(cache, "miss")] += misses
+
+    @staticmethod
+    def _start_timer():
+        request.environ["metrics.started"] = time.perf_counter()
+
+    def _record_request(self, response):
+        endpoint = request.endpoint or "unmatched"
+        started = request.environ.get("metrics.started")
+        if started is not None:
+            self.latency.observe(time.perf_counter() - started, endpoint)
+        self.requests.inc(endpoint, request.method, str(response.status_code))
+
+        if endpoint == "login":
+            self.logins.inc("success" if response.status_code == 200 else "failure")
+            if response.status_code == 200:
+                # The login response saves the session anyway; later requests only read the id
+                session["_sid"] = secrets.token_hex(8)
+        elif endpoint == "place_order" and response.status_code == 200:
+            self.orders.inc()
+
+        if "user" in session:
+            # Sessions from before the metrics id existed are counted per user
+            self.sessions.touch(session.get("_sid") or f"user:{session['user']}")
+        return response
+
+    # Multiprocess mode -------------------------------------------------------
+
+    def snapshot(self) -> dict:
+        return {
+            "metrics": {metric.name: metric.encode(metric.values.totals()) for metric in self.all_metrics},
+            "sessions": self.sessions.active(),
+        }
+
+    def flush(self) -> None:
+        path = self.multiproc_dir / f"metrics-{os.getpid()}.json"
+        temporary = path.with_suffix(".tmp")
+        temporary.write_text(json.dumps(self.snapshot()))
+        os.replace(temporary, path)
+
+    def _flush_forever(self):
+        while True:
+            time.sleep(FLUSH_INTERVAL_SECONDS)
+            self.flush()
+
+    def _other_processes(self):
+        own = f"metrics-{os.getpid()}.json"
+        for path in sorted(self.multiproc_dir.glob("metrics-*.json")):
+            if path.name != own:
+                try:
+                    yield json.loads(path.read_text())
+                except (OSError, ValueError):
+                    continue
+
+    # Exposition --------------------------------------------------------------
+
+    def collect(self) -> tuple[dict, int]:
+        totals = {metric.name: metric.values.totals() for metric in self.all_metrics}
+        other_sessions = {}
+        if self.multiproc_dir:
+            for snapshot in self._other_processes():
+                for metric in self.all_metrics:
+                    for key, value in metric.decode(snapshot["metrics"].get(metric.name, [])).items():
+                        totals[metric.name][key] += value
+                for sid, seen in snapshot["sessions"].items():
+                    other_sessions[sid] = max(seen, other_sessions.get(sid, 0))
+        return totals, len(self.sessions.active(other_sessions))
+
+    def render(self) -> str:
+        totals, active_sessions = self.collect()
+        lines = []
+        for metric in self.all_metrics:
+            lines += [f"# HELP {metric.name} {metric.documentation}", f"# TYPE {metric.name} {metric.kind}"]
+            lines += [
+                f"{name}{format_labels(labels)} {format_value(value)}"
+                for name, labels, value in metric.samples(totals[metric.name])
+            ]
+
+        cache_totals = defaultdict(lambda: {"hit": 0.0, "miss": 0.0})
+        for (cache, result), value in totals[self.cache_lookups.name].items():
+            cache_totals[cache][result] += value
+        lines += ["# HELP cache_hit_ratio Hits / lookups per cache", "# TYPE cache_hit_ratio gauge"]
+        for cache, counts in sorted(cache_totals.items()):
+            lookups = counts["hit"] + counts["miss"]
+            lines.append(f'cache_hit_ratio{format_labels({"cache": cache})} {format_value(counts["hit"] / lookups if lookups else 0)}')
+
+        lines += [
+            f"# HELP active_sessions Logged-in sessions seen in the last {SESSION_WINDOW_SECONDS // 60} minutes",
+            "# TYPE active_sessions gauge",
+            f"active_sessions {active_sessions}",
+        ]
+        return "\n".join(lines) + "\n"
+
+    def metrics_view(self):
+        return Response(self.render(), mimetype="text/plain; version=0.0.4")
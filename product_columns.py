@@ -0,0 +1,238 @@
+"""
+Columnar product storage: the catalog's only copy of its products.
+
+Ids, prices, stock, category codes, name codes and write versions live in typed
+`array` columns; categories and names are interned in lookup tables. That is
+about 130 bytes per product, against about 320 for a dict per product. Dicts are
+built only when a row is read (ProductRows), e.g. for a template or for a JSON
+fragment that is not cached yet.
+
+Filters are evaluated as whole-column boolean masks with NumPy when it is
+installed, and otherwise with C-level map/compress over the arrays, so no
+per-product Python code runs either way. Name search only runs on the rows the
+column filters kept.
+"""
+import copy
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Sequence
+from itertools import compress, repeat
+from operator import contains, eq, ge, le, lt
+from typing import Iterable, Iterator
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+
+COLUMNS = ("ids", "prices", "stock", "category_codes", "name_codes", "versions")
+FIELDS = ("id", "name", "price", "category", "stock")
+
+
+class ProductColumns:
+    """
+    Products in insertion order, one row each.
+
+    Rows are appended in place (ids last, so readers bounded by len() only see
+    complete rows); any other change is made on a copy that the owner publishes.
+    """
+
+    def __init__(self, products: Iterable[dict] = (), version: int = 0):
+        self.ids = array("q")
+        self.prices = array("d")
+        self.stock = array("q")
+        self.category_codes = array("H")
+        self.name_codes = array("I")
+        self.versions = array("Q")
+        self.categories: list[str] = []
+        self.names: list[str] = []
+        self._category_index: dict[str, int] = {}
+        self._name_index: dict[str, int] = {}
+        self.ids_sorted = True
+        self.max_id = 0  # never lowered by delete_row, so any larger id is certainly absent
+        self._numpy = None
+        self.extend(products, version)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @staticmethod
+    def _intern(value: str, table: list[str], index: dict[str, int]) -> int:
+        code = index.get(value)
+        if code is None:
+            code = index[value] = len(table)
+            table.append(sys.intern(value))
+        return code
+
+    def extend(self, products: Iterable[dict], version: int = 0) -> None:
+        """Append rows written at `version`; ids are written last so readers never see half a row"""
+        for product in products:
+            if self.ids and product["id"] <= self.ids[-1]:
+                self.ids_sorted = False
+            self.max_id = max(self.max_id, product["id"])
+            self.stock.append(product["stock"])
+            self.category_codes.append(self._intern(product["category"], self.categories, self._category_index))
+            self.name_codes.append(self._intern(product["name"], self.names, self._name_index))
+            self.prices.append(product["price"])
+            self.versions.append(version)
+            self.ids.append(product["id"])
+
+    def row(self, row: int) -> dict:
+        """A new dict for one row, in the products_db shape"""
+        return {
+            "id": self.ids[row],
+            "name": self.names[self.name_codes[row]],
+            "price": self.prices[row],
+            "category": self.categories[self.category_codes[row]],
+            "stock": self.stock[row],
+        }
+
+    def row_of(self, product_id: int, rows: int | None = None) -> int | None:
+        """
+        Row holding product_id among the first `rows` rows, or None.
+
+        Ids are appended in increasing order unless an import brings its own,
+        so this is normally a bisect; otherwise array.index scans in C.
+        """
+        ids = self.ids
+        rows = len(ids) if rows is None else rows
+        if self.ids_sorted:
+            row = bisect_left(ids, product_id, 0, rows)
+            return row if row < rows and ids[row] == product_id else None
+        try:
+            return ids.index(product_id, 0, rows)
+        except ValueError:
+            return None
+
+    def head(self, rows: int) -> "ProductColumns":
+        """Copy of the first `rows` rows"""
+        clone = self.copy()
+        for name in COLUMNS:
+            del getattr(clone, name)[rows:]
+        return clone
+
+    def copy(self) -> "ProductColumns":
+        """
+        Columns a writer can patch while readers keep using this object.
+
+        Copying an array is a memcpy, far cheaper than rebuilding from dicts.
+        The interned tables are shared: they are only ever appended to.
+        """
+        clone = copy.copy(self)
+        for name in COLUMNS:
+            setattr(clone, name, getattr(self, name)[:])
+        clone._numpy = None
+        return clone
+
+    def set_row(self, row: int, product: dict, version: int) -> None:
+        """Overwrite a row in place (on a copy readers cannot see yet); the id must not change"""
+        self.stock[row] = product["stock"]
+        self.category_codes[row] = self._intern(product["category"], self.categories, self._category_index)
+        self.name_codes[row] = self._intern(product["name"], self.names, self._name_index)
+        self.prices[row] = product["price"]
+        self.versions[row] = version
+
+    def delete_row(self, row: int) -> None:
+        for name in COLUMNS:
+            del getattr(self, name)[row]
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the columns and lookup tables"""
+        total = sum(sys.getsizeof(getattr(self, name)) for name in COLUMNS)
+        for table, index in ((self.categories, self._category_index), (self.names, self._name_index)):
+            total += sys.getsizeof(table) + sys.getsizeof(index) + sum(map(sys.getsizeof, table))
+        return total
+
+    def select(self, rows: int, category: str = "all", search: str = "", min_price: float | None = None,
+               max_price: float | None = None, in_stock: bool | None = None) -> Iterable[int]:
+        """Indexes of the first `rows` rows that match every given filter, in catalog order"""
+        category_code = None
+        if category != "all":
+            category_code = self._category_index.get(category)
+            if category_code is None:
+                return []
+        if (category_code, min_price, max_price, in_stock) == (None, None, None, None):
+            matches = range(rows)
+        elif np is not None:
+            matches = self._select_numpy(rows, category_code, min_price, max_price, in_stock)
+        else:
+            matches = self._select_arrays(rows, category_code, min_price, max_price, in_stock)
+        if not search:
+            return matches
+        # Substring search cannot be a column mask, so it only looks at the rows that survived the others
+        matches = list(matches)
+        names = map(self.names.__getitem__, map(self.name_codes.__getitem__, matches))
+        return compress(matches, map(contains, map(str.lower, names), repeat(search.lower())))
+
+    def _numpy_columns(self, rows: int) -> dict:
+        """NumPy copies of the first `rows` rows, reused until the row count changes"""
+        cached = self._numpy
+        if cached is None or cached[0] != rows:
+            columns = {
+                name: np.frombuffer(getattr(self, name)[:rows], dtype=getattr(self, name).typecode)
+                for name in ("prices", "stock", "category_codes")
+            }
+            cached = self._numpy = (rows, columns)
+        return cached[1]
+
+    def _select_numpy(self, rows, category_code, min_price, max_price, in_stock) -> list[int]:
+        columns = self._numpy_columns(rows)
+        mask = np.ones(rows, dtype=bool)
+        if category_code is not None:
+            mask &= columns["category_codes"] == category_code
+        if min_price is not None:
+            mask &= columns["prices"] >= min_price
+        if max_price is not None:
+            mask &= columns["prices"] <= max_price
+        if in_stock is not None:
+            # Same predicate as the array path: in stock means stock > 0, anything else is sold out
+            mask &= (columns["stock"] > 0) if in_stock else (columns["stock"] <= 0)
+        return np.flatnonzero(mask).tolist()
+
+    def _select_arrays(self, rows, category_code, min_price, max_price, in_stock) -> Iterable[int]:
+        """Each test runs over the whole first column, then only over the rows that are still left"""
+        tests = []
+        if category_code is not None:
+            tests.append((self.category_codes, eq, category_code))
+        if min_price is not None:
+            tests.append((self.prices, le, min_price))
+        if max_price is not None:
+            tests.append((self.prices, ge, max_price))
+        if in_stock is not None:
+            tests.append((self.stock, lt if in_stock else ge, 0))  # 0 < stock / 0 >= stock
+        matches = range(rows)
+        for column, test, value in tests:
+            values = column if type(matches) is range else map(column.__getitem__, matches)
+            matches = list(compress(matches, map(test, repeat(value), values)))
+        return matches
+
+
+class ProductRows(Sequence):
+    """
+    Selected rows of one ProductColumns snapshot.
+
+    Indexing or iterating builds a fresh dict per row; ids() and the catalog's
+    JSON encoder read the columns directly and build no dicts.
+    """
+
+    __slots__ = ("columns", "rows")
+
+    def __init__(self, columns: ProductColumns, rows: Sequence[int]):
+        self.columns = columns
+        self.rows = rows
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ProductRows(self.columns, self.rows[index])
+        return self.columns.row(self.rows[index])
+
+    def __iter__(self) -> Iterator[dict]:
+        return map(self.columns.row, self.rows)
+
+    def ids(self) -> Iterator[int]:
+        return map(self.columns.ids.__getitem__, self.rows)
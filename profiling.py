@@ -0,0 +1,197 @@
+"""
+On-demand profiling for a running server.
+
+A statistical stack sampler walks sys._current_frames() for every thread at a
+fixed interval and produces collapsed stacks ("a;b;c 42"), ready for
+flamegraph.pl or speedscope. It is started by an admin-only endpoint, or by
+SIGUSR1 when PROFILE_SIGNAL=1. Admins can also send "X-Profile: 1" to run one
+request under cProfile.
+"""
+import cProfile
+import io
+import os
+import pstats
+import secrets
+import signal
+import sys
+import threading
+import time
+from collections import Counter, deque
+from pathlib import Path
+from typing import Callable
+
+from flask import Flask, Response, g, jsonify, request
+
+PROFILE_HEADER = "X-Profile"
+MAX_SAMPLE_SECONDS = 60.0
+# The endpoint samples on the request's own worker thread, so it gets a shorter cap
+MAX_REQUEST_SAMPLE_SECONDS = 10.0
+MIN_INTERVAL_SECONDS = 0.001
+SIGNAL_SECONDS = 10.0
+OUTPUT_DIR = Path("perf-results") / "profiles"
+
+
+def frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+
+class StackSampler:
+    """Counts collapsed stacks of all other threads every `interval` seconds."""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = max(interval, MIN_INTERVAL_SECONDS)
+        self.stacks = Counter()
+        self.samples = 0
+
+    def sample_once(self, skip: set[int]) -> None:
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident in skip:
+                continue
+            labels = []
+            while frame is not None:
+                labels.append(frame_label(frame))
+                frame = frame.f_back
+            labels.append(names.get(ident, f"thread-{ident}"))
+            self.stacks[";".join(reversed(labels))] += 1
+        self.samples += 1
+
+    def run(self, seconds: float, skip: set[int] = frozenset()) -> "StackSampler":
+        """Sample until `seconds` have passed; the calling thread is never sampled"""
+        skip = set(skip) | {threading.get_ident()}
+        deadline = time.perf_counter() + min(seconds, MAX_SAMPLE_SECONDS)
+        next_sample = time.perf_counter()
+        while next_sample < deadline:
+            self.sample_once(skip)
+            next_sample += self.interval
+            time.sleep(max(0.0, next_sample - time.perf_counter()))
+        return self
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+class Profiler:
+    """
+    Registers the profiling endpoints on an app.
+
+    is_admin decides who may profile; forbidden builds the response for everyone
+    else. Only one sampler runs at a time.
+    """
+
+    def __init__(self, app: Flask | None = None, is_admin: Callable[[], bool] = lambda: False,
+                 forbidden: Callable[[], object] = lambda: ("Forbidden", 403), history: int = 20):
+        self.is_admin = is_admin
+        self.forbidden = forbidden
+        self.request_profiles = deque(maxlen=history)
+        self._sampling = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        self.output_dir = Path(app.config.setdefault("PROFILE_OUTPUT_DIR", OUTPUT_DIR))
+        self.signal_seconds = app.config.setdefault("PROFILE_SIGNAL_SECONDS", SIGNAL_SECONDS)
+        app.before_request_funcs.setdefault(None, []).insert(0, self._start_request_profile)
+        app.after_request(self._finish_request_profile)
+        app.teardown_request(self._discard_request_profile)
+        app.add_url_rule("/admin/profile/stacks", "profile_stacks", self.stacks_view)
+        app.add_url_rule("/admin/profile/requests", "profile_requests", self.requests_view)
+        app.add_url_rule("/admin/profile/requests/<profile_id>", "profile_request", self.request_view)
+        app.extensions["profiler"] = self
+        # Opt-in: a handler installed by every app built on the main thread would
+        # replace the host's own SIGUSR1 handling (pytest imports app.py, for one)
+        if app.config.setdefault("PROFILE_SIGNAL", os.environ.get("PROFILE_SIGNAL") == "1"):
+            self.install_signal_handler()
+
+    # Stack sampler -----------------------------------------------------------
+
+    def sample(self, seconds: float, interval: float) -> StackSampler | None:
+        """Run the sampler in the calling thread; None if one is already running"""
+        if not self._sampling.acquire(blocking=False):
+            return None
+        try:
+            return StackSampler(interval).run(seconds)
+        finally:
+            self._sampling.release()
+
+    def install_signal_handler(self) -> None:
+        """kill -USR1 <pid> samples for PROFILE_SIGNAL_SECONDS and writes a file to PROFILE_OUTPUT_DIR"""
+        if hasattr(signal, "SIGUSR1") and threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGUSR1, self._on_signal)
+
+    def _on_signal(self, signum, frame):
+        # Signal handlers must return quickly: sample from a helper thread
+        threading.Thread(target=self._sample_to_file, name="stack-sampler", daemon=True).start()
+
+    def _sample_to_file(self) -> None:
+        sampler = self.sample(self.signal_seconds, 0.005)
+        if sampler is None:
+            return
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        path = self.output_dir / f"stacks-{os.getpid()}-{int(time.time())}.txt"
+        path.write_text(sampler.collapsed())
+
+    def stacks_view(self):
+        if not self.is_admin():
+            return self.forbidden()
+        seconds = min(request.args.get("seconds", 5.0, type=float), MAX_REQUEST_SAMPLE_SECONDS)
+        interval = request.args.get("interval_ms", 5.0, type=float) / 1000
+        sampler = self.sample(seconds, interval)
+        if sampler is None:
+            return jsonify({"success": False, "message": "A profile is already running"}), 409
+        response = Response(sampler.collapsed(), mimetype="text/plain")
+        response.headers["X-Profile-Samples"] = str(sampler.samples)
+        return response
+
+    # Per-request cProfile ----------------------------------------------------
+
+    def _start_request_profile(self):
+        if request.headers.get(PROFILE_HEADER) == "1" and self.is_admin():
+            g._request_profile = cProfile.Profile()
+            g._request_profile.enable()
+
+    def _finish_request_profile(self, response):
+        profile = g.pop("_request_profile", None)
+        if profile is None:
+            return response
+        profile.disable()
+        profile_id = secrets.token_hex(4)
+        self.request_profiles.append({
+            "id": profile_id,
+            "method": request.method,
+            "path": request.full_path.rstrip("?"),
+            "status": response.status_code,
+            "total_ms": round(pstats.Stats(profile).total_tt * 1000, 3),
+            "profile": profile,
+        })
+        response.headers["X-Profile-Id"] = profile_id
+        return response
+
+    @staticmethod
+    def _discard_request_profile(error=None):
+        profile = g.pop("_request_profile", None)
+        if profile is not None:
+            profile.disable()
+
+    def requests_view(self):
+        if not self.is_admin():
+            return self.forbidden()
+        return jsonify([
+            {key: entry[key] for key in ("id", "method", "path", "status", "total_ms")}
+            for entry in reversed(list(self.request_profiles))
+        ])
+
+    def request_view(self, profile_id: str):
+        if not self.is_admin():
+            return self.forbidden()
+        entry = next((entry for entry in list(self.request_profiles) if entry["id"] == profile_id), None)
+        if entry is None:
+            return jsonify({"success": False, "message": "Unknown profile"}), 404
+        sort = request.args.get("sort", "cumulative")
+        if sort not in pstats.Stats.sort_arg_dict_default:
+            sort = "cumulative"
+        output = io.StringIO()
+        stats = pstats.Stats(entry["profile"], stream=output)
+        stats.sort_stats(sort).print_stats(request.args.get("limit", 40, type=int))
+        return Response(output.getvalue(), mimetype="text/plain")
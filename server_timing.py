@@ -0,0 +1,276 @@
+"""
+Per-request phase timing exposed as Server-Timing headers.
+
+Sampled requests record how long locale setup (before_request hooks), session
+load/save, the view, template rendering and JSON encoding took, using
+perf_counter_ns. The phases are sent back in a Server-Timing header, which the
+browser exposes as PerformanceNavigationTiming.serverTiming, and are added to
+in-process histograms. Unsampled requests skip every clock read.
+"""
+import os
+import random
+import threading
+from contextvars import ContextVar
+from time import perf_counter_ns
+
+from flask import Flask, request, template_rendered, before_render_template
+from flask.json.provider import JSONProvider
+from flask.sessions import SessionInterface
+
+SAMPLE_RATE_ENV = "SERVER_TIMING_SAMPLE_RATE"
+FORCE_HEADER = "X-Server-Timing"
+DEFAULT_SAMPLE_RATE = 0.01
+PHASES = ("session-open", "locale", "view", "template", "json", "session-save", "total")
+BUCKETS_MS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, float("inf"))
+
+
+class PhaseHistogram:
+    """Cumulative-bucket histogram of phase durations in milliseconds."""
+
+    def __init__(self, buckets: tuple[float, ...] = BUCKETS_MS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum_ms = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value_ms: float) -> None:
+        index = next(i for i, bound in enumerate(self.buckets) if value_ms <= bound)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.sum_ms += value_ms
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {"buckets": list(zip(self.buckets, self.counts)), "count": self.count, "sum_ms": self.sum_ms}
+
+
+class RequestTimer:
+    """Phase durations (ns) for one sampled request."""
+
+    __slots__ = ("started", "marks", "durations", "in_session")
+
+    def __init__(self):
+        self.started = perf_counter_ns()
+        self.marks = {}
+        self.durations = dict.fromkeys(PHASES, 0)
+        # The session serializer goes through app.json; keep that out of the "json" phase
+        self.in_session = False
+
+    def add(self, phase: str, started_ns: int) -> None:
+        self.durations[phase] += perf_counter_ns() - started_ns
+
+    def header_value(self) -> str:
+        return ", ".join(
+            f"{phase};dur={duration / 1_000_000:.3f}" for phase, duration in self.durations.items() if duration
+        )
+
+
+# The current request's timer. A ContextVar read is a single C call, where g
+# goes through two LocalProxy lookups; hooks ask for it several times a request
+_timer: ContextVar[RequestTimer | None] = ContextVar("server_timing", default=None)
+
+
+def current_timer() -> RequestTimer | None:
+    return _timer.get()
+
+
+def measure(phase: str, func, *args, **kwargs):
+    """
+    Call func, adding its duration to `phase` when the request is sampled
+    A plain call when ServerTiming is not installed on the app
+    """
+    timer = current_timer()
+    if timer is None:
+        return func(*args, **kwargs)
+    started = perf_counter_ns()
+    result = func(*args, **kwargs)
+    timer.add(phase, started)
+    return result
+
+
+def json_timer() -> RequestTimer | None:
+    timer = current_timer()
+    return None if timer is None or timer.in_session else timer
+
+
+class TimedSessionInterface(SessionInterface):
+    """Wraps the app's session interface to time load/save and finish the header."""
+
+    def __init__(self, inner: SessionInterface, timing: "ServerTiming"):
+        self.inner = inner
+        self.timing = timing
+
+    def __getattr__(self, name):
+        return getattr(self.inner, name)
+
+    def open_session(self, app, request):
+        # Runs first in every request, so the sampling decision is made here
+        timer = self.timing.start_request()
+        if timer is None:
+            return self.inner.open_session(app, request)
+        started = perf_counter_ns()
+        timer.in_session = True
+        session = self.inner.open_session(app, request)
+        timer.in_session = False
+        timer.add("session-open", started)
+        return session
+
+    def save_session(self, app, session, response):
+        timer = current_timer()
+        if timer is None:
+            return self.inner.save_session(app, session, response)
+        started = perf_counter_ns()
+        timer.in_session = True
+        self.inner.save_session(app, session, response)
+        timer.in_session = False
+        timer.add("session-save", started)
+        self.timing.finish_request(timer, response)
+
+
+class TimedJSONProvider(JSONProvider):
+    """Delegates to the app's JSON provider, timing encode/decode of sampled requests."""
+
+    def __init__(self, app: Flask, inner: JSONProvider):
+        super().__init__(app)
+        self.inner = inner
+
+    def __getattr__(self, name):
+        return getattr(self.inner, name)
+
+    def dumps(self, obj, **kwargs) -> str:
+        timer = json_timer()
+        if timer is None:
+            return self.inner.dumps(obj, **kwargs)
+        started = perf_counter_ns()
+        encoded = self.inner.dumps(obj, **kwargs)
+        timer.add("json", started)
+        return encoded
+
+    def loads(self, s, **kwargs):
+        timer = json_timer()
+        if timer is None:
+            return self.inner.loads(s, **kwargs)
+        started = perf_counter_ns()
+        decoded = self.inner.loads(s, **kwargs)
+        timer.add("json", started)
+        return decoded
+
+    def response(self, *args, **kwargs):
+        # The inner provider encodes with its own dumps(), so time the whole call
+        timer = json_timer()
+        if timer is None:
+            return self.inner.response(*args, **kwargs)
+        started = perf_counter_ns()
+        response = self.inner.response(*args, **kwargs)
+        timer.add("json", started)
+        return response
+
+
+class ServerTiming:
+    """
+    Installs the timing hooks on an app.
+
+    Call init_app after the app's own before_request hooks are registered so the
+    "locale" phase brackets all of them. Sampling comes from the
+    SERVER_TIMING_SAMPLE_RATE config/env value (0.0-1.0, default 0.01); a request
+    carrying "X-Server-Timing: 1" is always sampled.
+    """
+
+    def __init__(self, app: Flask | None = None):
+        self.histograms = {}
+        self._histograms_lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        app.config.setdefault(SAMPLE_RATE_ENV, float(os.environ.get(SAMPLE_RATE_ENV, DEFAULT_SAMPLE_RATE)))
+        self.sample_rate = app.config[SAMPLE_RATE_ENV]
+        app.session_interface = TimedSessionInterface(app.session_interface, self)
+        app.json = TimedJSONProvider(app, app.json)
+
+        before = app.before_request_funcs.setdefault(None, [])
+        before.insert(0, self._before_request_started)
+        before.append(self._before_request_finished)
+        # after_request hooks run in reverse registration order, so extensions
+        # added later (metrics, profiler) would run before a hook registered
+        # here and land in "view". End the phase when the view returns instead
+        app.dispatch_request = self._timed_dispatch(app.dispatch_request)
+        before_render_template.connect(self._template_started, app)
+        template_rendered.connect(self._template_finished, app)
+        app.extensions["server_timing"] = self
+
+    def start_request(self) -> RequestTimer | None:
+        sampled = request.headers.get(FORCE_HEADER) == "1" or (
+            self.sample_rate > 0 and (self.sample_rate >= 1 or random.random() < self.sample_rate)
+        )
+        timer = RequestTimer() if sampled else None
+        _timer.set(timer)
+        return timer
+
+    measure = staticmethod(measure)
+
+    def finish_request(self, timer: RequestTimer, response) -> None:
+        # Later code on this thread (outside any request) must not add to this timer
+        _timer.set(None)
+        timer.durations["total"] = perf_counter_ns() - timer.started
+        response.headers["Server-Timing"] = timer.header_value()
+        endpoint = request.endpoint or "unmatched"
+        for phase, duration in timer.durations.items():
+            if duration:
+                self.histogram(endpoint, phase).observe(duration / 1_000_000)
+
+    def histogram(self, endpoint: str, phase: str) -> PhaseHistogram:
+        key = (endpoint, phase)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            with self._histograms_lock:
+                histogram = self.histograms.setdefault(key, PhaseHistogram())
+        return histogram
+
+    def snapshot(self) -> dict:
+        """{endpoint: {phase: histogram}} for every sampled request so far"""
+        result = {}
+        for (endpoint, phase), histogram in list(self.histograms.items()):
+            result.setdefault(endpoint, {})[phase] = histogram.snapshot()
+        return result
+
+    @staticmethod
+    def _before_request_started():
+        timer = current_timer()
+        if timer is not None:
+            timer.marks["before"] = perf_counter_ns()
+
+    @staticmethod
+    def _before_request_finished():
+        timer = current_timer()
+        if timer is not None:
+            timer.add("locale", timer.marks["before"])
+            timer.marks["view"] = perf_counter_ns()
+
+    @staticmethod
+    def _timed_dispatch(dispatch_request):
+        def dispatch():
+            try:
+                return dispatch_request()
+            finally:
+                timer = current_timer()
+                if timer is not None and "view" in timer.marks:
+                    timer.add("view", timer.marks["view"])
+                    # Template and JSON time happen inside the view; report the remainder as "view"
+                    timer.durations["view"] -= timer.durations["template"] + timer.durations["json"]
+
+        return dispatch
+
+    @staticmethod
+    def _template_started(sender, template, context, **extra):
+        timer = current_timer()
+        if timer is not None:
+            timer.marks["template"] = perf_counter_ns()
+
+    @staticmethod
+    def _template_finished(sender, template, context, **extra):
+        timer = current_timer()
+        if timer is not None and "template" in timer.marks:
+            timer.add("template", timer.marks.pop("template"))
@@ -0,0 +1,69 @@
+"""
+Per-app storage (product catalog and users) with cheap checkpoints.
+
+A checkpoint copies no products: ProductCatalog publishes patched columns on
+update or delete and only ever appends to the current ones, and user profiles
+are never mutated in place, so a (columns, length) pair plus a shallow copy of
+the user table pins the whole state. Restoring copies that prefix and rebuilds
+the small indexes from it, which takes microseconds for a test-sized store.
+
+Set STATE_ENDPOINTS=1 (or app.testing) to expose, for test suites only:
+    POST /api/test/state/checkpoint?name=<name>
+    POST /api/test/state/restore?name=<name>     ("pristine" is taken at startup)
+"""
+import os
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, Mapping
+
+from flask import Flask, jsonify, request
+
+from catalog import ProductCatalog, encode_product
+from user_registry import UserRegistry
+
+PRISTINE = "pristine"
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    catalog: tuple
+    users: dict
+
+
+class Store:
+    def __init__(self, app: Flask | None = None, products: Iterable[dict] = (),
+                 users: Mapping[str, Mapping] | None = None, encode: Callable[[dict], bytes] = encode_product):
+        self.catalog = ProductCatalog(products, encode=encode)
+        self.users = UserRegistry(users)
+        self.checkpoints: dict[str, Checkpoint] = {}
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        app.extensions["store"] = self
+        enabled = app.config.setdefault("STATE_ENDPOINTS", os.environ.get("STATE_ENDPOINTS") == "1")
+        if enabled or app.testing:
+            app.add_url_rule("/api/test/state/checkpoint", "state_checkpoint", self.checkpoint_view, methods=["POST"])
+            app.add_url_rule("/api/test/state/restore", "state_restore", self.restore_view, methods=["POST"])
+
+    def checkpoint(self) -> Checkpoint:
+        return Checkpoint(self.catalog.checkpoint(), self.users.checkpoint())
+
+    def restore(self, checkpoint: Checkpoint) -> None:
+        self.catalog.restore(checkpoint.catalog)
+        self.users.restore(checkpoint.users)
+
+    def checkpoint_view(self):
+        name = request.args.get("name", PRISTINE)
+        self.checkpoints[name] = self.checkpoint()
+        return jsonify({"success": True, "name": name})
+
+    def restore_view(self):
+        name = request.args.get("name", PRISTINE)
+        checkpoint = self.checkpoints.get(name)
+        if checkpoint is None:
+            return jsonify({"success": False, "message": f"No checkpoint named {name!r}"}), 404
+        started = time.perf_counter()
+        self.restore(checkpoint)
+        elapsed_us = (time.perf_counter() - started) * 1_000_000
+        return jsonify({"success": True, "name": name, "restore_us": round(elapsed_us, 1)})
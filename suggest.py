@@ -0,0 +1,166 @@
+"""
+Search-box autocomplete over product names.
+
+SuggestIndex is a radix tree (compressed prefix trie) keyed by the lowercase
+name and by every suffix that starts a word, so "mou" completes "Wireless
+Mouse". Each node caches the ids of its top-k most popular products, so a
+lookup walks at most len(prefix) characters and returns the cached list.
+Popularity only grows (product views), which lets a bump re-rank just the
+nodes on the product's own paths.
+"""
+import heapq
+from typing import Iterable
+
+TOP_K = 10
+
+
+class Node:
+    __slots__ = ("label", "children", "products", "top")
+
+    def __init__(self, label: str = "", children: dict | None = None, products: set | None = None,
+                 top: list | None = None):
+        self.label = label
+        self.children: dict[str, Node] = {} if children is None else children
+        self.products: set[int] = set() if products is None else products
+        self.top: list[int] = [] if top is None else top
+
+
+def name_keys(name: str) -> set[str]:
+    """The lowercase name and each of its suffixes that starts at a word"""
+    lowered = name.lower()
+    return {lowered[start:] for start in range(len(lowered))
+            if lowered[start] != " " and (start == 0 or lowered[start - 1] == " ")}
+
+
+class SuggestIndex:
+    """
+    Radix tree of product names with per-node cached top-k ids.
+
+    Writers must be serialized by the caller (ProductCatalog holds its lock).
+    Readers are lock-free: writers publish new nodes and new top lists rather
+    than mutating anything a reader may be walking.
+    """
+
+    def __init__(self, products: Iterable[dict] = (), popularity: dict[int, int] | None = None, k: int = TOP_K):
+        self.k = k
+        self.root = Node()
+        self.names: dict[int, str] = {}
+        self.popularity = {} if popularity is None else popularity
+        # Bulk build: insert every key first, then fill the top lists bottom-up once
+        for product in products:
+            self._insert(product)
+        self._recompute_all()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def rank(self, product_id: int) -> tuple:
+        return -self.popularity.get(product_id, 0), self.names[product_id], product_id
+
+    def _offer(self, node: Node, product_id: int) -> None:
+        """Re-rank product_id into node.top (its score only ever increases)"""
+        candidates = node.top if product_id in node.top else node.top + [product_id]
+        node.top = sorted(candidates, key=self.rank)[:self.k]
+
+    def _recompute(self, node: Node) -> None:
+        candidates = set(node.products)
+        for child in list(node.children.values()):
+            candidates.update(child.top)
+        node.top = heapq.nsmallest(self.k, candidates, key=self.rank)
+
+    def _recompute_all(self) -> None:
+        """Post-order pass so every node merges its children's finished lists"""
+        stack = [(self.root, False)]
+        while stack:
+            node, children_done = stack.pop()
+            if children_done:
+                self._recompute(node)
+            else:
+                stack.append((node, True))
+                stack.extend((child, False) for child in node.children.values())
+
+    def _path(self, key: str, create: bool) -> list[Node]:
+        """Nodes from the root to the node for key (splitting an edge if create)"""
+        node, path, rest = self.root, [self.root], key
+        while rest:
+            child = node.children.get(rest[0])
+            if child is None:
+                if not create:
+                    return []
+                child = Node(rest)
+                node.children[rest[0]] = child
+                path.append(child)
+                return path
+            label = child.label
+            if rest.startswith(label):
+                common = len(label)
+            else:
+                common = 1
+                while common < len(rest) and label[common] == rest[common]:
+                    common += 1
+            if common < len(label):
+                if not create:
+                    return []
+                # Split the edge: new middle node, and a relabelled copy of the old child beneath it
+                tail = Node(label[common:], child.children, child.products, child.top)
+                middle = Node(label[:common], {label[common]: tail}, top=list(child.top))
+                node.children[rest[0]] = middle
+                child = middle
+            node, rest = child, rest[common:]
+            path.append(node)
+        return path
+
+    def _insert(self, product: dict) -> list[list[Node]]:
+        """Add the product's keys without touching top lists; returns the paths"""
+        product_id = product["id"]
+        self.names[product_id] = product["name"]
+        paths = []
+        for key in name_keys(product["name"]):
+            path = self._path(key, create=True)
+            path[-1].products.add(product_id)
+            paths.append(path)
+        return paths
+
+    def add(self, product: dict) -> None:
+        for path in self._insert(product):
+            for node in path:
+                self._offer(node, product["id"])
+
+    def remove(self, product: dict) -> None:
+        product_id = product["id"]
+        for key in name_keys(product["name"]):
+            path = self._path(key, create=False)
+            if not path:
+                continue
+            path[-1].products.discard(product_id)
+            for node in reversed(path):
+                if product_id in node.top:
+                    self._recompute(node)
+        self.names.pop(product_id, None)
+
+    def bump(self, product_id: int, amount: int = 1) -> None:
+        """Count a view (or another popularity signal) and re-rank the product's paths"""
+        self.popularity[product_id] = self.popularity.get(product_id, 0) + amount
+        name = self.names.get(product_id)
+        if name is None:
+            return
+        for key in name_keys(name):
+            for node in self._path(key, create=False):
+                self._offer(node, product_id)
+
+    def suggest(self, prefix: str, limit: int = TOP_K) -> list[int]:
+        """Ids of the most popular products with a name key starting with prefix"""
+        node, rest = self.root, prefix.lower()
+        if not rest:
+            return []
+        while rest:
+            child = node.children.get(rest[0])
+            if child is None:
+                return []
+            if rest.startswith(child.label):
+                node, rest = child, rest[len(child.label):]
+            elif child.label.startswith(rest):
+                node, rest = child, ""
+            else:
+                return []
+        return node.top[:limit]
@@ -0,0 +1,95 @@
+"""
+API Client Layer - Typed business API over the JSON endpoints
+Mirrors the page objects for specs that check server rules without a browser;
+each call is one HTTP request on a shared, keep-alive APIRequestContext
+"""
+from dataclasses import dataclass
+from typing import TypedDict
+
+from playwright.sync_api import APIRequestContext, APIResponse
+
+class Product(TypedDict):
+    id: int
+    name: str
+    category: str
+    price: float
+    stock: int
+
+@dataclass(frozen=True)
+class ApiResult:
+    """Status plus the {'success', 'message', ...} body every write endpoint returns"""
+    status: int
+    success: bool
+    message: str
+    data: dict
+    
+    @classmethod
+    def from_response(cls, response: APIResponse):
+        data = response.json()
+        return cls(response.status, bool(data.get("success")), data.get("message", ""), data)
+    
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+class LoginResult(ApiResult):
+    @property
+    def role(self) -> str | None:
+        return self.data.get("role")
+
+class OrderResult(ApiResult):
+    @property
+    def order_id(self) -> str | None:
+        return self.data.get("order_id")
+
+class ApiClient:
+    """Base client; the request context carries the base URL and the session cookie"""
+    
+    def __init__(self, request_context: APIRequestContext):
+        self.request = request_context
+    
+    def post(self, path: str, payload: dict) -> APIResponse:
+        return self.request.post(path, data=payload)
+
+class AuthClient(ApiClient):
+    """/api/login and /api/register"""
+    
+    def login(self, username: str, password: str) -> LoginResult:
+        """Log in; on success this client's context carries the session from then on"""
+        return LoginResult.from_response(self.post("/api/login", {"username": username, "password": password}))
+    
+    def register(self, username: str, email: str, password: str) -> ApiResult:
+        return ApiResult.from_response(
+            self.post("/api/register", {"username": username, "email": email, "password": password})
+        )
+
+class ProductsClient(ApiClient):
+    """/api/products with the same filters as the products page"""
+    
+    def list(self, category: str = "all", search: str = "", min_price: float | None = None,
+             max_price: float | None = None, in_stock: bool | None = None) -> list[Product]:
+        params = {"category": category, "search": search}
+        if min_price is not None:
+            params["min_price"] = min_price
+        if max_price is not None:
+            params["max_price"] = max_price
+        if in_stock is not None:
+            params["in_stock"] = "true" if in_stock else "false"
+        response = self.request.get("/api/products", params=params, headers={"Accept": "application/json"})
+        if not response.ok:
+            raise RuntimeError(f"GET /api/products failed: {response.status} {response.text()}")
+        return response.json()
+
+class OrdersClient(ApiClient):
+    """/api/place-order (needs a logged-in context)"""
+    
+    def place_order(self, items: list[dict], address: str, city: str) -> OrderResult:
+        return OrderResult.from_response(
+            self.post("/api/place-order", {"items": items, "address": address, "city": city})
+        )
+
+class ProfileClient(ApiClient):
+    """/api/update-profile (needs a logged-in context)"""
+    
+    def update_profile(self, email: str) -> ApiResult:
+        return ApiResult.from_response(self.post("/api/update-profile", {"email": email}))
@@ -0,0 +1,48 @@
+"""
+Component Layer - Async Reusable UI Components
+playwright.async_api counterparts of common_components.py
+"""
+from playwright.async_api import Page, expect
+from tests.locators.app_locators import NavigationLocators
+
+class NavigationComponent:
+    """Navigation bar component that appears on all pages"""
+    
+    def __init__(self, page: Page):
+        self.page = page
+        
+    async def navigate_to_home(self):
+        """Navigate to home page"""
+        await self.page.get_by_test_id(NavigationLocators.NAV_HOME).click()
+        
+    async def navigate_to_products(self):
+        """Navigate to products page"""
+        await self.page.get_by_test_id(NavigationLocators.NAV_PRODUCTS).click()
+        
+    async def navigate_to_forms(self):
+        """Navigate to forms demo page"""
+        await self.page.get_by_test_id(NavigationLocators.NAV_FORMS).click()
+        
+    async def navigate_to_components(self):
+        """Navigate to components demo page"""
+        await self.page.get_by_test_id(NavigationLocators.NAV_COMPONENTS).click()
+        
+    async def go_to_cart(self):
+        """Go to shopping cart"""
+        await self.page.get_by_test_id(NavigationLocators.CART_LINK).click()
+        
+    async def go_to_login(self):
+        """Go to login page"""
+        await self.page.get_by_test_id(NavigationLocators.LOGIN_BUTTON).click()
+        
+    async def get_cart_count(self) -> str:
+        """Get current cart item count"""
+        return await self.page.get_by_test_id(NavigationLocators.CART_COUNT).text_content()
+        
+    async def wait_for_cart_count(self, count: int):
+        """Wait until the cart badge shows the given count"""
+        await expect(self.page.get_by_test_id(NavigationLocators.CART_COUNT)).to_have_text(str(count))
+        
+    async def click_logo(self):
+        """Click logo to go home"""
+        await self.page.get_by_test_id(NavigationLocators.LOGO_LINK).click()
@@ -2,8 +2,10 @@
 Component Layer - Reusable UI Components
 These components can appear in multiple pages
 """
-from playwright.sync_api import Page
-from tests.locators.app_locators import NavigationLocators
+import re
+
+from playwright.sync_api import Page, expect
+from tests.locators.app_locators import ComponentsLocators, NavigationLocators
 
 class NavigationComponent:
     """Navigation bar component that appears on all pages"""
@@ -39,6 +41,10 @@ class NavigationComponent:
         """Get current cart item count"""
         return self.page.get_by_test_id(NavigationLocators.CART_COUNT).text_content()
         
+    def wait_for_cart_count(self, count: int):
+        """Wait until the cart badge shows the given count"""
+        expect(self.page.get_by_test_id(NavigationLocators.CART_COUNT)).to_have_text(str(count))
+        
     def click_logo(self):
         """Click logo to go home"""
         self.page.get_by_test_id(NavigationLocators.LOGO_LINK).click()
@@ -116,3 +122,46 @@ class FormValidationComponent:
     def is_success_visible(self, message_testid: str = "success-message") -> bool:
         """Check if success message is visible"""
         return self.page.get_by_test_id(message_testid).is_visible()
+
+class ProgressBarComponent:
+    """Animated progress bar on the components demo page"""
+    
+    def __init__(self, page: Page):
+        self.page = page
+        self.bar = page.get_by_test_id(ComponentsLocators.PROGRESS_BAR)
+        self.text = page.get_by_test_id(ComponentsLocators.PROGRESS_TEXT)
+        
+    def start(self):
+        """Start the progress animation"""
+        self.page.get_by_test_id(ComponentsLocators.START_PROGRESS).click()
+        
+    def wait_until_advanced(self):
+        """Wait for the first progress tick"""
+        expect(self.bar).not_to_have_attribute("aria-valuenow", "0")
+        
+    def wait_until_complete(self, timeout: int = 10000):
+        """Wait for the bar to reach 100%"""
+        expect(self.bar).to_have_attribute("aria-valuenow", "100", timeout=timeout)
+        
+    def get_progress_text(self) -> str:
+        """Get the percentage label"""
+        return self.text.text_content()
+
+class ToastComponent:
+    """Toast notification on the components demo page"""
+    
+    def __init__(self, page: Page):
+        self.page = page
+        self.toast = page.get_by_test_id(ComponentsLocators.TOAST_NOTIFICATION).last
+        
+    def show(self):
+        """Trigger a toast"""
+        self.page.get_by_test_id(ComponentsLocators.SHOW_TOAST).click()
+        
+    def wait_until_shown(self):
+        """Wait for the fade-in (the .show class) instead of sleeping through it"""
+        expect(self.toast).to_have_class(re.compile(r"\bshow\b"))
+        
+    def wait_until_dismissed(self, timeout: int = 5000):
+        """Wait for the toast to be removed after its display time"""
+        expect(self.toast).to_have_count(0, timeout=timeout)
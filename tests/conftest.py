@@ -3,5 +3,15 @@ conftest.py - Pytest configuration
 Automatically loads fixtures for all tests
 """
 pytest_plugins = [
+    "tests.plugins.run_profiles",
+    "tests.plugins.timing_report",
+    "tests.plugins.sharding",
+    "tests.plugins.perf_metrics",
+    "tests.fixtures.artifacts",
+    "tests.fixtures.network_fixtures",
+    "tests.fixtures.context_pool",
+    "tests.fixtures.auth_fixtures",
+    "tests.fixtures.state_fixtures",
+    "tests.fixtures.api_fixtures",
     "tests.fixtures.base_fixtures",
 ]
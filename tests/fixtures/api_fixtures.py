@@ -0,0 +1,61 @@
+"""
+API Fixtures - Browserless request contexts
+One APIRequestContext per session (and per logged-in role) keeps its HTTP
+connections alive across tests, so an API check costs a few milliseconds
+"""
+import pytest
+from playwright.sync_api import APIRequestContext, Playwright
+
+from tests.api.clients import AuthClient, ProductsClient
+from tests.fixtures.auth_fixtures import StorageStateCache
+
+@pytest.fixture(scope="session")
+def api_request(playwright: Playwright, base_url: str):
+    """Anonymous request context shared by the whole session; never log in through it"""
+    request_context = playwright.request.new_context(base_url=base_url)
+    yield request_context
+    request_context.dispose()
+
+@pytest.fixture(scope="session")
+def api_request_as(playwright: Playwright, base_url: str, storage_states: StorageStateCache):
+    """
+    Session-wide request contexts that start logged in, one per role
+    Usage: OrdersClient(api_request_as("user")).place_order(...)
+    """
+    contexts: dict[str, APIRequestContext] = {}
+
+    def request_context_for(role: str = "user") -> APIRequestContext:
+        if role not in contexts:
+            contexts[role] = playwright.request.new_context(
+                base_url=base_url,
+                storage_state=storage_states.path_for(role),
+            )
+        return contexts[role]
+
+    yield request_context_for
+    for request_context in contexts.values():
+        request_context.dispose()
+
+@pytest.fixture
+def new_api_request(playwright: Playwright, base_url: str):
+    """Factory for throwaway request contexts, for tests whose cookies must not be shared"""
+    contexts = []
+
+    def new_context() -> APIRequestContext:
+        request_context = playwright.request.new_context(base_url=base_url)
+        contexts.append(request_context)
+        return request_context
+
+    yield new_context
+    for request_context in contexts:
+        request_context.dispose()
+
+@pytest.fixture
+def auth_api(new_api_request) -> AuthClient:
+    """Login/register client on its own context, so a successful login stays in this test"""
+    return AuthClient(new_api_request())
+
+@pytest.fixture
+def products_api(api_request: APIRequestContext) -> ProductsClient:
+    """Products client on the shared anonymous context"""
+    return ProductsClient(api_request)
@@ -0,0 +1,97 @@
+"""
+Artifacts - Trace, screenshot and video capture with bounded overhead
+Honours pytest-playwright's --tracing / --screenshot / --video modes for our own
+page fixture. In the *-on-failure modes a passing test's trace is stopped without
+being written and its video is deleted, so only failures pay for the disk I/O
+"""
+import re
+import tempfile
+from pathlib import Path
+
+import pytest
+from playwright.sync_api import BrowserContext, Page
+
+PHASE_REPORTS_KEY = pytest.StashKey[dict]()
+
+def artifact_path(request, file_name: str) -> Path:
+    """Per-test file under pytest-playwright's --output directory"""
+    test_folder = re.sub(r"[^A-Za-z0-9_.-]+", "-", request.node.nodeid).strip("-")
+    return Path(request.config.getoption("output")) / test_folder / file_name
+
+@pytest.hookimpl(hookwrapper=True, tryfirst=True)
+def pytest_runtest_makereport(item, call):
+    """Keep each phase's report on the item so fixtures can tell whether the test failed"""
+    outcome = yield
+    report = outcome.get_result()
+    item.stash.setdefault(PHASE_REPORTS_KEY, {})[report.when] = report
+
+class ArtifactRecorder:
+    """Starts capture for one test and keeps or discards the results at teardown"""
+
+    def __init__(self, request, tracing: str, screenshot: str, video: str, full_page: bool = False,
+                 trace_sources: bool = False):
+        self.request = request
+        self.tracing = tracing
+        self.trace_sources = trace_sources
+        self.screenshot = screenshot
+        self.video = video
+        self.full_page = full_page
+
+    @classmethod
+    def for_test(cls, request, run_profile) -> "ArtifactRecorder":
+        config = request.config
+        return cls(
+            request,
+            tracing=run_profile.tracing,
+            trace_sources=run_profile.trace_sources,
+            screenshot=config.getoption("screenshot"),
+            video=config.getoption("video"),
+            full_page=config.getoption("full_page_screenshot"),
+        )
+
+    @property
+    def records_video(self) -> bool:
+        """Video is fixed at context creation, so these tests need a fresh context"""
+        return self.video != "off"
+
+    def context_args(self) -> dict:
+        if not self.records_video:
+            return {}
+        return {"record_video_dir": tempfile.mkdtemp(prefix="playwright-video-")}
+
+    def start(self, context: BrowserContext):
+        if self.tracing != "off":
+            context.tracing.start(screenshots=True, snapshots=True, sources=self.trace_sources)
+
+    def stop(self, context: BrowserContext, page: Page):
+        """Write screenshot and trace if the mode asks for them; call before the context closes"""
+        failed = self.failed
+        # A traced failure always gets a final-state screenshot; taking it before
+        # the trace stops puts the same frame at the end of the trace
+        wanted = self.screenshot == "on" or (
+            failed and (self.screenshot == "only-on-failure" or self.tracing != "off")
+        )
+        if wanted and not page.is_closed():
+            page.screenshot(path=self._path("screenshot.png"), full_page=self.full_page)
+        if self.tracing == "on" or (self.tracing == "retain-on-failure" and failed):
+            context.tracing.stop(path=self._path("trace.zip"))
+        elif self.tracing != "off":
+            context.tracing.stop()  # Discard: nothing is serialised to disk
+
+    def finish_video(self, page: Page):
+        """Keep or delete the recording; call after the context has closed"""
+        if not self.records_video or page.video is None:
+            return
+        if self.video == "on" or (self.video == "retain-on-failure" and self.failed):
+            page.video.save_as(self._path("video.webm"))
+        page.video.delete()
+
+    @property
+    def failed(self) -> bool:
+        reports = self.request.node.stash.get(PHASE_REPORTS_KEY, {})
+        return any(report.failed for report in reports.values())
+
+    def _path(self, file_name: str) -> Path:
+        path = artifact_path(self.request, file_name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path
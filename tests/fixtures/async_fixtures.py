@@ -0,0 +1,115 @@
+"""
+Async Fixtures Layer - playwright.async_api
+One browser, many isolated contexts driven concurrently from a single event loop:
+independent scenarios run side by side with asyncio.gather instead of needing xdist workers
+Loaded only by tests/specs/concurrency/conftest.py, and package-scoped, so the
+async browser and its loop are gone before any sync spec runs
+"""
+import asyncio
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from playwright.async_api import Browser, Page, async_playwright
+
+from tests.components.async_common_components import NavigationComponent
+from tests.fixtures.auth_fixtures import StorageStateCache
+from tests.pages.async_app_pages import (
+    HomePage, LoginPage, RegisterPage, ProductsPage,
+    CheckoutPage, DashboardPage
+)
+
+@pytest.fixture(scope="package")
+def event_loop():
+    """One loop for the package so the async browser can outlive a single test"""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+@pytest_asyncio.fixture(scope="package")
+async def async_playwright_instance():
+    """Async Playwright driver"""
+    async with async_playwright() as p:
+        yield p
+
+@pytest_asyncio.fixture(scope="package")
+async def async_browser(async_playwright_instance, run_profile) -> Browser:
+    """Async browser instance, launched with the active run profile"""
+    browser = await async_playwright_instance.chromium.launch(**run_profile.launch_options())
+    yield browser
+    await browser.close()
+
+@pytest_asyncio.fixture(scope="package")
+async def async_storage_states(async_playwright_instance, base_url: str):
+    """
+    Storage state files per role, from the same StorageStateCache the sync fixtures use
+    It gets its own instance: the sync Playwright's loop cannot run alongside this one
+    Usage: path = await async_storage_states("admin")
+    """
+    cache = StorageStateCache(async_playwright_instance, base_url)
+    lock = asyncio.Lock()
+
+    async def storage_state_for(role: str) -> Path:
+        async with lock:
+            return await cache.path_for_async(role)
+
+    return storage_state_for
+
+@pytest_asyncio.fixture
+async def new_async_page(async_browser: Browser, async_storage_states, run_profile):
+    """
+    Factory for isolated pages; every call opens its own context
+    Usage: admin_page = await new_async_page(role="admin")
+    """
+    contexts = []
+
+    async def new_page(role: str | None = None) -> Page:
+        context_args = {"viewport": run_profile.viewport}
+        if role:
+            context_args["storage_state"] = await async_storage_states(role)
+        context = await async_browser.new_context(**context_args)
+        contexts.append(context)
+        return await context.new_page()
+
+    yield new_page
+    await asyncio.gather(*(context.close() for context in contexts))
+
+@pytest_asyncio.fixture
+async def async_page(new_async_page) -> Page:
+    """Single async page for tests that need just one"""
+    return await new_async_page()
+
+@pytest.fixture
+def async_home_page(async_page: Page, base_url: str):
+    """Async home page fixture"""
+    return HomePage(async_page, base_url)
+
+@pytest.fixture
+def async_login_page(async_page: Page, base_url: str):
+    """Async login page fixture"""
+    return LoginPage(async_page, base_url)
+
+@pytest.fixture
+def async_register_page(async_page: Page, base_url: str):
+    """Async register page fixture"""
+    return RegisterPage(async_page, base_url)
+
+@pytest.fixture
+def async_products_page(async_page: Page, base_url: str):
+    """Async products page fixture"""
+    return ProductsPage(async_page, base_url)
+
+@pytest.fixture
+def async_checkout_page(async_page: Page, base_url: str):
+    """Async checkout page fixture"""
+    return CheckoutPage(async_page, base_url)
+
+@pytest.fixture
+def async_dashboard_page(async_page: Page, base_url: str):
+    """Async dashboard page fixture"""
+    return DashboardPage(async_page, base_url)
+
+@pytest.fixture
+def async_navigation(async_page: Page):
+    """Async navigation component fixture"""
+    return NavigationComponent(async_page)
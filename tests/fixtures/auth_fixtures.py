@@ -0,0 +1,123 @@
+"""
+Authentication Fixtures - Storage State Reuse
+Log in once per role through /api/login and hand every test a context that
+already carries the session cookie, so only the auth specs drive the login form
+"""
+import json
+import os
+import re
+from pathlib import Path
+from urllib.parse import urlparse
+
+import pytest
+from playwright.async_api import Playwright as AsyncPlaywright
+from playwright.sync_api import Browser, Playwright
+
+CREDENTIALS = {
+    "user": ("testuser", "password123"),
+    "admin": ("admin", "admin123"),
+}
+
+STORAGE_STATE_DIR = Path(".auth")
+
+class StorageStateCache:
+    """
+    Logs in lazily, once per role, and keeps the storage state file path
+    Built on a sync Playwright for path_for, or an async one for path_for_async
+    """
+
+    def __init__(self, playwright: Playwright | AsyncPlaywright, base_url: str, directory: Path = STORAGE_STATE_DIR):
+        self.playwright = playwright
+        self.base_url = base_url
+        self.directory = directory
+        self.server_key = re.sub(r"[^A-Za-z0-9]+", "_", urlparse(base_url).netloc or base_url)
+        self._paths = {}
+        self._cookies = {}
+
+    def path_for(self, role: str) -> Path:
+        """Storage state file for a role, logging in on first use"""
+        if role not in self._paths:
+            self._paths[role] = self._save(role, self._login(role))
+        return self._paths[role]
+
+    async def path_for_async(self, role: str) -> Path:
+        """path_for for async tests: the sync API cannot run inside their event loop"""
+        if role not in self._paths:
+            self._paths[role] = self._save(role, await self._login_async(role))
+        return self._paths[role]
+
+    def cookies_for(self, role: str) -> list[dict]:
+        """Session cookies for a role, ready for context.add_cookies()"""
+        if role not in self._cookies:
+            self._cookies[role] = json.loads(self.path_for(role).read_text())["cookies"]
+        return self._cookies[role]
+
+    def _login_data(self, role: str) -> dict:
+        if role not in CREDENTIALS:
+            raise KeyError(f"No credentials for role {role!r}, expected one of {sorted(CREDENTIALS)}")
+        username, password = CREDENTIALS[role]
+        return {"username": username, "password": password}
+
+    def _login(self, role: str) -> dict:
+        request_context = self.playwright.request.new_context()
+        try:
+            response = request_context.post(f"{self.base_url}/api/login", data=self._login_data(role))
+            if not response.ok:
+                raise RuntimeError(f"API login as {role!r} failed: {response.status} {response.text()}")
+            return request_context.storage_state()
+        finally:
+            request_context.dispose()
+
+    async def _login_async(self, role: str) -> dict:
+        request_context = await self.playwright.request.new_context()
+        try:
+            response = await request_context.post(f"{self.base_url}/api/login", data=self._login_data(role))
+            if not response.ok:
+                raise RuntimeError(f"API login as {role!r} failed: {response.status} {await response.text()}")
+            return await request_context.storage_state()
+        finally:
+            await request_context.dispose()
+
+    def _save(self, role: str, state: dict) -> Path:
+        # Flask's secret key changes on every server start, so the file is
+        # refreshed once per session rather than trusted across runs
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{role}-{self.server_key}.json"
+        temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(state))
+        os.replace(temp_path, path)
+        return path
+
+def login_role_for(request) -> str | None:
+    """Role a test needs its page logged in as, if any"""
+    if "admin_authenticated_page" in request.fixturenames:
+        return "admin"
+    if "authenticated_page" in request.fixturenames:
+        return "user"
+    marker = request.node.get_closest_marker("login_as")
+    return marker.args[0] if marker else None
+
+@pytest.fixture(scope="session")
+def storage_states(playwright: Playwright, base_url: str):
+    """Session-wide cache of logged-in storage state files, keyed by role and server"""
+    return StorageStateCache(playwright, base_url)
+
+@pytest.fixture
+def authenticated_context(browser: Browser, storage_states: StorageStateCache, run_profile):
+    """
+    Factory for extra contexts that start logged in
+    Usage: admin_context = authenticated_context("admin")
+    """
+    contexts = []
+
+    def new_context(role: str = "user"):
+        context = browser.new_context(
+            viewport=run_profile.viewport,
+            storage_state=storage_states.path_for(role),
+        )
+        contexts.append(context)
+        return context
+
+    yield new_context
+    for context in contexts:
+        context.close()
@@ -2,59 +2,114 @@
 Fixtures Layer - Dependency Injection
 Professional teams use fixtures to provide ready-to-use objects to tests
 """
+import os
+
 import pytest
-from playwright.sync_api import Page, Browser, sync_playwright
+from playwright.sync_api import Page, Browser, Playwright, sync_playwright
 from tests.pages.app_pages import (
     HomePage, LoginPage, RegisterPage, ProductsPage, 
     CheckoutPage, DashboardPage
 )
 from tests.components.common_components import NavigationComponent
+from tests.fixtures.artifacts import ArtifactRecorder
+from tests.fixtures.auth_fixtures import login_role_for
+from tests.fixtures.context_pool import ContextPool
+from tests.fixtures.network_fixtures import ApiHar
+from tests.plugins.run_profiles import RunProfile
+
+DEFAULT_BASE_URL = "http://127.0.0.1:5000"
+
+def resolve_base_url(configured: str | None, worker_id: str | None = None) -> str:
+    """
+    Pick the server a worker should talk to
+    A comma-separated list spreads pytest-xdist workers (gw0, gw1, ...) across servers
+    """
+    urls = [url.strip().rstrip("/") for url in (configured or DEFAULT_BASE_URL).split(",") if url.strip()]
+    if not urls:
+        return DEFAULT_BASE_URL
+    worker_index = int(worker_id[2:]) if worker_id and worker_id[2:].isdigit() else 0
+    return urls[worker_index % len(urls)]
+
+@pytest.fixture(scope="session")
+def base_url(pytestconfig):
+    """
+    Root URL of the application under test
+    Set with --base-url, the base_url ini option or the PYTEST_BASE_URL env var
+    """
+    return resolve_base_url(
+        pytestconfig.getoption("base_url"),
+        os.getenv("PYTEST_XDIST_WORKER"),
+    )
 
 @pytest.fixture(scope="session")
-def browser():
-    """Browser instance for the test session"""
+def playwright():
+    """Playwright driver shared by the browser and API request contexts"""
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False, slow_mo=500)
-        yield browser
-        browser.close()
+        yield p
+
+@pytest.fixture(scope="session")
+def browser(playwright: Playwright, run_profile: RunProfile):
+    """Browser instance for the test session, launched with the active run profile"""
+    browser = playwright.chromium.launch(**run_profile.launch_options())
+    yield browser
+    browser.close()
 
 @pytest.fixture(scope="function")
-def page(browser: Browser):
-    """New page for each test"""
-    context = browser.new_context()
-    page = context.new_page()
+def page(context_pool: ContextPool, run_profile: RunProfile, request):
+    """
+    Warm page for each test, taken from the context pool and reset afterwards
+    Tests using authenticated_page, admin_authenticated_page or @pytest.mark.login_as(role)
+    start with that role's session cookie instead of logging in through the UI;
+    tests marked @pytest.mark.api_har get /api/products from a recorded HAR
+    """
+    api_har = ApiHar.for_test(request)
+    artifacts = ArtifactRecorder.for_test(request, run_profile)
+    # HAR recordings are only written when their context closes and video is
+    # configured at context creation, so both skip the pool
+    fresh = bool(api_har and api_har.recording) or artifacts.records_video
+    context, page = context_pool.acquire(fresh=fresh, **artifacts.context_args())
+    role = login_role_for(request)
+    if role:
+        context.add_cookies(request.getfixturevalue("storage_states").cookies_for(role))
+    if api_har:
+        api_har.attach(page)
+    artifacts.start(context)
     yield page
-    context.close()
+    artifacts.stop(context, page)
+    if api_har and not fresh:
+        api_har.detach(page)
+    context_pool.release(context, page, discard=fresh)
+    artifacts.finish_video(page)
 
 @pytest.fixture
-def home_page(page: Page):
+def home_page(page: Page, base_url: str, perf_probe):
     """Home page fixture"""
-    return HomePage(page)
+    return HomePage(page, base_url, perf_probe)
 
 @pytest.fixture
-def login_page(page: Page):
+def login_page(page: Page, base_url: str, perf_probe):
     """Login page fixture"""
-    return LoginPage(page)
+    return LoginPage(page, base_url, perf_probe)
 
 @pytest.fixture
-def register_page(page: Page):
+def register_page(page: Page, base_url: str, perf_probe):
     """Register page fixture"""
-    return RegisterPage(page)
+    return RegisterPage(page, base_url, perf_probe)
 
 @pytest.fixture
-def products_page(page: Page):
+def products_page(page: Page, base_url: str, perf_probe):
     """Products page fixture"""
-    return ProductsPage(page)
+    return ProductsPage(page, base_url, perf_probe)
 
 @pytest.fixture
-def checkout_page(page: Page):
+def checkout_page(page: Page, base_url: str, perf_probe):
     """Checkout page fixture"""
-    return CheckoutPage(page)
+    return CheckoutPage(page, base_url, perf_probe)
 
 @pytest.fixture
-def dashboard_page(page: Page):
+def dashboard_page(page: Page, base_url: str, perf_probe):
     """Dashboard page fixture"""
-    return DashboardPage(page)
+    return DashboardPage(page, base_url, perf_probe)
 
 @pytest.fixture
 def navigation(page: Page):
@@ -62,35 +117,18 @@ def navigation(page: Page):
     return NavigationComponent(page)
 
 @pytest.fixture
-def authenticated_page(page: Page, login_page: LoginPage):
+def authenticated_page(page: Page, base_url: str):
     """
     Fixture that provides an already authenticated page
-    Useful for tests that require login state
+    The session comes from the cached storage state, so no login form is driven
     """
-    login_page.navigate()
-    login_page.login("testuser", "password123")
-    page.wait_for_url("**/dashboard")
+    page.goto(f"{base_url}/dashboard")
     return page
 
 @pytest.fixture
-def admin_authenticated_page(page: Page, login_page: LoginPage):
+def admin_authenticated_page(page: Page, base_url: str):
     """
     Fixture that provides an authenticated admin page
     """
-    login_page.navigate()
-    login_page.login("admin", "admin123")
-    page.wait_for_url("**/dashboard")
+    page.goto(f"{base_url}/dashboard")
     return page
-
-@pytest.fixture(autouse=True)
-def clear_local_storage(page: Page):
-    """
-    Auto-use fixture to clear local storage before each test
-    Ensures clean state
-    """
-    yield  # Run the test first
-    # Cleanup after test
-    try:
-        page.evaluate("() => localStorage.clear()")
-    except:
-        pass  # Page might be closed already
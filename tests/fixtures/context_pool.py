@@ -0,0 +1,148 @@
+"""
+Context Pool - Warm browser contexts recycled between tests
+Creating a context and its first page costs far more than resetting one, so
+the pool pre-warms contexts, hands one out per test and cleans it afterwards
+"""
+from collections import deque
+from typing import Callable
+from urllib.parse import urlparse
+
+import pytest
+from playwright.sync_api import Browser, BrowserContext, Error, Page
+
+class ContextPool:
+    """
+    Pre-warmed (context, page) pairs
+    size=0 disables pooling: every test gets a new context that is closed afterwards
+    """
+
+    def __init__(self, browser: Browser, base_url: str, size: int, context_args: dict | None = None,
+                 max_uses: int = 50, on_create: Callable[[BrowserContext, Page], None] | None = None):
+        self.browser = browser
+        self.origin = _origin(base_url)
+        self.size = size
+        self.context_args = context_args or {}
+        self.on_create = on_create
+        self.max_uses = max_uses
+        self.created = 0
+        self.discarded = 0
+        self._uses = {}
+        self._on_origin = set()  # contexts that loaded an app document since their last reset
+        self._idle = deque(self._create() for _ in range(size))
+
+    def acquire(self, fresh: bool = False, **context_args) -> tuple[BrowserContext, Page]:
+        """
+        Take a healthy warm context, or create one when none is idle
+        fresh=True always creates a new context, with context_args added to the pool's defaults
+        """
+        while self._idle and not fresh:
+            context, page = self._idle.popleft()
+            if self._is_healthy(page):
+                break
+            self._discard(context)
+        else:
+            context, page = self._create(**context_args)
+        self._uses[context] += 1
+        return context, page
+
+    def release(self, context: BrowserContext, page: Page, discard: bool = False):
+        """Reset the context for the next test, or drop it if that is not possible (or discard=True)"""
+        if discard or not self.size or len(self._idle) >= self.size or self._uses[context] >= self.max_uses:
+            self._discard(context)
+            return
+        try:
+            self._reset(context, page)
+        except Error:
+            self._discard(context)
+            return
+        self._idle.append((context, page))
+
+    def close(self):
+        """Close every idle context"""
+        while self._idle:
+            context, _ = self._idle.popleft()
+            self._discard(context)
+
+    def _create(self, **context_args) -> tuple[BrowserContext, Page]:
+        context = self.browser.new_context(**{**self.context_args, **context_args})
+        self.created += 1
+        self._uses[context] = 0
+        context.on("page", self._watch)
+        page = context.new_page()
+        if self.on_create:
+            self.on_create(context, page)
+        return context, page
+
+    def _watch(self, page: Page):
+        """Note when any frame of the page loads an app document, which may write web storage"""
+        def on_navigated(frame):
+            if _origin(frame.url) == self.origin:
+                self._on_origin.add(page.context)
+
+        page.on("framenavigated", on_navigated)
+
+    def _reset(self, context: BrowserContext, page: Page):
+        if page.is_closed():
+            raise Error("pooled page was closed")
+        for other_page in context.pages:
+            if other_page is not page:
+                other_page.close()
+        # Web storage is per origin and can only be cleared from a document on
+        # that origin. A test that never loaded the app (about:blank, other
+        # sites only) has no app storage to clear; one that did and then left
+        # cannot be cleaned, so it gets a fresh context
+        if context in self._on_origin:
+            if _origin(page.url) != self.origin:
+                raise Error("pooled page left the application origin")
+            page.evaluate("() => { localStorage.clear(); sessionStorage.clear(); }")
+        context.clear_cookies()
+        context.clear_permissions()
+        # PerformanceProbe.attach forces server sampling with a page-level header
+        page.set_extra_http_headers({})
+        if self.context_args.get("viewport") and page.viewport_size != self.context_args["viewport"]:
+            page.set_viewport_size(self.context_args["viewport"])
+        if page.url != "about:blank":
+            page.goto("about:blank")
+        self._on_origin.discard(context)
+
+    def _is_healthy(self, page: Page) -> bool:
+        if not self.browser.is_connected() or page.is_closed():
+            return False
+        try:
+            return page.evaluate("() => document.readyState") == "complete"
+        except Error:
+            return False
+
+    def _discard(self, context: BrowserContext):
+        self._uses.pop(context, None)
+        self._on_origin.discard(context)
+        self.discarded += 1
+        try:
+            context.close()
+        except Error:
+            pass  # Browser may already be gone
+
+def _origin(url: str) -> str:
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+def pytest_addoption(parser):
+    parser.getgroup("playwright").addoption(
+        "--context-pool-size",
+        type=int,
+        default=2,
+        help="Warm browser contexts kept for reuse between tests (0 = new context per test)",
+    )
+
+@pytest.fixture(scope="session")
+def context_pool(browser: Browser, base_url: str, run_profile, asset_cache, pytestconfig):
+    """Session-wide pool of warm contexts backing the page fixture"""
+    pool = ContextPool(
+        browser,
+        base_url,
+        size=pytestconfig.getoption("context_pool_size"),
+        context_args={"viewport": run_profile.viewport},
+        on_create=(lambda context, page: asset_cache.attach(page)) if asset_cache else None,
+    )
+    yield pool
+    pool.close()
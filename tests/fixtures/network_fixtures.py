@@ -0,0 +1,123 @@
+"""
+Network Fixtures - Request interception
+Serves /static/ assets from an in-memory cache after their first load and,
+for tests marked @pytest.mark.api_har, answers /api/products from a recorded HAR
+"""
+import json
+import re
+import tempfile
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import pytest
+from playwright.sync_api import Page, Route
+
+STATIC_ASSETS = re.compile(r"/static/")
+API_PRODUCTS = "**/api/products*"
+HAR_DIR = Path(__file__).parent / "har"
+REPLAY_DIR = Path(tempfile.gettempdir()) / "playwright-demo-har"
+
+class StaticAssetCache:
+    """Session-wide copy of static responses, shared by every page that attaches it"""
+
+    def __init__(self):
+        self._entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    def attach(self, page: Page):
+        """Route this page's static asset requests through the cache"""
+        page.route(STATIC_ASSETS, self.handle)
+
+    def handle(self, route: Route):
+        url = route.request.url
+        entry = self._entries.get(url)
+        if entry is None:
+            self.misses += 1
+            response = route.fetch()
+            entry = {"status": response.status, "headers": response.headers, "body": response.body()}
+            if response.ok:
+                self._entries[url] = entry
+        else:
+            self.hits += 1
+        route.fulfill(**entry)
+
+class ApiHar:
+    """Record/replay settings for a test marked @pytest.mark.api_har(name=None, mode="replay")"""
+
+    def __init__(self, path: Path, recording: bool, base_url: str):
+        self.path = path
+        self.recording = recording
+        self.base_url = base_url
+
+    @classmethod
+    def for_test(cls, request) -> "ApiHar | None":
+        marker = request.node.get_closest_marker("api_har")
+        if marker is None:
+            return None
+        name = marker.kwargs.get("name") or (marker.args[0] if marker.args else request.node.originalname)
+        mode = marker.kwargs.get("mode", "replay")
+        if mode not in ("record", "replay"):
+            raise pytest.UsageError(f"api_har mode must be 'record' or 'replay', got {mode!r}")
+        path = HAR_DIR / f"{name}.har"
+        recording = mode == "record" or request.config.getoption("update_har")
+        if not recording and not path.exists():
+            pytest.fail(
+                f"No HAR recording at {path}; run this test against a live server with --update-har "
+                "and commit the file",
+                pytrace=False,
+            )
+        return cls(path, recording, request.getfixturevalue("base_url"))
+
+    def replay_path(self) -> Path:
+        """
+        Copy of the recording with every URL moved onto the server under test
+        HAR lookups compare full URLs, so a file recorded on :5000 would otherwise miss on :5001
+        """
+        har = json.loads(self.path.read_text())
+        base_url = self.base_url.rstrip("/")
+        for entry in har["log"]["entries"]:
+            url = entry["request"]["url"]
+            recorded = urlsplit(url)
+            # String splice rather than urlunsplit, which would drop an empty "?" query
+            entry["request"]["url"] = base_url + url[len(f"{recorded.scheme}://{recorded.netloc}"):]
+        REPLAY_DIR.mkdir(parents=True, exist_ok=True)
+        path = REPLAY_DIR / f"{self.path.stem}-{re.sub(r'[^A-Za-z0-9]+', '_', urlsplit(base_url).netloc)}.har"
+        path.write_text(json.dumps(har))
+        return path
+
+    def attach(self, page: Page):
+        """
+        Replay /api/products from the HAR, or capture it (written when the context closes)
+        On replay a request missing from the HAR is aborted, never sent to the live server
+        """
+        if self.recording:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            page.route_from_har(self.path, url=API_PRODUCTS, update=True, not_found="fallback")
+        else:
+            page.route_from_har(self.replay_path(), url=API_PRODUCTS, not_found="abort")
+
+    def detach(self, page: Page):
+        page.unroute(API_PRODUCTS)
+
+def pytest_addoption(parser):
+    group = parser.getgroup("playwright")
+    group.addoption(
+        "--no-asset-cache",
+        action="store_true",
+        default=False,
+        help="Load /static/ assets from the server on every page load",
+    )
+    group.addoption(
+        "--update-har",
+        action="store_true",
+        default=False,
+        help="Re-record the HAR files of tests marked api_har",
+    )
+
+@pytest.fixture(scope="session")
+def asset_cache(pytestconfig) -> StaticAssetCache | None:
+    """In-memory static asset cache, or None when disabled with --no-asset-cache"""
+    if pytestconfig.getoption("no_asset_cache"):
+        return None
+    return StaticAssetCache()
@@ -0,0 +1,69 @@
+"""
+State Fixtures - Per-test isolation without restarting the server
+Tests that change server data (registrations, profile edits, catalog imports)
+put it back to a checkpoint afterwards instead of leaking it into later tests
+"""
+import warnings
+
+import pytest
+from playwright.sync_api import Playwright
+
+PRISTINE = "pristine"
+
+class ServerState:
+    """Checkpoint/restore client for a server started with STATE_ENDPOINTS=1"""
+
+    def __init__(self, playwright: Playwright, base_url: str):
+        self.request_context = playwright.request.new_context(base_url=base_url)
+        self.available = True
+
+    def _post(self, action: str, name: str) -> bool:
+        if not self.available:
+            return False
+        response = self.request_context.post(f"/api/test/state/{action}", params={"name": name})
+        if response.status == 404 and "json" not in response.headers.get("content-type", ""):
+            # The route itself is missing: the server was started without STATE_ENDPOINTS=1
+            self.available = False
+            warnings.warn("Server state is not restored between tests; start the app with STATE_ENDPOINTS=1")
+            return False
+        if not response.ok:
+            raise RuntimeError(f"State {action} {name!r} failed: {response.status} {response.text()}")
+        return True
+
+    def checkpoint(self, name: str = PRISTINE) -> bool:
+        return self._post("checkpoint", name)
+
+    def restore(self, name: str = PRISTINE) -> bool:
+        return self._post("restore", name)
+
+    def dispose(self):
+        self.request_context.dispose()
+
+@pytest.fixture(scope="session")
+def server_state(playwright: Playwright, base_url: str):
+    """Session-wide client for the server's test-only state endpoints"""
+    state = ServerState(playwright, base_url)
+    yield state
+    state.dispose()
+
+@pytest.fixture
+def pristine_state(server_state: ServerState):
+    """
+    Return the server to its startup state after the test
+    Restores are server-wide, so give each xdist worker its own server (--base-url a,b,...)
+    """
+    yield server_state
+    server_state.restore()
+
+@pytest.fixture
+def app_state():
+    """
+    Checkpoint the in-process app's catalog and users, restore them after the test
+    For specs that drive `app` through Flask's test client
+    """
+    from app import app
+
+    store = app.extensions["store"]
+    checkpoint = store.checkpoint()
+    yield store
+    store.restore(checkpoint)
@@ -41,8 +41,10 @@ class ProductsLocators:
     PRODUCTS_CONTAINER = "products-container"
     CATEGORY_FILTER = "category-filter"
     SEARCH_INPUT = "search-input"
+    SEARCH_SUGGESTIONS = "search-suggestions"
     CLEAR_FILTERS_BUTTON = "clear-filters-button"
     PRODUCTS_GRID = "products-grid"
+    PRODUCT_CARD = '[role="listitem"]'  # CSS within the grid; card test ids are product-<id>
     LOADING_INDICATOR = "loading-indicator"
     NO_PRODUCTS_MESSAGE = "no-products-message"
 
@@ -169,3 +171,4 @@ class ComponentsLocators:
     # Toast
     SHOW_TOAST = "show-toast"
     TOAST_CONTAINER = "toast-container"
+    TOAST_NOTIFICATION = "toast-notification"
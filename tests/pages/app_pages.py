@@ -2,22 +2,71 @@
 Page Object Model - Business API Layer
 Pages expose business actions, hiding implementation details
 """
-from playwright.sync_api import Page, expect
+from urllib.parse import urlparse
+
+from playwright.sync_api import Locator, Page, expect
 from tests.components.common_components import NavigationComponent
 from tests.locators.app_locators import (
     LoginLocators, RegisterLocators, HomeLocators, 
     ProductsLocators, CheckoutLocators, DashboardLocators
 )
+from tests.pages.performance import PerformanceProbe
+
+# Every card field in one browser round trip instead of one per field
+READ_CARDS_SCRIPT = """cards => cards.map(card => {
+    const id = card.dataset.testid.slice("product-".length);
+    const text = field => card.querySelector(`[data-testid="product-${field}-${id}"]`).textContent.trim();
+    return {
+        id: Number(id),
+        name: text("name"),
+        category: text("category"),
+        price: text("price"),
+        stock: parseInt(text("stock"), 10),
+    };
+})"""
 
 class BasePage:
     """Base page with common functionality"""
     
-    def __init__(self, page: Page):
+    path = "/"
+    
+    def __init__(self, page: Page, base_url: str, probe: PerformanceProbe | None = None):
         self.page = page
-        
-    def goto(self, url: str):
-        """Navigate to URL"""
-        self.page.goto(url)
+        self.base_url = base_url.rstrip("/")
+        self.probe = probe
+        self.metrics = None
+        if probe:
+            probe.attach(page)
+        self._locators: dict[str, Locator] = {}
+        
+    def by_test_id(self, test_id: str) -> Locator:
+        """Locator for a test ID, built once per page object and reused (locators re-resolve on every action)"""
+        locator = self._locators.get(test_id)
+        if locator is None:
+            locator = self._locators[test_id] = self.page.get_by_test_id(test_id)
+        return locator
+        
+    def visible_text(self, test_id: str) -> str:
+        """Wait for an element to be shown, then read its text"""
+        locator = self.by_test_id(test_id)
+        locator.wait_for(state="visible")
+        return locator.text_content()
+        
+    def url(self, path: str = "/") -> str:
+        """Build an absolute URL on the application under test"""
+        return f"{self.base_url}{path}"
+        
+    def goto(self, path: str, collect_metrics: bool = True):
+        """Navigate to a path relative to the base URL"""
+        self.page.goto(self.url(path))
+        if collect_metrics:
+            self.collect_performance_metrics()
+            
+    def collect_performance_metrics(self) -> dict | None:
+        """Record browser timings for the current document when a probe is attached"""
+        if self.probe:
+            self.metrics = self.probe.collect(self.page)
+        return self.metrics
         
     def wait_for_load_state(self):
         """Wait for page to load"""
@@ -26,169 +75,192 @@ class BasePage:
 class HomePage(BasePage):
     """Home page business API"""
     
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self.base_url = "http://127.0.0.1:5000"
-        
     def navigate(self):
         """Go to home page"""
-        self.goto(self.base_url)
+        self.goto(self.path)
         
     def click_shop_now(self):
         """Click main shop now button"""
-        self.page.get_by_test_id(HomeLocators.SHOP_NOW_BUTTON).click()
+        self.by_test_id(HomeLocators.SHOP_NOW_BUTTON).click()
         
     def click_register(self):
         """Click register button"""
-        self.page.get_by_test_id(HomeLocators.REGISTER_BUTTON).click()
+        self.by_test_id(HomeLocators.REGISTER_BUTTON).click()
         
     def subscribe_to_newsletter(self, email: str):
         """Subscribe to newsletter"""
-        self.page.get_by_test_id(HomeLocators.NEWSLETTER_EMAIL_INPUT).fill(email)
-        self.page.get_by_test_id(HomeLocators.NEWSLETTER_SUBSCRIBE_BUTTON).click()
+        self.by_test_id(HomeLocators.NEWSLETTER_EMAIL_INPUT).fill(email)
+        self.by_test_id(HomeLocators.NEWSLETTER_SUBSCRIBE_BUTTON).click()
         
     def get_newsletter_message(self) -> str:
         """Get newsletter subscription message"""
-        self.page.get_by_test_id(HomeLocators.NEWSLETTER_MESSAGE).wait_for(state="visible")
-        return self.page.get_by_test_id(HomeLocators.NEWSLETTER_MESSAGE).text_content()
+        return self.visible_text(HomeLocators.NEWSLETTER_MESSAGE)
         
     def is_hero_visible(self) -> bool:
         """Check if hero section is visible"""
-        return self.page.get_by_test_id(HomeLocators.HERO_SECTION).is_visible()
+        return self.by_test_id(HomeLocators.HERO_SECTION).is_visible()
 
 class LoginPage(BasePage):
     """Login page business API"""
     
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self.base_url = "http://127.0.0.1:5000/login"
+    path = "/login"
         
     def navigate(self):
         """Go to login page"""
-        self.goto(self.base_url)
+        self.goto(self.path)
         
     def login(self, username: str, password: str, remember_me: bool = False):
         """Perform login action"""
-        self.page.get_by_test_id(LoginLocators.USERNAME_INPUT).fill(username)
-        self.page.get_by_test_id(LoginLocators.PASSWORD_INPUT).fill(password)
+        self.by_test_id(LoginLocators.USERNAME_INPUT).fill(username)
+        self.by_test_id(LoginLocators.PASSWORD_INPUT).fill(password)
         
         if remember_me:
-            self.page.get_by_test_id(LoginLocators.REMEMBER_CHECKBOX).check()
+            self.by_test_id(LoginLocators.REMEMBER_CHECKBOX).check()
             
-        self.page.get_by_test_id(LoginLocators.SUBMIT_LOGIN_BUTTON).click()
+        self.by_test_id(LoginLocators.SUBMIT_LOGIN_BUTTON).click()
         
     def get_error_message(self) -> str:
         """Get login error message"""
-        self.page.get_by_test_id(LoginLocators.ERROR_MESSAGE).wait_for(state="visible")
-        return self.page.get_by_test_id(LoginLocators.ERROR_MESSAGE).text_content()
+        return self.visible_text(LoginLocators.ERROR_MESSAGE)
         
     def click_register_link(self):
         """Click register link"""
-        self.page.get_by_test_id(LoginLocators.REGISTER_LINK).click()
+        self.by_test_id(LoginLocators.REGISTER_LINK).click()
         
     def is_login_page_displayed(self) -> bool:
         """Check if on login page"""
-        return self.page.get_by_test_id(LoginLocators.LOGIN_CONTAINER).is_visible()
+        return self.by_test_id(LoginLocators.LOGIN_CONTAINER).is_visible()
 
 class RegisterPage(BasePage):
     """Registration page business API"""
     
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self.base_url = "http://127.0.0.1:5000/register"
+    path = "/register"
         
     def navigate(self):
         """Go to register page"""
-        self.goto(self.base_url)
+        self.goto(self.path)
         
     def register(self, username: str, email: str, password: str, 
                  confirm_password: str, accept_terms: bool = True):
         """Perform registration"""
-        self.page.get_by_test_id(RegisterLocators.REGISTER_USERNAME_INPUT).fill(username)
-        self.page.get_by_test_id(RegisterLocators.REGISTER_EMAIL_INPUT).fill(email)
-        self.page.get_by_test_id(RegisterLocators.REGISTER_PASSWORD_INPUT).fill(password)
-        self.page.get_by_test_id(RegisterLocators.REGISTER_CONFIRM_PASSWORD_INPUT).fill(confirm_password)
+        self.by_test_id(RegisterLocators.REGISTER_USERNAME_INPUT).fill(username)
+        self.by_test_id(RegisterLocators.REGISTER_EMAIL_INPUT).fill(email)
+        self.by_test_id(RegisterLocators.REGISTER_PASSWORD_INPUT).fill(password)
+        self.by_test_id(RegisterLocators.REGISTER_CONFIRM_PASSWORD_INPUT).fill(confirm_password)
         
         if accept_terms:
-            self.page.get_by_test_id(RegisterLocators.TERMS_CHECKBOX).check()
+            self.by_test_id(RegisterLocators.TERMS_CHECKBOX).check()
             
-        self.page.get_by_test_id(RegisterLocators.SUBMIT_REGISTER_BUTTON).click()
+        self.by_test_id(RegisterLocators.SUBMIT_REGISTER_BUTTON).click()
         
     def get_error_message(self) -> str:
         """Get registration error message"""
-        self.page.get_by_test_id(RegisterLocators.REGISTER_ERROR_MESSAGE).wait_for(state="visible")
-        return self.page.get_by_test_id(RegisterLocators.REGISTER_ERROR_MESSAGE).text_content()
+        return self.visible_text(RegisterLocators.REGISTER_ERROR_MESSAGE)
         
     def get_success_message(self) -> str:
         """Get registration success message"""
-        self.page.get_by_test_id(RegisterLocators.REGISTER_SUCCESS_MESSAGE).wait_for(state="visible")
-        return self.page.get_by_test_id(RegisterLocators.REGISTER_SUCCESS_MESSAGE).text_content()
+        return self.visible_text(RegisterLocators.REGISTER_SUCCESS_MESSAGE)
 
 class ProductsPage(BasePage):
     """Products page business API"""
     
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self.base_url = "http://127.0.0.1:5000/products"
-        #self.navigation = NavigationComponent(page)
+    path = "/products"
         
     def navigate(self):
-        """Go to products page"""
-        self.goto(self.base_url)
+        """Go to products page and wait for the initial product load"""
+        with self.expect_results():
+            self.goto(self.path, collect_metrics=False)
+        self.wait_for_results()
+        self.collect_performance_metrics()
         
     def filter_by_category(self, category: str):
         """Filter products by category"""
-        self.page.get_by_test_id(ProductsLocators.CATEGORY_FILTER).select_option(category)
+        with self.expect_results():
+            self.by_test_id(ProductsLocators.CATEGORY_FILTER).select_option(category)
+        self.wait_for_results()
         
     def search_products(self, search_term: str):
-        """Search for products"""
-        self.page.get_by_test_id(ProductsLocators.SEARCH_INPUT).fill(search_term)
+        """Search for products (waits out the input debounce via the API response)"""
+        with self.expect_results():
+            self.by_test_id(ProductsLocators.SEARCH_INPUT).fill(search_term)
+        self.wait_for_results()
+        
+    def get_suggestions(self, prefix: str) -> list[str]:
+        """Type a prefix into the search box and return the autocomplete suggestions offered"""
+        options = self.by_test_id(ProductsLocators.SEARCH_SUGGESTIONS).locator("option")
+        with self.page.expect_response(lambda response: urlparse(response.url).path == "/api/products/suggest"):
+            self.by_test_id(ProductsLocators.SEARCH_INPUT).fill(prefix)
+        expect(options.first).to_be_attached()
+        return options.evaluate_all("options => options.map(option => option.value)")
         
     def clear_filters(self):
         """Clear all filters"""
-        self.page.get_by_test_id(ProductsLocators.CLEAR_FILTERS_BUTTON).click()
+        with self.expect_results():
+            self.by_test_id(ProductsLocators.CLEAR_FILTERS_BUTTON).click()
+        self.wait_for_results()
+        
+    def expect_results(self):
+        """
+        Context manager that waits for the /api/products response triggered inside it
+        Usage: with products_page.expect_results(): <action that reloads products>
+        """
+        return self.page.expect_response(lambda response: urlparse(response.url).path == "/api/products")
+        
+    def wait_for_results(self):
+        """Wait until the latest product results are rendered"""
+        # loadProducts() hides the indicator in the same task that renders the grid
+        expect(self.by_test_id(ProductsLocators.LOADING_INDICATOR)).to_be_hidden()
         
     def add_product_to_cart(self, product_id: int):
         """Add product to cart"""
-        self.page.get_by_test_id(f"add-to-cart-{product_id}").click()
+        self.by_test_id(f"add-to-cart-{product_id}").click()
         
     def view_product_details(self, product_id: int):
         """View product details"""
-        self.page.get_by_test_id(f"view-details-{product_id}").click()
+        self.by_test_id(f"view-details-{product_id}").click()
+        
+    def product_cards(self) -> Locator:
+        """Locator for the rendered product cards"""
+        return self.by_test_id(ProductsLocators.PRODUCTS_GRID).locator(ProductsLocators.PRODUCT_CARD)
         
     def get_product_count(self) -> int:
         """Get number of displayed products"""
-        self.page.get_by_test_id(ProductsLocators.LOADING_INDICATOR).wait_for(state="hidden", timeout=5000)
-        products = self.page.get_by_test_id(ProductsLocators.PRODUCTS_GRID).locator('[data-testid^="product-"]').all()
-        return len(products)
+        self.by_test_id(ProductsLocators.LOADING_INDICATOR).wait_for(state="hidden", timeout=5000)
+        return self.product_cards().count()
+        
+    def read_cards(self) -> list[dict]:
+        """
+        Read every displayed card ({id, name, category, price, stock}) in one evaluate
+        Price is the formatted text shown to the user; stock is the parsed count
+        """
+        self.wait_for_results()
+        return self.product_cards().evaluate_all(READ_CARDS_SCRIPT)
         
     def is_no_products_message_shown(self) -> bool:
         """Check if no products message is displayed"""
-        return self.page.get_by_test_id(ProductsLocators.NO_PRODUCTS_MESSAGE).is_visible()
+        return self.by_test_id(ProductsLocators.NO_PRODUCTS_MESSAGE).is_visible()
 
 class CheckoutPage(BasePage):
     """Checkout page business API"""
     
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self.base_url = "http://127.0.0.1:5000/checkout"
+    path = "/checkout"
         
     def navigate(self):
         """Go to checkout page"""
-        self.goto(self.base_url)
+        self.goto(self.path)
         
     def fill_shipping_info(self, address: str, city: str):
         """Fill shipping information"""
-        self.page.get_by_test_id(CheckoutLocators.SHIPPING_ADDRESS_INPUT).fill(address)
-        self.page.get_by_test_id(CheckoutLocators.SHIPPING_CITY_INPUT).fill(city)
+        self.by_test_id(CheckoutLocators.SHIPPING_ADDRESS_INPUT).fill(address)
+        self.by_test_id(CheckoutLocators.SHIPPING_CITY_INPUT).fill(city)
         
     def accept_terms(self):
         """Accept terms and conditions"""
-        self.page.get_by_test_id(CheckoutLocators.ACCEPT_TERMS_CHECKBOX).check()
+        self.by_test_id(CheckoutLocators.ACCEPT_TERMS_CHECKBOX).check()
         
     def place_order(self):
         """Place the order"""
-        self.page.get_by_test_id(CheckoutLocators.PLACE_ORDER_BUTTON).click()
+        self.by_test_id(CheckoutLocators.PLACE_ORDER_BUTTON).click()
         
     def complete_checkout(self, address: str, city: str):
         """Complete full checkout process"""
@@ -198,32 +270,29 @@ class CheckoutPage(BasePage):
         
     def get_checkout_message(self) -> str:
         """Get checkout message"""
-        self.page.get_by_test_id(CheckoutLocators.CHECKOUT_MESSAGE).wait_for(state="visible")
-        return self.page.get_by_test_id(CheckoutLocators.CHECKOUT_MESSAGE).text_content()
+        return self.visible_text(CheckoutLocators.CHECKOUT_MESSAGE)
 
 class DashboardPage(BasePage):
     """Dashboard page business API"""
     
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self.base_url = "http://127.0.0.1:5000/dashboard"
+    path = "/dashboard"
         
     def navigate(self):
         """Go to dashboard page"""
-        self.goto(self.base_url)
+        self.goto(self.path)
         
     def is_admin_badge_visible(self) -> bool:
         """Check if admin badge is displayed"""
         try:
-            return self.page.get_by_test_id(DashboardLocators.ADMIN_BADGE).is_visible()
+            return self.by_test_id(DashboardLocators.ADMIN_BADGE).is_visible()
         except:
             return False
             
     def view_profile(self):
         """Go to profile page"""
-        self.page.get_by_test_id(DashboardLocators.VIEW_PROFILE_LINK).click()
+        self.by_test_id(DashboardLocators.VIEW_PROFILE_LINK).click()
         
     def logout(self):
         """Logout from dashboard"""
-        self.page.get_by_test_id(DashboardLocators.LOGOUT_BUTTON).click()
+        self.by_test_id(DashboardLocators.LOGOUT_BUTTON).click()
 
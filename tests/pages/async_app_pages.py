@@ -0,0 +1,256 @@
+"""
+Page Object Model - Async Business API Layer
+Mirrors app_pages.py on playwright.async_api so one event loop can drive
+many pages at once; every action is awaited
+"""
+from urllib.parse import urlparse
+
+from playwright.async_api import Locator, Page, expect
+from tests.locators.app_locators import (
+    LoginLocators, RegisterLocators, HomeLocators, 
+    ProductsLocators, CheckoutLocators, DashboardLocators
+)
+from tests.pages.app_pages import READ_CARDS_SCRIPT
+
+class BasePage:
+    """Base page with common functionality"""
+    
+    path = "/"
+    
+    def __init__(self, page: Page, base_url: str):
+        self.page = page
+        self.base_url = base_url.rstrip("/")
+        self._locators: dict[str, Locator] = {}
+        
+    def by_test_id(self, test_id: str) -> Locator:
+        """Locator for a test ID, built once per page object and reused (locators re-resolve on every action)"""
+        locator = self._locators.get(test_id)
+        if locator is None:
+            locator = self._locators[test_id] = self.page.get_by_test_id(test_id)
+        return locator
+        
+    async def visible_text(self, test_id: str) -> str:
+        """Wait for an element to be shown, then read its text"""
+        locator = self.by_test_id(test_id)
+        await locator.wait_for(state="visible")
+        return await locator.text_content()
+        
+    def url(self, path: str = "/") -> str:
+        """Build an absolute URL on the application under test"""
+        return f"{self.base_url}{path}"
+        
+    async def goto(self, path: str):
+        """Navigate to a path relative to the base URL"""
+        await self.page.goto(self.url(path))
+        
+    async def wait_for_load_state(self):
+        """Wait for page to load"""
+        await self.page.wait_for_load_state("networkidle")
+
+class HomePage(BasePage):
+    """Home page business API"""
+    
+    async def navigate(self):
+        """Go to home page"""
+        await self.goto(self.path)
+        
+    async def click_shop_now(self):
+        """Click main shop now button"""
+        await self.by_test_id(HomeLocators.SHOP_NOW_BUTTON).click()
+        
+    async def click_register(self):
+        """Click register button"""
+        await self.by_test_id(HomeLocators.REGISTER_BUTTON).click()
+        
+    async def subscribe_to_newsletter(self, email: str):
+        """Subscribe to newsletter"""
+        await self.by_test_id(HomeLocators.NEWSLETTER_EMAIL_INPUT).fill(email)
+        await self.by_test_id(HomeLocators.NEWSLETTER_SUBSCRIBE_BUTTON).click()
+        
+    async def get_newsletter_message(self) -> str:
+        """Get newsletter subscription message"""
+        return await self.visible_text(HomeLocators.NEWSLETTER_MESSAGE)
+        
+    async def is_hero_visible(self) -> bool:
+        """Check if hero section is visible"""
+        return await self.by_test_id(HomeLocators.HERO_SECTION).is_visible()
+
+class LoginPage(BasePage):
+    """Login page business API"""
+    
+    path = "/login"
+    
+    async def navigate(self):
+        """Go to login page"""
+        await self.goto(self.path)
+        
+    async def login(self, username: str, password: str, remember_me: bool = False):
+        """Perform login action"""
+        await self.by_test_id(LoginLocators.USERNAME_INPUT).fill(username)
+        await self.by_test_id(LoginLocators.PASSWORD_INPUT).fill(password)
+        
+        if remember_me:
+            await self.by_test_id(LoginLocators.REMEMBER_CHECKBOX).check()
+            
+        await self.by_test_id(LoginLocators.SUBMIT_LOGIN_BUTTON).click()
+        
+    async def get_error_message(self) -> str:
+        """Get login error message"""
+        return await self.visible_text(LoginLocators.ERROR_MESSAGE)
+        
+    async def click_register_link(self):
+        """Click register link"""
+        await self.by_test_id(LoginLocators.REGISTER_LINK).click()
+        
+    async def is_login_page_displayed(self) -> bool:
+        """Check if on login page"""
+        return await self.by_test_id(LoginLocators.LOGIN_CONTAINER).is_visible()
+
+class RegisterPage(BasePage):
+    """Registration page business API"""
+    
+    path = "/register"
+    
+    async def navigate(self):
+        """Go to register page"""
+        await self.goto(self.path)
+        
+    async def register(self, username: str, email: str, password: str, 
+                       confirm_password: str, accept_terms: bool = True):
+        """Perform registration"""
+        await self.by_test_id(RegisterLocators.REGISTER_USERNAME_INPUT).fill(username)
+        await self.by_test_id(RegisterLocators.REGISTER_EMAIL_INPUT).fill(email)
+        await self.by_test_id(RegisterLocators.REGISTER_PASSWORD_INPUT).fill(password)
+        await self.by_test_id(RegisterLocators.REGISTER_CONFIRM_PASSWORD_INPUT).fill(confirm_password)
+        
+        if accept_terms:
+            await self.by_test_id(RegisterLocators.TERMS_CHECKBOX).check()
+            
+        await self.by_test_id(RegisterLocators.SUBMIT_REGISTER_BUTTON).click()
+        
+    async def get_error_message(self) -> str:
+        """Get registration error message"""
+        return await self.visible_text(RegisterLocators.REGISTER_ERROR_MESSAGE)
+        
+    async def get_success_message(self) -> str:
+        """Get registration success message"""
+        return await self.visible_text(RegisterLocators.REGISTER_SUCCESS_MESSAGE)
+
+class ProductsPage(BasePage):
+    """Products page business API"""
+    
+    path = "/products"
+    
+    async def navigate(self):
+        """Go to products page and wait for the initial product load"""
+        async with self.expect_results():
+            await self.goto(self.path)
+        await self.wait_for_results()
+        
+    async def filter_by_category(self, category: str):
+        """Filter products by category"""
+        async with self.expect_results():
+            await self.by_test_id(ProductsLocators.CATEGORY_FILTER).select_option(category)
+        await self.wait_for_results()
+        
+    async def search_products(self, search_term: str):
+        """Search for products (waits out the input debounce via the API response)"""
+        async with self.expect_results():
+            await self.by_test_id(ProductsLocators.SEARCH_INPUT).fill(search_term)
+        await self.wait_for_results()
+        
+    async def clear_filters(self):
+        """Clear all filters"""
+        async with self.expect_results():
+            await self.by_test_id(ProductsLocators.CLEAR_FILTERS_BUTTON).click()
+        await self.wait_for_results()
+        
+    def expect_results(self):
+        """
+        Async context manager that waits for the /api/products response triggered inside it
+        Usage: async with products_page.expect_results(): <action that reloads products>
+        """
+        return self.page.expect_response(lambda response: urlparse(response.url).path == "/api/products")
+        
+    async def wait_for_results(self):
+        """Wait until the latest product results are rendered"""
+        await expect(self.by_test_id(ProductsLocators.LOADING_INDICATOR)).to_be_hidden()
+        
+    async def add_product_to_cart(self, product_id: int):
+        """Add product to cart"""
+        await self.by_test_id(f"add-to-cart-{product_id}").click()
+        
+    async def view_product_details(self, product_id: int):
+        """View product details"""
+        await self.by_test_id(f"view-details-{product_id}").click()
+        
+    def product_cards(self) -> Locator:
+        """Locator for the rendered product cards"""
+        return self.by_test_id(ProductsLocators.PRODUCTS_GRID).locator(ProductsLocators.PRODUCT_CARD)
+        
+    async def get_product_count(self) -> int:
+        """Get number of displayed products"""
+        await self.by_test_id(ProductsLocators.LOADING_INDICATOR).wait_for(state="hidden", timeout=5000)
+        return await self.product_cards().count()
+        
+    async def read_cards(self) -> list[dict]:
+        """Read every displayed card ({id, name, category, price, stock}) in one evaluate"""
+        await self.wait_for_results()
+        return await self.product_cards().evaluate_all(READ_CARDS_SCRIPT)
+        
+    async def is_no_products_message_shown(self) -> bool:
+        """Check if no products message is displayed"""
+        return await self.by_test_id(ProductsLocators.NO_PRODUCTS_MESSAGE).is_visible()
+
+class CheckoutPage(BasePage):
+    """Checkout page business API"""
+    
+    path = "/checkout"
+    
+    async def navigate(self):
+        """Go to checkout page"""
+        await self.goto(self.path)
+        
+    async def fill_shipping_info(self, address: str, city: str):
+        """Fill shipping information"""
+        await self.by_test_id(CheckoutLocators.SHIPPING_ADDRESS_INPUT).fill(address)
+        await self.by_test_id(CheckoutLocators.SHIPPING_CITY_INPUT).fill(city)
+        
+    async def accept_terms(self):
+        """Accept terms and conditions"""
+        await self.by_test_id(CheckoutLocators.ACCEPT_TERMS_CHECKBOX).check()
+        
+    async def place_order(self):
+        """Place the order"""
+        await self.by_test_id(CheckoutLocators.PLACE_ORDER_BUTTON).click()
+        
+    async def complete_checkout(self, address: str, city: str):
+        """Complete full checkout process"""
+        await self.fill_shipping_info(address, city)
+        await self.accept_terms()
+        await self.place_order()
+        
+    async def get_checkout_message(self) -> str:
+        """Get checkout message"""
+        return await self.visible_text(CheckoutLocators.CHECKOUT_MESSAGE)
+
+class DashboardPage(BasePage):
+    """Dashboard page business API"""
+    
+    path = "/dashboard"
+    
+    async def navigate(self):
+        """Go to dashboard page"""
+        await self.goto(self.path)
+        
+    async def is_admin_badge_visible(self) -> bool:
+        """Check if admin badge is displayed"""
+        return await self.by_test_id(DashboardLocators.ADMIN_BADGE).is_visible()
+            
+    async def view_profile(self):
+        """Go to profile page"""
+        await self.by_test_id(DashboardLocators.VIEW_PROFILE_LINK).click()
+        
+    async def logout(self):
+        """Logout from dashboard"""
+        await self.by_test_id(DashboardLocators.LOGOUT_BUTTON).click()
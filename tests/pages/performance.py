@@ -0,0 +1,165 @@
+"""
+Performance Instrumentation - Browser timing for page objects
+After a navigation, one page.evaluate reads Navigation Timing (including the
+server's Server-Timing phases), paint, Resource Timing, LCP, CLS, long-task and
+User Timing mark entries; results are aggregated per route across the suite
+and checked against optional budgets
+"""
+import html
+import json
+import math
+from collections import defaultdict
+from pathlib import Path
+from urllib.parse import urlparse
+
+from playwright.sync_api import Page
+
+# Buffered observers hand back entries recorded before the observer existed,
+# so no init script is needed; takeRecords() drains them synchronously
+COLLECT_METRICS_SCRIPT = """() => {
+    const take = (type) => {
+        try {
+            const observer = new PerformanceObserver(() => {});
+            observer.observe({ type, buffered: true });
+            const entries = observer.takeRecords();
+            observer.disconnect();
+            return entries;
+        } catch (error) {
+            return [];
+        }
+    };
+    const nav = performance.getEntriesByType('navigation')[0];
+    const paint = performance.getEntriesByName('first-contentful-paint')[0];
+    const lcp = take('largest-contentful-paint');
+    const shifts = take('layout-shift').filter((entry) => !entry.hadRecentInput);
+    const longTasks = take('longtask');
+    const resources = performance.getEntriesByType('resource');
+    const metrics = {
+        ttfb: nav ? nav.responseStart : null,
+        dom_content_loaded: nav ? nav.domContentLoadedEventEnd : null,
+        load: nav ? nav.loadEventEnd : null,
+        fcp: paint ? paint.startTime : null,
+        lcp: lcp.length ? lcp[lcp.length - 1].startTime : null,
+        cls: shifts.reduce((sum, entry) => sum + entry.value, 0),
+        long_task_count: longTasks.length,
+        long_task_ms: longTasks.reduce((sum, entry) => sum + entry.duration, 0),
+        resource_count: resources.length,
+        resource_bytes: resources.reduce((sum, entry) => sum + (entry.transferSize || 0), 0),
+        slowest_resource_ms: resources.reduce((max, entry) => Math.max(max, entry.duration), 0),
+    };
+    for (const mark of performance.getEntriesByType('mark')) {
+        metrics[mark.name] = mark.startTime;
+    }
+    // Server-Timing phases from app.py (see server_timing.py)
+    for (const entry of (nav && nav.serverTiming) || []) {
+        metrics[`server_${entry.name.replace(/-/g, '_')}`] = entry.duration;
+    }
+    return metrics;
+}"""
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile"""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+def parse_budget(spec: str) -> tuple[str, str, float]:
+    """'/products:time_to_first_product=1500' -> ('/products', 'time_to_first_product', 1500.0)"""
+    route, _, limit = spec.partition(":")
+    metric, _, value = limit.partition("=")
+    if not route.startswith("/") or not metric or not value:
+        raise ValueError(f"Budget must look like /route:metric=max, got {spec!r}")
+    return route, metric, float(value)
+
+class MetricsReport:
+    """Suite-wide samples per route and metric"""
+
+    def __init__(self):
+        self.samples = defaultdict(lambda: defaultdict(list))
+
+    def add(self, route: str, metrics: dict):
+        for name, value in metrics.items():
+            if value is not None:
+                self.samples[route][name].append(value)
+
+    def raw(self) -> dict:
+        """Samples as plain dicts and lists, e.g. to ship from an xdist worker"""
+        return {route: dict(metrics) for route, metrics in self.samples.items()}
+
+    def merge(self, samples: dict):
+        """Add another report's raw() samples"""
+        for route, metrics in samples.items():
+            for name, values in metrics.items():
+                self.samples[route][name].extend(values)
+
+    def summary(self) -> dict:
+        return {
+            route: {
+                name: {
+                    "count": len(values),
+                    "p50": round(percentile(values, 50), 3),
+                    "p95": round(percentile(values, 95), 3),
+                    "max": round(max(values), 3),
+                }
+                for name, values in sorted(metrics.items())
+            }
+            for route, metrics in sorted(self.samples.items())
+        }
+
+    def write_json(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.summary(), indent=2))
+
+    def write_html(self, path: Path):
+        sections = []
+        for route, metrics in self.summary().items():
+            rows = "".join(
+                f"<tr><td>{html.escape(name)}</td><td>{stats['count']}</td><td>{stats['p50']}</td>"
+                f"<td>{stats['p95']}</td><td>{stats['max']}</td></tr>"
+                for name, stats in metrics.items()
+            )
+            sections.append(
+                f"<h2>{html.escape(route)}</h2><table><tr><th>metric</th><th>n</th>"
+                f"<th>p50</th><th>p95</th><th>max</th></tr>{rows}</table>"
+            )
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            "<!DOCTYPE html><html><head><meta charset='utf-8'><title>Browser performance</title>"
+            "<style>body{font-family:sans-serif}table{border-collapse:collapse;margin-bottom:2em}"
+            "td,th{border:1px solid #ccc;padding:4px 10px;text-align:right}td:first-child{text-align:left}</style>"
+            f"</head><body><h1>Browser performance (ms unless noted; cls is unitless)</h1>{''.join(sections)}</body></html>"
+        )
+
+class PerformanceProbe:
+    """
+    Per-test metrics collector handed to page objects
+    Adds every sample to the suite report and enforces budgets {route: {metric: max}}
+    """
+
+    # The server samples 1% of requests by default; probed pages ask for every one
+    REQUEST_HEADERS = {"X-Server-Timing": "1"}
+
+    def __init__(self, report: MetricsReport | None = None, budgets: dict | None = None):
+        self.report = report
+        self.budgets = budgets or {}
+
+    def attach(self, page: Page):
+        """Force Server-Timing on this page's requests so server_* metrics are always reported"""
+        page.set_extra_http_headers(self.REQUEST_HEADERS)
+
+    def collect(self, page: Page) -> dict:
+        """Read the current document's performance entries"""
+        metrics = page.evaluate(COLLECT_METRICS_SCRIPT)
+        route = urlparse(page.url).path or "/"
+        if self.report is not None:
+            self.report.add(route, metrics)
+        self.check_budgets(route, metrics)
+        return metrics
+
+    def check_budgets(self, route: str, metrics: dict):
+        exceeded = [
+            f"{name}={metrics[name]:.0f} > {limit:.0f}"
+            for name, limit in self.budgets.get(route, {}).items()
+            if metrics.get(name) is not None and metrics[name] > limit
+        ]
+        assert not exceeded, f"Performance budget exceeded on {route}: {', '.join(exceeded)}"
@@ -0,0 +1,91 @@
+"""
+Browser Performance Report - Suite-wide page metrics
+--perf-metrics attaches a PerformanceProbe to every page object and writes
+per-route p50/p95 tables to perf-results/browser-metrics.{json,html};
+--perf-budget and @pytest.mark.perf_budget fail tests that exceed a limit
+"""
+from pathlib import Path
+
+import pytest
+
+from tests.pages.performance import MetricsReport, PerformanceProbe, parse_budget
+
+METRICS_DIR = Path("perf-results")
+METRICS_REPORT_KEY = pytest.StashKey[MetricsReport]()
+WORKER_OUTPUT_KEY = "browser_metrics"
+
+def pytest_addoption(parser):
+    group = parser.getgroup("perf-metrics", "Browser performance metrics")
+    group.addoption(
+        "--perf-metrics",
+        action="store_true",
+        default=False,
+        help="Collect navigation/paint/LCP/CLS/long-task timings and write perf-results/browser-metrics.*",
+    )
+    group.addoption(
+        "--perf-budget",
+        action="append",
+        default=[],
+        metavar="ROUTE:METRIC=MS",
+        help="Fail a test when a metric exceeds the limit, e.g. /products:time_to_first_product=1500",
+    )
+
+def pytest_configure(config):
+    for spec in config.getoption("perf_budget"):
+        try:
+            parse_budget(spec)
+        except ValueError as error:
+            raise pytest.UsageError(str(error))
+    if config.getoption("perf_metrics"):
+        config.stash[METRICS_REPORT_KEY] = MetricsReport()
+
+def budgets_for(request) -> dict:
+    """Command-line budgets overlaid with the test's perf_budget markers"""
+    budgets = {}
+    for spec in request.config.getoption("perf_budget"):
+        route, metric, limit = parse_budget(spec)
+        budgets.setdefault(route, {})[metric] = limit
+    for marker in reversed(list(request.node.iter_markers("perf_budget"))):
+        budgets.setdefault(marker.args[0], {}).update(marker.kwargs)
+    return budgets
+
+@pytest.fixture
+def perf_probe(request) -> PerformanceProbe | None:
+    """Probe for page objects; None when neither metrics nor budgets are requested"""
+    report = request.config.stash.get(METRICS_REPORT_KEY, None)
+    budgets = budgets_for(request)
+    if report is None and not budgets:
+        return None
+    return PerformanceProbe(report, budgets)
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """xdist controller: fold a finished worker's samples into the suite report"""
+    report = node.config.stash.get(METRICS_REPORT_KEY, None)
+    samples = getattr(node, "workeroutput", {}).get(WORKER_OUTPUT_KEY)
+    if report is not None and samples:
+        report.merge(samples)
+
+def pytest_sessionfinish(session):
+    report = session.config.stash.get(METRICS_REPORT_KEY, None)
+    if report is None or not report.samples:
+        return
+    if hasattr(session.config, "workeroutput"):
+        # Workers hand their samples to the controller, which writes one report
+        session.config.workeroutput[WORKER_OUTPUT_KEY] = report.raw()
+        return
+    report.write_json(METRICS_DIR / "browser-metrics.json")
+    report.write_html(METRICS_DIR / "browser-metrics.html")
+
+def pytest_terminal_summary(terminalreporter, config):
+    report = config.stash.get(METRICS_REPORT_KEY, None)
+    if report is None or not report.samples:
+        return
+    terminalreporter.section("browser performance (ms, p50 / p95)")
+    for route, metrics in report.summary().items():
+        terminalreporter.write_line(route)
+        for name, stats in metrics.items():
+            terminalreporter.write_line(
+                f"  {name:<24} n={stats['count']:<4} p50 {stats['p50']:>10}  p95 {stats['p95']:>10}"
+            )
+    terminalreporter.write_line(f"report: {METRICS_DIR / 'browser-metrics.html'}")
@@ -0,0 +1,94 @@
+"""
+Run Profiles - Browser launch presets
+Bundle headless mode, slow_mo, viewport, tracing and launch args under one name
+so a run is configured with a single flag: --run-profile debug|ci|perf
+"""
+import os
+import sys
+from dataclasses import dataclass, field, replace
+
+import pytest
+
+@dataclass(frozen=True)
+class RunProfile:
+    """Browser settings applied by the browser and page fixtures"""
+    name: str
+    headless: bool
+    slow_mo: int
+    viewport: dict = field(default_factory=lambda: {"width": 1280, "height": 720})
+    tracing: str = "off"
+    trace_sources: bool = False  # embed test source files in every trace
+    launch_args: tuple = ()
+
+    def launch_options(self) -> dict:
+        """Keyword arguments for browser_type.launch()"""
+        return {"headless": self.headless, "slow_mo": self.slow_mo, "args": list(self.launch_args)}
+
+PROFILES = {
+    # Watch the browser: headed, slowed down, every test traced
+    "debug": RunProfile(name="debug", headless=False, slow_mo=500, tracing="on", trace_sources=True),
+    # Non-interactive default: headless, full speed, traces kept only for failures,
+    # without sources so passing tests do not pay for collecting them
+    "ci": RunProfile(name="ci", headless=True, slow_mo=0, tracing="retain-on-failure"),
+    # Benchmarking: headless, full speed, smaller viewport, background work disabled
+    "perf": RunProfile(
+        name="perf",
+        headless=True,
+        slow_mo=0,
+        viewport={"width": 1024, "height": 640},
+        launch_args=(
+            "--disable-extensions",
+            "--disable-background-networking",
+            "--disable-background-timer-throttling",
+            "--disable-renderer-backgrounding",
+            "--disable-dev-shm-usage",
+            "--no-first-run",
+            "--mute-audio",
+        ),
+    ),
+}
+
+RUN_PROFILE_KEY = pytest.StashKey[RunProfile]()
+
+def default_profile_name() -> str:
+    """debug for a developer at a terminal, ci for everything else"""
+    if os.getenv("RUN_PROFILE"):
+        return os.environ["RUN_PROFILE"]
+    interactive = sys.stdout.isatty() and not os.getenv("CI")
+    return "debug" if interactive else "ci"
+
+def resolve_profile(config) -> RunProfile:
+    """Selected profile with pytest-playwright's --headed/--slowmo/--tracing applied on top"""
+    name = config.getoption("run_profile") or default_profile_name()
+    if name not in PROFILES:
+        raise pytest.UsageError(f"Unknown run profile {name!r}, expected one of {sorted(PROFILES)}")
+    profile = PROFILES[name]
+    if config.getoption("headed"):
+        profile = replace(profile, headless=False)
+    if config.getoption("slowmo"):
+        profile = replace(profile, slow_mo=config.getoption("slowmo"))
+    if config.getoption("tracing") != "off":
+        profile = replace(profile, tracing=config.getoption("tracing"))
+    return profile
+
+def pytest_addoption(parser):
+    parser.getgroup("playwright").addoption(
+        "--run-profile",
+        choices=sorted(PROFILES),
+        default=None,
+        help="Browser run profile (default: debug on an interactive terminal, otherwise ci; "
+             "or set RUN_PROFILE)",
+    )
+
+def pytest_configure(config):
+    config.stash[RUN_PROFILE_KEY] = resolve_profile(config)
+
+def pytest_report_header(config):
+    profile = config.stash[RUN_PROFILE_KEY]
+    mode = "headless" if profile.headless else "headed"
+    return f"run profile: {profile.name} ({mode}, slow_mo={profile.slow_mo}ms, tracing={profile.tracing})"
+
+@pytest.fixture(scope="session")
+def run_profile(pytestconfig) -> RunProfile:
+    """Active run profile"""
+    return pytestconfig.stash[RUN_PROFILE_KEY]
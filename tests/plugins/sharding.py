@@ -0,0 +1,133 @@
+"""
+Sharding Plugin - Duration-aware test distribution
+Records how long every test takes in a local history file and uses it to split
+the suite into balanced shards (longest-processing-time-first) and to run the
+slowest tests first, so no worker is left finishing one long test at the end
+
+    pytest tests/ --store-durations                      # refresh the history
+    pytest tests/ --num-shards 4 --shard-id 0            # one CI job per shard id
+    pytest tests/ -n 4 --slow-first                      # xdist: start the long tests first
+"""
+import heapq
+import json
+import os
+import statistics
+from pathlib import Path
+
+import pytest
+
+DURATIONS_PATH = Path(".test_durations.json")
+DEFAULT_SECONDS = 1.0
+# Weight of the newest run when folding it into the history
+SMOOTHING = 0.5
+
+def load_durations(path: Path) -> dict[str, float]:
+    """Duration history, empty when the file does not exist yet"""
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+def save_durations(path: Path, durations: dict[str, float]):
+    temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    temp_path.write_text(json.dumps(dict(sorted(durations.items())), indent=1))
+    os.replace(temp_path, path)
+
+def merge_durations(history: dict[str, float], latest: dict[str, float]) -> dict[str, float]:
+    """Exponentially smoothed history, so one noisy run does not reshuffle the shards"""
+    merged = dict(history)
+    for nodeid, seconds in latest.items():
+        previous = history.get(nodeid)
+        merged[nodeid] = round(seconds if previous is None else SMOOTHING * seconds + (1 - SMOOTHING) * previous, 4)
+    return merged
+
+def estimate(nodeids: list[str], history: dict[str, float]) -> dict[str, float]:
+    """Expected seconds per test; tests without history get the median of the known ones"""
+    known = [history[nodeid] for nodeid in nodeids if nodeid in history]
+    fallback = statistics.median(known) if known else DEFAULT_SECONDS
+    return {nodeid: history.get(nodeid, fallback) for nodeid in nodeids}
+
+def partition_lpt(weights: dict[str, float], num_shards: int) -> list[list[str]]:
+    """Longest-processing-time-first: each test, slowest first, goes to the least loaded shard"""
+    shards = [[] for _ in range(num_shards)]
+    loads = [(0.0, shard_id) for shard_id in range(num_shards)]
+    for nodeid, seconds in sorted(weights.items(), key=lambda item: (-item[1], item[0])):
+        load, shard_id = heapq.heappop(loads)
+        shards[shard_id].append(nodeid)
+        heapq.heappush(loads, (load + seconds, shard_id))
+    return shards
+
+def partition_by_file(weights: dict[str, float], num_shards: int) -> list[list[str]]:
+    """Naive baseline: whole test files dealt round-robin in path order"""
+    files = sorted({nodeid.split("::")[0] for nodeid in weights})
+    shard_of_file = {path: index % num_shards for index, path in enumerate(files)}
+    shards = [[] for _ in range(num_shards)]
+    for nodeid in sorted(weights):
+        shards[shard_of_file[nodeid.split("::")[0]]].append(nodeid)
+    return shards
+
+def makespan(shards: list[list[str]], weights: dict[str, float]) -> float:
+    """Wall time of the slowest shard"""
+    return max((sum(weights[nodeid] for nodeid in shard) for shard in shards), default=0.0)
+
+class DurationRecorder:
+    """Collects per-test durations and folds them into the history at session end"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.latest = {}
+
+    def pytest_runtest_logreport(self, report):
+        self.latest[report.nodeid] = self.latest.get(report.nodeid, 0.0) + report.duration
+
+    def pytest_sessionfinish(self, session):
+        if hasattr(session.config, "workerinput"):
+            return  # the xdist controller sees every report and writes the file once
+        save_durations(self.path, merge_durations(load_durations(self.path), self.latest))
+
+def pytest_addoption(parser):
+    group = parser.getgroup("sharding", "Duration-aware sharding")
+    group.addoption("--store-durations", action="store_true", default=False,
+                    help="Record test durations into the history file")
+    group.addoption("--durations-path", type=Path, default=DURATIONS_PATH,
+                    help=f"Duration history file (default: {DURATIONS_PATH})")
+    group.addoption("--num-shards", type=int, default=1,
+                    help="Split the suite into this many duration-balanced shards")
+    group.addoption("--shard-id", type=int, default=0,
+                    help="Which shard (0-based) this run executes")
+    group.addoption("--slow-first", action="store_true", default=False,
+                    help="Run the slowest tests first (implied by --num-shards)")
+
+def pytest_configure(config):
+    num_shards, shard_id = config.getoption("num_shards"), config.getoption("shard_id")
+    if num_shards < 1 or not 0 <= shard_id < num_shards:
+        raise pytest.UsageError(f"--shard-id must be in [0, {num_shards}) and --num-shards >= 1")
+    if config.getoption("store_durations"):
+        config.pluginmanager.register(DurationRecorder(config.getoption("durations_path")), "duration_recorder")
+
+def pytest_collection_modifyitems(config, items):
+    num_shards = config.getoption("num_shards")
+    if num_shards == 1 and not config.getoption("slow_first"):
+        return
+    weights = estimate([item.nodeid for item in items], load_durations(config.getoption("durations_path")))
+
+    selected = items
+    if num_shards > 1:
+        shards = partition_lpt(weights, num_shards)
+        in_shard = set(shards[config.getoption("shard_id")])
+        selected = [item for item in items if item.nodeid in in_shard]
+        config.hook.pytest_deselected(items=[item for item in items if item.nodeid not in in_shard])
+        config.stash[SHARD_SUMMARY_KEY] = (makespan(shards, weights), makespan(partition_by_file(weights, num_shards), weights))
+
+    # Stable sort keeps the collection order among tests of equal weight
+    selected.sort(key=lambda item: -weights[item.nodeid])
+    items[:] = selected
+
+SHARD_SUMMARY_KEY = pytest.StashKey[tuple]()
+
+def pytest_report_collectionfinish(config, items):
+    summary = config.stash.get(SHARD_SUMMARY_KEY, None)
+    if summary is None:
+        return None
+    balanced, by_file = summary
+    return (f"shard {config.getoption('shard_id')}/{config.getoption('num_shards')}: {len(items)} tests, "
+            f"estimated makespan {balanced:.1f}s (file-based split: {by_file:.1f}s)")
@@ -0,0 +1,79 @@
+"""
+Timing Report - Per-test duration capture
+Records setup/call/teardown time for every test and writes them to
+perf-results/timings/<label>.json so runs under different profiles can be compared
+"""
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from tests.plugins.run_profiles import RUN_PROFILE_KEY
+
+TIMINGS_DIR = Path("perf-results") / "timings"
+
+class TimingRecorder:
+    """Collects phase durations from test reports (registered as a pytest plugin)"""
+
+    def __init__(self, label: str, directory: Path = TIMINGS_DIR):
+        self.label = label
+        self.path = directory / f"{label}.json"
+        self.tests = {}
+        self.started = time.time()
+        self.finished = None
+
+    @property
+    def suite_seconds(self) -> float:
+        return round((self.finished or time.time()) - self.started, 3)
+
+    def to_dict(self) -> dict:
+        return {"label": self.label, "suite_seconds": self.suite_seconds, "tests": self.tests}
+
+    def pytest_runtest_logreport(self, report):
+        entry = self.tests.setdefault(
+            report.nodeid, {"setup": 0.0, "call": 0.0, "teardown": 0.0, "outcome": "passed"}
+        )
+        entry[report.when] = round(report.duration, 4)
+        if report.failed or (report.skipped and report.when != "teardown"):
+            entry["outcome"] = report.outcome
+
+    def pytest_sessionfinish(self):
+        self.finished = time.time()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.to_dict(), indent=2))
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.tests:
+            return
+        terminalreporter.section(f"per-test duration ({self.label})")
+        for nodeid, entry in sorted(self.tests.items(), key=lambda item: -total_seconds(item[1])):
+            terminalreporter.write_line(
+                f"{total_seconds(entry):8.3f}s  setup {entry['setup']:6.3f}  call {entry['call']:7.3f}  "
+                f"teardown {entry['teardown']:6.3f}  {nodeid}"
+            )
+        terminalreporter.write_line(f"suite wall time: {self.suite_seconds:.2f}s -> {self.path}")
+
+def total_seconds(entry: dict) -> float:
+    """Total time a test occupied its worker"""
+    return entry["setup"] + entry["call"] + entry["teardown"]
+
+def pytest_addoption(parser):
+    group = parser.getgroup("timing", "Timing report")
+    group.addoption(
+        "--timing-report",
+        action="store_true",
+        default=False,
+        help="Print per-test durations and save them to perf-results/timings/",
+    )
+    group.addoption(
+        "--timing-label",
+        default=None,
+        help="File name for the saved timings (default: the run profile name)",
+    )
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config):
+    if config.getoption("timing_report"):
+        label = config.getoption("timing_label") or config.stash[RUN_PROFILE_KEY].name
+        config.pluginmanager.register(TimingRecorder(label), "timing_recorder")
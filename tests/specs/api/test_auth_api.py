@@ -0,0 +1,59 @@
+"""
+Auth API Tests
+Demonstrates: Login, registration and profile rules checked over HTTP (no browser needed)
+"""
+import uuid
+
+import pytest
+
+from tests.api.clients import AuthClient, ProfileClient
+
+pytestmark = pytest.mark.api
+
+def unique_username() -> str:
+    return f"api_{uuid.uuid4().hex[:12]}"
+
+def test_login_returns_role(auth_api: AuthClient):
+    result = auth_api.login("admin", "admin123")
+    
+    assert result.ok and result.success
+    assert result.role == "admin"
+
+def test_login_rejects_wrong_password(auth_api: AuthClient):
+    result = auth_api.login("testuser", "wrong-password")
+    
+    assert result.status == 401
+    assert not result.success
+
+@pytest.mark.usefixtures("pristine_state")
+def test_register_then_login(auth_api: AuthClient):
+    username = unique_username()
+    
+    registered = auth_api.register(username, f"{username}@example.com", "secret123")
+    
+    assert registered.ok and registered.success
+    assert auth_api.login(username, "secret123").role == "user"
+
+@pytest.mark.usefixtures("pristine_state")
+def test_register_rejects_taken_username(auth_api: AuthClient):
+    result = auth_api.register("testuser", "other@example.com", "secret123")
+    
+    assert result.status == 400
+    assert not result.success
+
+def test_update_profile_requires_login(api_request):
+    result = ProfileClient(api_request).update_profile("nobody@example.com")
+    
+    assert result.status == 401
+    assert not result.success
+
+@pytest.mark.usefixtures("pristine_state")
+def test_update_profile_changes_email(auth_api: AuthClient):
+    username = unique_username()
+    auth_api.register(username, f"{username}@example.com", "secret123")
+    auth_api.login(username, "secret123")
+    
+    result = ProfileClient(auth_api.request).update_profile(f"{username}@new.example.com")
+    
+    assert result.ok and result.success
+    assert f"{username}@new.example.com" in auth_api.request.get("/profile").text()
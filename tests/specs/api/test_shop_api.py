@@ -0,0 +1,46 @@
+"""
+Shop API Tests
+Demonstrates: Product filtering and order placement rules checked over HTTP (no browser needed)
+"""
+import pytest
+
+from tests.api.clients import OrdersClient, ProductsClient
+
+pytestmark = pytest.mark.api
+
+def test_category_filter_returns_only_that_category(products_api: ProductsClient):
+    everything = products_api.list()
+    
+    electronics = products_api.list(category="Electronics")
+    
+    assert 0 < len(electronics) < len(everything)
+    assert {product["category"] for product in electronics} == {"Electronics"}
+
+def test_search_is_case_insensitive(products_api: ProductsClient):
+    products = products_api.list(search="LAPTOP")
+    
+    assert products
+    assert all("laptop" in product["name"].lower() for product in products)
+
+def test_price_range_and_stock_filters(products_api: ProductsClient):
+    products = products_api.list(min_price=50, max_price=500, in_stock=True)
+    
+    assert products
+    assert all(50 <= product["price"] <= 500 and product["stock"] > 0 for product in products)
+
+def test_unknown_search_returns_empty_list(products_api: ProductsClient):
+    assert products_api.list(search="xyznonexistent") == []
+
+def test_place_order_requires_login(api_request):
+    result = OrdersClient(api_request).place_order([{"id": 1, "quantity": 1}], "123 Main St", "New York")
+    
+    assert result.status == 401
+    assert not result.success and result.order_id is None
+
+def test_logged_in_user_can_place_order(api_request_as):
+    orders = OrdersClient(api_request_as("user"))
+    
+    result = orders.place_order([{"id": 1, "quantity": 2}], "123 Main St", "New York")
+    
+    assert result.ok and result.success
+    assert result.order_id
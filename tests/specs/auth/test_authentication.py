@@ -6,7 +6,7 @@ import pytest
 from playwright.sync_api import expect
 from tests.pages.app_pages import LoginPage, RegisterPage, DashboardPage
 
-def test_successful_login_with_test_ids(login_page: LoginPage, page):
+def test_successful_login_with_test_ids(login_page: LoginPage, page, base_url):
     """
     Demonstrates: Test ID locators (get_by_test_id)
     Best Practice: Using test IDs for stable, deterministic element selection
@@ -19,7 +19,7 @@ def test_successful_login_with_test_ids(login_page: LoginPage, page):
     
     # THEN: User is redirected to dashboard
     page.wait_for_url("**/dashboard")
-    expect(page).to_have_url("http://127.0.0.1:5000/dashboard")
+    expect(page).to_have_url(f"{base_url}/dashboard")
     
 def test_login_with_invalid_credentials(login_page: LoginPage):
     """
@@ -36,14 +36,14 @@ def test_login_with_invalid_credentials(login_page: LoginPage):
     error_message = login_page.get_error_message()
     assert "Invalid username or password" in error_message
 
-def test_login_with_role_based_locators(page):
+def test_login_with_role_based_locators(page, base_url):
     """
     Demonstrates: Role-based locators (get_by_role)
     Best Practice: Highest priority locator strategy
     Accessibility: Ensures form elements have proper ARIA roles
     """
     # GIVEN: User navigates to login page
-    page.goto("http://127.0.0.1:5000/login")
+    page.goto(f"{base_url}/login")
     
     # WHEN: Using role-based locators to interact with form
     # Note: These work because our HTML has proper semantic structure
@@ -59,6 +59,7 @@ def test_login_with_role_based_locators(page):
     # THEN: Login succeeds
     page.wait_for_url("**/dashboard")
     
+@pytest.mark.usefixtures("pristine_state")
 def test_register_new_user(register_page: RegisterPage):
     """
     Demonstrates: Form filling with test ID locators
@@ -102,13 +103,13 @@ def test_register_with_mismatched_passwords(register_page: RegisterPage):
     error_message = register_page.get_error_message()
     assert "Passwords do not match" in error_message
 
-def test_login_remember_me_checkbox(page):
+def test_login_remember_me_checkbox(page, base_url):
     """
     Demonstrates: Checkbox interaction with test IDs
     Shows: State verification for checkboxes
     """
     # GIVEN: User is on login page
-    page.goto("http://127.0.0.1:5000/login")
+    page.goto(f"{base_url}/login")
     
     # WHEN: User checks remember me
     checkbox = page.get_by_test_id("remember-checkbox")
@@ -132,16 +133,16 @@ def test_admin_login_shows_admin_badge(login_page: LoginPage, dashboard_page: Da
     # THEN: Admin badge is visible
     assert dashboard_page.is_admin_badge_visible()
 
-def test_navigation_links_on_login_page(page):
+def test_navigation_links_on_login_page(page, base_url):
     """
     Demonstrates: Link locators with test IDs
     Shows: Navigation between pages
     """
     # GIVEN: User is on login page
-    page.goto("http://127.0.0.1:5000/login")
+    page.goto(f"{base_url}/login")
     
     # WHEN: User clicks register link
     page.get_by_test_id("register-link").click()
     
     # THEN: User is on register page
-    expect(page).to_have_url("http://127.0.0.1:5000/register")
+    expect(page).to_have_url(f"{base_url}/register")
@@ -4,15 +4,16 @@ Demonstrates: Modal, tabs, dropdown, accordion, tables, alerts
 """
 import pytest
 from playwright.sync_api import expect
+from tests.components.common_components import ProgressBarComponent, ToastComponent
 import re
 
-def test_modal_open_and_close(page):
+def test_modal_open_and_close(page, base_url):
     """
     Demonstrates: Modal interaction
     Shows: Visibility toggling
     """
     # GIVEN: User is on components page
-    page.goto("http://127.0.0.1:5000/components")
+    page.goto(f"{base_url}/components")
     
     # Modal should not be visible initially
     modal = page.get_by_test_id("demo-modal")
@@ -30,12 +31,12 @@ def test_modal_open_and_close(page):
     # THEN: Modal is hidden
     expect(modal).to_be_hidden()
 
-def test_modal_confirm_action(page):
+def test_modal_confirm_action(page, base_url):
     """
     Demonstrates: Modal action buttons
     """
     # GIVEN: Modal is open
-    page.goto("http://127.0.0.1:5000/components")
+    page.goto(f"{base_url}/components")
     page.get_by_test_id("open-modal-button").click()
     
     # WHEN: User clicks confirm (will trigger alert in real app)
@@ -44,13 +45,13 @@ def test_modal_confirm_action(page):
     # THEN: Modal closes
     # expect(page.get_by_test_id("demo-modal")).to_be_hidden()
 
-def test_dropdown_menu_interaction(page):
+def test_dropdown_menu_interaction(page, base_url):
     """
     Demonstrates: Dropdown menu
     Shows: Menu toggle and option selection
     """
     # GIVEN: User is on components page
-    page.goto("http://127.0.0.1:5000/components")
+    page.goto(f"{base_url}/components")
     
     # Dropdown menu initially hidden
     dropdown_menu = page.get_by_test_id("dropdown-menu")
@@ -68,13 +69,13 @@ def test_dropdown_menu_interaction(page):
     # THEN: Selection is displayed
     expect(page.get_by_test_id("selected-option")).to_contain_text("Option 1")
 
-def test_tabs_navigation(page):
+def test_tabs_navigation(page, base_url):
     """
     Demonstrates: Tab navigation
     Shows: Role-based tab locators
     """
     # GIVEN: User is on components page
-    page.goto("http://127.0.0.1:5000/components")
+    page.goto(f"{base_url}/components")
     
     # Profile tab is active by default
     expect(page.get_by_test_id("tab-panel-profile")).to_be_visible()
@@ -93,13 +94,13 @@ def test_tabs_navigation(page):
     expect(page.get_by_test_id("tab-panel-notifications")).to_be_visible()
     expect(page.get_by_test_id("tab-panel-settings")).to_be_hidden()
 
-def test_tabs_with_role_locators(page):
+def test_tabs_with_role_locators(page, base_url):
     """
     Demonstrates: Using ARIA roles for tabs
     Shows: Accessibility-first approach
     """
     # GIVEN: User is on components page
-    page.goto("http://127.0.0.1:5000/components")
+    page.goto(f"{base_url}/components")
     
     # WHEN: Using role locators for tabs
     settings_tab = page.get_by_role("tab", name="Settings")
@@ -109,13 +110,13 @@ def test_tabs_with_role_locators(page):
     settings_panel = page.get_by_role("tabpanel", name="tab-panel-settings")
     expect(settings_panel).to_be_visible()
 
-def test_alert_notifications(page):
+def test_alert_notifications(page, base_url):
     """
     Demonstrates: Dynamic alert creation
     Shows: Temporary elements
     """
     # GIVEN: User is on components page
-    page.goto("http://127.0.0.1:5000/components")
+    page.goto(f"{base_url}/components")
     
     # WHEN: User triggers success alert
     page.get_by_test_id("show-success-alert").click()
@@ -129,13 +130,13 @@ def test_alert_notifications(page):
     # THEN: Error alert appears
     expect(page.get_by_test_id("alert-error")).to_be_visible()
 
-def test_accordion_expand_collapse(page):
+def test_accordion_expand_collapse(page, base_url):
     """
     Demonstrates: Accordion interaction
     Shows: Expand/collapse pattern
     """
     # GIVEN: User is on components page
-    page.goto("http://127.0.0.1:5000/components")
+    page.goto(f"{base_url}/components")
     
     # Content is hidden initially
     expect(page.get_by_test_id("accordion-content-1")).to_be_hidden()
@@ -152,13 +153,13 @@ def test_accordion_expand_collapse(page):
     # THEN: Content is hidden
     expect(page.get_by_test_id("accordion-content-1")).to_be_hidden()
 
-def test_data_table_structure(page):
+def test_data_table_structure(page, base_url):
     """
     Demonstrates: Table locators with roles
     Shows: Table cell access
     """
     # GIVEN: User is on components page
-    page.goto("http://127.0.0.1:5000/components")
+    page.goto(f"{base_url}/components")
     
     # WHEN: Examining table structure
     table = page.get_by_test_id("data-table")
@@ -174,13 +175,13 @@ def test_data_table_structure(page):
     # Cells use role="cell"
     expect(first_row.get_by_role("cell").first).to_be_visible()
 
-def test_data_table_row_actions(page):
+def test_data_table_row_actions(page, base_url):
     """
     Demonstrates: Action buttons in table rows
     Shows: Nested locators
     """
     # GIVEN: User is on components page
-    page.goto("http://127.0.0.1:5000/components")
+    page.goto(f"{base_url}/components")
     
     # WHEN: Clicking edit button in first row
     edit_button = page.get_by_test_id("edit-row-1")
@@ -190,51 +191,53 @@ def test_data_table_row_actions(page):
     delete_button = page.get_by_test_id("delete-row-1")
     expect(delete_button).to_be_visible()
 
-def test_progress_bar(page):
+def test_progress_bar(page, base_url):
     """
     Demonstrates: Progress bar with ARIA attributes
     Shows: Dynamic value updates
     """
     # GIVEN: User is on components page
-    page.goto("http://127.0.0.1:5000/components")
+    page.goto(f"{base_url}/components")
     
     # Progress bar starts at 0
     progress_bar = page.get_by_test_id("progress-bar")
     expect(progress_bar).to_have_attribute("aria-valuenow", "0")
     
     # WHEN: User starts progress
-    page.get_by_test_id("start-progress").click()
+    progress = ProgressBarComponent(page)
+    progress.start()
     
-    # THEN: Progress updates (wait a bit for animation)
-    page.wait_for_timeout(3000)
+    # THEN: Progress updates (polls aria-valuenow instead of sleeping)
+    progress.wait_until_advanced()
     
     # Progress text should show increase
-    progress_text = page.get_by_test_id("progress-text").text_content()
+    progress_text = progress.get_progress_text()
     assert progress_text != "0%", "Progress should have advanced"
 
-def test_toast_notification(page):
+def test_toast_notification(page, base_url):
     """
     Demonstrates: Toast notification (temporary pop-up)
     Shows: Animated elements
     """
     # GIVEN: User is on components page
-    page.goto("http://127.0.0.1:5000/components")
+    page.goto(f"{base_url}/components")
     
     # WHEN: User triggers toast
-    page.get_by_test_id("show-toast").click()
+    toast_component = ToastComponent(page)
+    toast_component.show()
     
     # THEN: Toast appears
-    page.wait_for_timeout(200)  # Wait for animation
+    toast_component.wait_until_shown()  # Wait for animation
     toast = page.get_by_test_id("toast-notification")
     expect(toast).to_be_visible()
 
-def test_table_filtering_by_status(page):
+def test_table_filtering_by_status(page, base_url):
     """
     Demonstrates: Filtering table rows
     Shows: Filter with has_text
     """
     # GIVEN: User is on components page
-    page.goto("http://127.0.0.1:5000/components")
+    page.goto(f"{base_url}/components")
     
     # WHEN: Finding all active users
     active_rows = (page
@@ -246,13 +249,13 @@ def test_table_filtering_by_status(page):
     count = active_rows.count()
     assert count >= 2, "Should have active users"
 
-def test_dropdown_with_role_menu(page):
+def test_dropdown_with_role_menu(page, base_url):
     """
     Demonstrates: Menu role for dropdown
     Shows: menuitem role for options
     """
     # GIVEN: User is on components page
-    page.goto("http://127.0.0.1:5000/components")
+    page.goto(f"{base_url}/components")
     
     # WHEN: Opening dropdown
     page.get_by_test_id("dropdown-toggle-button").click()
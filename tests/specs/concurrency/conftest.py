@@ -0,0 +1,22 @@
+"""
+conftest.py - Async fixtures for the concurrency specs
+Only this package drives playwright.async_api, so only it gets the async
+browser, its event loop and the async page objects
+"""
+from pathlib import Path
+
+import pytest
+
+from tests.fixtures.async_fixtures import *  # noqa: F401,F403
+
+PACKAGE_DIR = Path(__file__).parent
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(items):
+    """
+    Run this package before every sync spec
+    Once the session's sync Playwright has started, its loop counts as running
+    on the main thread and no asyncio loop can run there; the package-scoped
+    async fixtures are torn down before the first sync test starts it
+    """
+    items.sort(key=lambda item: not item.path.is_relative_to(PACKAGE_DIR))
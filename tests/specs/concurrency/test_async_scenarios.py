@@ -0,0 +1,85 @@
+"""
+Concurrent Scenario Tests
+Demonstrates: Async page objects, many isolated contexts driven from one event loop
+"""
+import asyncio
+
+import pytest
+from playwright.async_api import expect
+from tests.components.async_common_components import NavigationComponent
+from tests.pages.async_app_pages import DashboardPage, LoginPage, ProductsPage
+
+async def login_scenario(page, base_url: str, username: str, password: str):
+    login_page = LoginPage(page, base_url)
+    await login_page.navigate()
+    await login_page.login(username, password)
+    await page.wait_for_url("**/dashboard")
+    return await DashboardPage(page, base_url).is_admin_badge_visible()
+
+async def filter_scenario(page, base_url: str, category: str) -> int:
+    products_page = ProductsPage(page, base_url)
+    await products_page.navigate()
+    await products_page.filter_by_category(category)
+    return await products_page.get_product_count()
+
+async def search_scenario(page, base_url: str, term: str) -> int:
+    products_page = ProductsPage(page, base_url)
+    await products_page.navigate()
+    await products_page.search_products(term)
+    return await products_page.get_product_count()
+
+@pytest.mark.asyncio
+async def test_independent_scenarios_run_concurrently(new_async_page, base_url):
+    """
+    Demonstrates: asyncio.gather over isolated contexts
+    Shows: One worker keeping several pages busy at once
+    """
+    # GIVEN: One isolated page per scenario
+    pages = await asyncio.gather(*(new_async_page() for _ in range(5)))
+    
+    # WHEN: All scenarios run at the same time
+    user_badge, admin_badge, electronics, accessories, laptops = await asyncio.gather(
+        login_scenario(pages[0], base_url, "testuser", "password123"),
+        login_scenario(pages[1], base_url, "admin", "admin123"),
+        filter_scenario(pages[2], base_url, "Electronics"),
+        filter_scenario(pages[3], base_url, "Accessories"),
+        search_scenario(pages[4], base_url, "laptop"),
+    )
+    
+    # THEN: Each scenario saw only its own session and filters
+    assert not user_badge
+    assert admin_badge
+    assert electronics > 0 and accessories > 0
+    assert laptops >= 1
+
+@pytest.mark.asyncio
+async def test_concurrent_carts_are_isolated(new_async_page, base_url):
+    """
+    Demonstrates: Context isolation under concurrency
+    Shows: localStorage carts do not leak between contexts
+    """
+    # GIVEN: Two shoppers on the products page
+    shoppers = await asyncio.gather(new_async_page(), new_async_page())
+    await asyncio.gather(*(ProductsPage(page, base_url).navigate() for page in shoppers))
+    
+    # WHEN: Only the first shopper adds a product
+    await ProductsPage(shoppers[0], base_url).add_product_to_cart(1)
+    
+    # THEN: Only the first cart badge changes
+    await NavigationComponent(shoppers[0]).wait_for_cart_count(1)
+    await expect(shoppers[1].get_by_test_id("cart-count")).to_have_text("0")
+
+@pytest.mark.asyncio
+async def test_preloaded_admin_session(new_async_page, base_url):
+    """
+    Demonstrates: Async contexts created from cached storage state
+    """
+    # GIVEN: An admin page that never saw the login form
+    page = await new_async_page(role="admin")
+    
+    # WHEN: Opening the dashboard
+    dashboard = DashboardPage(page, base_url)
+    await dashboard.navigate()
+    
+    # THEN: Admin badge is visible
+    assert await dashboard.is_admin_badge_visible()
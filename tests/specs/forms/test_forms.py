@@ -6,13 +6,13 @@ import pytest
 from playwright.sync_api import expect
 import re
 
-def test_text_inputs_with_labels(page):
+def test_text_inputs_with_labels(page, base_url):
     """
     Demonstrates: Label locators (get_by_label)
     Best Practice: Using labels for form inputs
     """
     # GIVEN: User is on forms demo page
-    page.goto("http://127.0.0.1:5000/forms")
+    page.goto(f"{base_url}/forms")
     
     # WHEN: Filling text inputs using labels
     page.get_by_label("First Name").fill("John")
@@ -24,13 +24,13 @@ def test_text_inputs_with_labels(page):
     expect(page.get_by_label("Last Name")).to_have_value("Doe")
     expect(page.get_by_label("Email Address")).to_have_value("john@example.com")
 
-def test_select_dropdown(page):
+def test_select_dropdown(page, base_url):
     """
     Demonstrates: Select option locators
     Shows: Dropdown interaction
     """
     # GIVEN: User is on forms page
-    page.goto("http://127.0.0.1:5000/forms")
+    page.goto(f"{base_url}/forms")
     
     # WHEN: Selecting country from dropdown
     page.get_by_test_id("country-select").select_option("us")
@@ -38,13 +38,13 @@ def test_select_dropdown(page):
     # THEN: Option is selected
     expect(page.get_by_test_id("country-select")).to_have_value("us")
 
-def test_radio_buttons_with_roles(page):
+def test_radio_buttons_with_roles(page, base_url):
     """
     Demonstrates: Radio button locators using roles
     Shows: Single selection from group
     """
     # GIVEN: User is on forms page
-    page.goto("http://127.0.0.1:5000/forms")
+    page.goto(f"{base_url}/forms")
     
     # WHEN: Selecting size using role locators
     page.get_by_role("radio", name="Medium size").check()
@@ -56,13 +56,13 @@ def test_radio_buttons_with_roles(page):
     expect(page.get_by_role("radio", name="Small size")).not_to_be_checked()
     expect(page.get_by_role("radio", name="Large size")).not_to_be_checked()
 
-def test_checkboxes_multiple_selection(page):
+def test_checkboxes_multiple_selection(page, base_url):
     """
     Demonstrates: Checkbox locators
     Shows: Multiple selection capability
     """
     # GIVEN: User is on forms page
-    page.goto("http://127.0.0.1:5000/forms")
+    page.goto(f"{base_url}/forms")
     
     # WHEN: Checking multiple checkboxes
     page.get_by_role("checkbox", name="Subscribe to newsletter").check()
@@ -75,13 +75,13 @@ def test_checkboxes_multiple_selection(page):
     # Third checkbox remains unchecked
     expect(page.get_by_role("checkbox", name="Product updates")).not_to_be_checked()
 
-def test_date_input(page):
+def test_date_input(page, base_url):
     """
     Demonstrates: Date input locators
     Shows: Date field interaction
     """
     # GIVEN: User is on forms page
-    page.goto("http://127.0.0.1:5000/forms")
+    page.goto(f"{base_url}/forms")
     
     # WHEN: Filling date field
     page.get_by_test_id("birth-date-input").fill("2000-01-15")
@@ -89,13 +89,13 @@ def test_date_input(page):
     # THEN: Date is set
     expect(page.get_by_test_id("birth-date-input")).to_have_value("2000-01-15")
 
-def test_textarea(page):
+def test_textarea(page, base_url):
     """
     Demonstrates: Textarea locators
     Shows: Multi-line text input
     """
     # GIVEN: User is on forms page
-    page.goto("http://127.0.0.1:5000/forms")
+    page.goto(f"{base_url}/forms")
     
     # WHEN: Filling textarea
     comment_text = "This is a test comment with multiple lines.\nSecond line here."
@@ -104,13 +104,13 @@ def test_textarea(page):
     # THEN: Text is filled
     expect(page.get_by_test_id("comments-textarea")).to_have_value(comment_text)
 
-def test_form_validation_required_field(page):
+def test_form_validation_required_field(page, base_url):
     """
     Demonstrates: Form validation and error messages
     Shows: Required field validation
     """
     # GIVEN: User is on forms page
-    page.goto("http://127.0.0.1:5000/forms")
+    page.goto(f"{base_url}/forms")
     
     # WHEN: Filling form with valid data
     page.get_by_test_id("required-field-input").fill("Test Value")
@@ -124,13 +124,13 @@ def test_form_validation_required_field(page):
     expect(validation_message).to_be_visible()
     expect(validation_message).to_contain_text("successfully")
 
-def test_multi_step_form_navigation(page):
+def test_multi_step_form_navigation(page, base_url):
     """
     Demonstrates: Multi-step form with state management
     Shows: Step indicators and navigation
     """
     # GIVEN: User is on forms page
-    page.goto("http://127.0.0.1:5000/forms")
+    page.goto(f"{base_url}/forms")
     
     # WHEN: Starting multi-step form
     # Step 1
@@ -156,13 +156,13 @@ def test_multi_step_form_navigation(page):
     # THEN: Success message is shown
     expect(page.get_by_test_id("multistep-success")).to_be_visible()
 
-def test_multi_step_form_backward_navigation(page):
+def test_multi_step_form_backward_navigation(page, base_url):
     """
     Demonstrates: Backward navigation in multi-step form
     Shows: State preservation
     """
     # GIVEN: User is on step 2
-    page.goto("http://127.0.0.1:5000/forms")
+    page.goto(f"{base_url}/forms")
     page.get_by_test_id("step1-name-input").fill("Jane Doe")
     page.get_by_test_id("next-step-1").click()
     
@@ -175,13 +175,13 @@ def test_multi_step_form_backward_navigation(page):
     # AND: Previous input is preserved (this is basic - real app might preserve)
     # expect(page.get_by_test_id("step1-name-input")).to_have_value("Jane Doe")
 
-def test_placeholder_locators(page):
+def test_placeholder_locators(page, base_url):
     """
     Demonstrates: Placeholder locators (get_by_placeholder)
     Shows: Alternative to labels when appropriate
     """
     # GIVEN: User is on forms page
-    page.goto("http://127.0.0.1:5000/forms")
+    page.goto(f"{base_url}/forms")
     
     # WHEN: Using placeholder to find input
     email_input = page.get_by_placeholder("user@example.com")
@@ -190,13 +190,13 @@ def test_placeholder_locators(page):
     # THEN: Input is filled
     expect(email_input).to_have_value("test@test.com")
 
-def test_aria_described_by_for_help_text(page):
+def test_aria_described_by_for_help_text(page, base_url):
     """
     Demonstrates: ARIA describedby for accessibility
     Shows: Help text association
     """
     # GIVEN: User is on forms page
-    page.goto("http://127.0.0.1:5000/forms")
+    page.goto(f"{base_url}/forms")
     
     # WHEN: Checking email input
     email_input = page.get_by_label("Email Address")
@@ -204,13 +204,13 @@ def test_aria_described_by_for_help_text(page):
     # THEN: It has aria-describedby pointing to help text
     expect(email_input).to_have_attribute("aria-describedby", "email-help")
 
-def test_file_upload_input(page):
+def test_file_upload_input(page, base_url):
     """
     Demonstrates: File upload locators
     Shows: File input interaction
     """
     # GIVEN: User is on forms page
-    page.goto("http://127.0.0.1:5000/forms")
+    page.goto(f"{base_url}/forms")
     
     # WHEN: Setting file on input
     file_input = page.get_by_test_id("file-upload-input")
@@ -7,12 +7,10 @@ import re
 import pytest
 from playwright.sync_api import expect
 
-BASE_URL = "http://127.0.0.1:5000"
-
 
 @pytest.mark.i18n
-def test_navigation_labels_localized_to_spanish(page):
-    page.goto(f"{BASE_URL}/?lang=es")
+def test_navigation_labels_localized_to_spanish(page, base_url):
+    page.goto(f"{base_url}/?lang=es")
 
     expect(page.get_by_test_id("nav-home")).to_have_text("Inicio")
     expect(page.get_by_test_id("nav-products")).to_have_text("Productos")
@@ -20,8 +18,8 @@ def test_navigation_labels_localized_to_spanish(page):
 
 
 @pytest.mark.i18n
-def test_login_error_message_localized_to_spanish(page):
-    page.goto(f"{BASE_URL}/login?lang=es")
+def test_login_error_message_localized_to_spanish(page, base_url):
+    page.goto(f"{base_url}/login?lang=es")
 
     page.get_by_test_id("username-input").fill("invaliduser")
     page.get_by_test_id("password-input").fill("wrongpassword")
@@ -33,22 +31,22 @@ def test_login_error_message_localized_to_spanish(page):
 
 
 @pytest.mark.i18n
-def test_locale_switcher_persists_across_pages(page):
-    page.goto(f"{BASE_URL}/login")
+def test_locale_switcher_persists_across_pages(page, base_url):
+    page.goto(f"{base_url}/login")
 
     page.get_by_test_id("locale-es").click()
 
-    expect(page).to_have_url(f"{BASE_URL}/login")
+    expect(page).to_have_url(f"{base_url}/login")
     expect(page.get_by_role("heading", name="Inicia sesion en tu cuenta")).to_be_visible()
 
     page.get_by_test_id("nav-products").click()
-    expect(page).to_have_url(f"{BASE_URL}/products")
+    expect(page).to_have_url(f"{base_url}/products")
     expect(page.get_by_test_id("nav-home")).to_have_text("Inicio")
 
 
 @pytest.mark.i18n
-def test_login_error_message_defaults_to_english(page):
-    page.goto(f"{BASE_URL}/login?lang=en")
+def test_login_error_message_defaults_to_english(page, base_url):
+    page.goto(f"{base_url}/login?lang=en")
 
     page.get_by_test_id("username-input").fill("invaliduser")
     page.get_by_test_id("password-input").fill("wrongpassword")
@@ -60,8 +58,8 @@ def test_login_error_message_defaults_to_english(page):
 
 
 @pytest.mark.i18n
-def test_locale_aware_date_number_currency_for_english(page):
-    page.goto(f"{BASE_URL}/?lang=en")
+def test_locale_aware_date_number_currency_for_english(page, base_url):
+    page.goto(f"{base_url}/?lang=en")
 
     expect(page.get_by_test_id("locale-demo-date")).to_have_text("02/16/2026")
     expect(page.get_by_test_id("locale-demo-number")).to_have_text("1,234,567.89")
@@ -69,8 +67,8 @@ def test_locale_aware_date_number_currency_for_english(page):
 
 
 @pytest.mark.i18n
-def test_locale_aware_date_number_currency_for_spanish(page):
-    page.goto(f"{BASE_URL}/?lang=es")
+def test_locale_aware_date_number_currency_for_spanish(page, base_url):
+    page.goto(f"{base_url}/?lang=es")
 
     expect(page.get_by_test_id("locale-demo-date")).to_have_text("16/02/2026")
     expect(page.get_by_test_id("locale-demo-number")).to_have_text("1.234.567,89")
@@ -7,16 +7,17 @@ from playwright.sync_api import expect
 from tests.pages.app_pages import ProductsPage
 import re
 
+@pytest.mark.perf_budget("/products", time_to_first_product=3000)
 def test_products_page_loads_successfully(products_page: ProductsPage):
     """
     Demonstrates: Page load verification
     Best Practice: Verify key elements are present
+    Shows: A performance budget on time-to-first-product
     """
     # GIVEN/WHEN: User navigates to products page
     products_page.navigate()
     
     # THEN: Products are loaded and displayed
-    products_page.page.get_by_test_id("loading-indicator").wait_for(state="hidden")
     product_count = products_page.get_product_count()
     assert product_count > 0, "Products should be loaded"
 
@@ -27,14 +28,12 @@ def test_filter_products_by_category(products_page: ProductsPage):
     """
     # GIVEN: User is on products page
     products_page.navigate()
-    products_page.page.get_by_test_id("loading-indicator").wait_for(state="hidden")
     
     # Get initial product count
     initial_count = products_page.get_product_count()
     
     # WHEN: User filters by Electronics category
     products_page.filter_by_category("Electronics")
-    products_page.page.get_by_test_id("loading-indicator").wait_for(state="hidden")
     
     # THEN: Filtered products are shown
     filtered_count = products_page.get_product_count()
@@ -47,17 +46,28 @@ def test_search_products_by_name(products_page: ProductsPage):
     """
     # GIVEN: User is on products page
     products_page.navigate()
-    products_page.page.get_by_test_id("loading-indicator").wait_for(state="hidden")
     
     # WHEN: User searches for "laptop"
     products_page.search_products("laptop")
-    products_page.page.wait_for_timeout(500)  # Debounce delay
-    products_page.page.get_by_test_id("loading-indicator").wait_for(state="hidden")
     
     # THEN: Only matching products are shown
     product_count = products_page.get_product_count()
     assert product_count >= 1, "Should find laptop products"
 
+def test_search_box_suggests_product_names(products_page: ProductsPage):
+    """
+    Demonstrates: Waiting on a specific API response before reading a datalist
+    Shows: Instant autocomplete from /api/products/suggest
+    """
+    # GIVEN: User is on products page
+    products_page.navigate()
+    
+    # WHEN: User types the start of a word in a product name
+    suggestions = products_page.get_suggestions("mou")
+    
+    # THEN: Matching product names are offered
+    assert suggestions == ["Wireless Mouse"]
+
 def test_clear_filters_resets_products(products_page: ProductsPage):
     """
     Demonstrates: Button click actions
@@ -65,15 +75,12 @@ def test_clear_filters_resets_products(products_page: ProductsPage):
     """
     # GIVEN: User has applied filters
     products_page.navigate()
-    products_page.page.get_by_test_id("loading-indicator").wait_for(state="hidden")
     initial_count = products_page.get_product_count()
     
     products_page.filter_by_category("Accessories")
-    products_page.page.get_by_test_id("loading-indicator").wait_for(state="hidden")
     
     # WHEN: User clears filters
     products_page.clear_filters()
-    products_page.page.get_by_test_id("loading-indicator").wait_for(state="hidden")
     
     # THEN: All products are shown again
     final_count = products_page.get_product_count()
@@ -86,15 +93,14 @@ def test_add_product_to_cart(products_page: ProductsPage, navigation):
     """
     # GIVEN: User is on products page
     products_page.navigate()
-    products_page.page.get_by_test_id("loading-indicator").wait_for(state="hidden")
     
     initial_cart_count = navigation.get_cart_count()
     
     # WHEN: User adds first product to cart
     products_page.add_product_to_cart(1)
     
-    # Wait for the "Added" feedback
-    products_page.page.wait_for_timeout(500)
+    # Wait for the badge to update
+    navigation.wait_for_cart_count(int(initial_cart_count) + 1)
     
     # THEN: Cart count increases
     new_cart_count = navigation.get_cart_count()
@@ -107,7 +113,6 @@ def test_view_product_details(products_page: ProductsPage, page):
     """
     # GIVEN: User is on products page
     products_page.navigate()
-    products_page.page.get_by_test_id("loading-indicator").wait_for(state="hidden")
     
     # WHEN: User clicks view details for product 1
     products_page.view_product_details(1)
@@ -123,41 +128,44 @@ def test_no_products_message_when_no_matches(products_page: ProductsPage):
     """
     # GIVEN: User is on products page
     products_page.navigate()
-    products_page.page.get_by_test_id("loading-indicator").wait_for(state="hidden")
     
     # WHEN: User searches for non-existent product
     products_page.search_products("xyznonexistent")
-    products_page.page.wait_for_timeout(500)
-    products_page.page.get_by_test_id("loading-indicator").wait_for(state="hidden")
     
     # THEN: No products message is shown
     assert products_page.is_no_products_message_shown()
 
-def test_product_card_displays_correct_info(page):
-    """
-    Demonstrates: Accessing nested elements with locator chaining
-    Shows: Data verification in complex components
-    """
-    # GIVEN: User is on products page
-    page.goto("http://127.0.0.1:5000/products")
-    page.get_by_test_id("loading-indicator").wait_for(state="hidden")
-    
-    # WHEN: Examining first product
-    first_product = page.get_by_test_id("product-1")
-    
-    # THEN: Product card has all required information
-    expect(first_product.get_by_test_id("product-name-1")).to_be_visible()
-    expect(first_product.get_by_test_id("product-price-1")).to_contain_text("$")
-    expect(first_product.get_by_test_id("product-stock-1")).to_contain_text("in stock")
-    expect(first_product.get_by_test_id("product-category-1")).to_be_visible()
+@pytest.mark.api_har
+def test_product_card_displays_correct_info(products_page: ProductsPage):
+    """
+    Demonstrates: Batched DOM reads with evaluate_all
+    Shows: Data verification in complex components in one round trip
+    """
+    # GIVEN: User is on products page (keeping the product data the page was served)
+    with products_page.page.expect_response(lambda response: "/api/products" in response.url) as api_response:
+        products_page.navigate()
+    api_product = next(product for product in api_response.value.json() if product["id"] == 1)
+    
+    # WHEN: Reading every card's fields at once
+    cards = {card["id"]: card for card in products_page.read_cards()}
+    
+    # THEN: Product card renders the API data
+    first_product = cards[1]
+    assert first_product["name"] == api_product["name"]
+    assert first_product["category"] == api_product["category"]
+    assert first_product["price"] == f"${api_product['price']:,.2f}"  # Intl en-US currency format
+    assert first_product["stock"] == api_product["stock"]
+    expect(products_page.page.get_by_test_id("product-stock-1")).to_contain_text("in stock")
+    assert len(cards) == products_page.get_product_count()
 
-def test_products_grid_uses_role_list(page):
+@pytest.mark.api_har
+def test_products_grid_uses_role_list(page, base_url):
     """
     Demonstrates: ARIA role locators
     Shows: Accessibility-first approach
     """
     # GIVEN: User is on products page
-    page.goto("http://127.0.0.1:5000/products")
+    page.goto(f"{base_url}/products")
     page.get_by_test_id("loading-indicator").wait_for(state="hidden")
     
     # WHEN: Checking products grid structure
@@ -0,0 +1,89 @@
+"""
+App Factory Tests
+Demonstrates: Isolated apps from create_app and microsecond state restores between tests (no browser needed)
+"""
+import pytest
+
+from app import create_app
+from catalog_generator import generate_products
+
+TEST_CONFIG = {"TESTING": True, "PRELOAD_CATALOG": False}
+
+NEW_USER = {"username": "factory_user", "email": "factory@example.com", "password": "pw"}
+
+@pytest.fixture
+def client():
+    return create_app(TEST_CONFIG).test_client()
+
+def test_apps_do_not_share_state():
+    first, second = create_app(TEST_CONFIG), create_app(TEST_CONFIG)
+    
+    assert first.test_client().post("/api/register", json=NEW_USER).status_code == 200
+    
+    assert "factory_user" in first.extensions["store"].users
+    assert "factory_user" not in second.extensions["store"].users
+    assert second.test_client().post("/api/register", json=NEW_USER).status_code == 200
+
+def test_restore_pristine_undoes_writes(client):
+    store = client.application.extensions["store"]
+    before = client.get("/api/products").get_json()
+    client.post("/api/register", json=NEW_USER)
+    store.catalog.add_many(generate_products(50, start_id=store.catalog.next_id()))
+    store.catalog.update(1, price=1.0, name="Renamed Laptop")
+    store.catalog.delete(2)
+    store.catalog.record_view(3)
+    
+    response = client.post("/api/test/state/restore", query_string={"name": "pristine"})
+    
+    assert response.status_code == 200
+    assert client.get("/api/products").get_json() == before
+    assert "factory_user" not in store.users
+    assert store.catalog.views == {}
+    assert client.get("/api/products/suggest?q=renamed").get_json() == []
+    categories = client.get("/api/products/facets").get_json()["facets"]["category"]
+    assert sum(categories.values()) == len(before)
+
+def test_named_checkpoint_round_trip(client):
+    client.post("/api/register", json=NEW_USER)
+    assert client.post("/api/test/state/checkpoint", query_string={"name": "registered"}).status_code == 200
+    client.post("/api/register", json={**NEW_USER, "username": "second_user"})
+    
+    client.post("/api/test/state/restore", query_string={"name": "registered"})
+    
+    users = client.application.extensions["store"].users
+    assert "factory_user" in users and "second_user" not in users
+    missing = client.post("/api/test/state/restore", query_string={"name": "nope"})
+    assert missing.status_code == 404
+
+def test_checkpoint_shares_products_instead_of_copying():
+    app = create_app({**TEST_CONFIG, "PRELOAD_CATALOG": True})
+    store = app.extensions["store"]
+    
+    checkpoint = store.checkpoint()
+    
+    columns, length, _ = checkpoint.catalog
+    assert columns is store.catalog.columns and length == len(store.catalog)
+
+def test_restore_takes_microseconds(client, record_property):
+    store = client.application.extensions["store"]
+    store.catalog.add_many(generate_products(500, start_id=store.catalog.next_id()))
+    client.post("/api/test/state/checkpoint", query_string={"name": "seeded"})
+    
+    timings = []
+    for _ in range(20):
+        client.post("/api/register", json=NEW_USER)
+        store.catalog.delete(1)
+        timings.append(client.post("/api/test/state/restore", query_string={"name": "seeded"}).get_json()["restore_us"])
+    
+    median = sorted(timings)[len(timings) // 2]
+    record_property("restore_us", median)
+    assert median < 50_000
+    assert store.catalog.get(1) is not None
+
+def test_state_endpoints_are_off_by_default(monkeypatch):
+    monkeypatch.delenv("STATE_ENDPOINTS", raising=False)
+    app = create_app({"PRELOAD_CATALOG": False})
+    
+    response = app.test_client().post("/api/test/state/restore")
+    
+    assert response.status_code == 404
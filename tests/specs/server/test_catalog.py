@@ -0,0 +1,44 @@
+"""
+Catalog Tests
+Demonstrates: Cached JSON fragments stay byte-identical to jsonify and follow updates (no browser needed)
+"""
+import json
+
+from flask import Flask
+
+from app import products_db
+from catalog import ProductCatalog
+
+def jsonify_bytes(products: list[dict]) -> bytes:
+    app = Flask("reference")
+    with app.app_context():
+        return app.json.response(products).get_data()
+
+def test_fragments_match_jsonify_output():
+    catalog = ProductCatalog(products_db)
+    electronics = [product for product in catalog if product["category"] == "Electronics"]
+    
+    assert catalog.encode_list(electronics) == jsonify_bytes(electronics)
+    assert catalog.encode_list([]) == jsonify_bytes([])
+
+def test_second_encode_is_served_from_cache():
+    lookups = []
+    catalog = ProductCatalog(products_db, on_lookup=lambda hits, misses: lookups.append((hits, misses)))
+    
+    catalog.encode_list(catalog.filter())
+    catalog.encode_list(catalog.filter())
+    
+    assert lookups == [(0, 6), (6, 0)]
+
+def test_update_and_delete_invalidate_fragments():
+    catalog = ProductCatalog(products_db)
+    catalog.encode_list(catalog.filter())
+    
+    catalog.update(2, price=19.99)
+    catalog.delete(3)
+    decoded = json.loads(catalog.encode_list(catalog.filter()))
+    
+    assert [product["id"] for product in decoded] == [1, 2, 4, 5, 6]
+    assert decoded[1]["price"] == 19.99
+    assert catalog.get(2)["price"] == 19.99
+    assert next(p for p in products_db if p["id"] == 2)["price"] == 29.99
@@ -0,0 +1,98 @@
+"""
+Catalog Import Tests
+Demonstrates: Seeded synthetic catalogs and batched CSV/NDJSON imports (no browser needed)
+"""
+import io
+import json
+import threading
+
+import pytest
+from werkzeug.serving import make_server
+
+from app import app, create_app, import_catalog_command, products_db
+from catalog import ProductCatalog
+from catalog_generator import generate_products
+from catalog_import import import_products, import_stream, write_rows
+
+def export(products, fmt: str) -> bytes:
+    text = io.StringIO()
+    write_rows(products, text, fmt)
+    return text.getvalue().encode()
+
+def test_same_seed_generates_same_catalog():
+    first = list(generate_products(5000, seed=7))
+    
+    assert first == list(generate_products(5000, seed=7))
+    assert first != list(generate_products(5000, seed=8))
+    assert [product["id"] for product in first] == list(range(1, 5001))
+    assert all(product["price"] > 0 and product["stock"] >= 0 for product in first)
+
+@pytest.mark.parametrize("fmt", ["csv", "ndjson"])
+def test_import_round_trips_in_batches(fmt):
+    generated = list(generate_products(2500, seed=3, start_id=7))
+    target = ProductCatalog(products_db)
+    
+    result = import_stream(target, io.BytesIO(export(generated, fmt)), fmt, batch_size=1000)
+    
+    assert (result.imported, result.batches, result.invalid) == (2500, 3, 0)
+    assert len(target) == 2506
+    assert target.get(2506) == generated[-1]
+
+def test_duplicates_and_invalid_rows_are_counted():
+    target = ProductCatalog(products_db)
+    rows = [
+        json.dumps({"id": 1, "name": "Duplicate", "price": 1, "category": "Audio"}),
+        json.dumps({"name": "No id", "price": "9.5", "category": "Audio", "stock": 3}),
+        json.dumps({"id": 50, "name": "No price", "category": "Audio"}),
+        "{not json",
+    ]
+    
+    result = import_products(target, rows)
+    
+    assert (result.imported, result.duplicates, result.invalid) == (1, 1, 2)
+    assert len(result.errors) == 2
+    assert target.get(7) == {"id": 7, "name": "No id", "price": 9.5, "category": "Audio", "stock": 3}
+
+@pytest.mark.parametrize("line", ["5", "[1]", '"x"', "null"])
+def test_ndjson_line_that_is_not_an_object_is_invalid(line):
+    result = import_products(ProductCatalog(products_db), [line])
+    
+    assert (result.imported, result.invalid) == (0, 1)
+    assert "expected a JSON object" in result.errors[0]
+
+def test_import_api_requires_admin(app_state):
+    client = app.test_client()
+    client.post("/api/login", json={"username": "testuser", "password": "password123"})
+    
+    response = client.post("/api/admin/products/import", data=b"", content_type="application/x-ndjson")
+    
+    assert response.status_code == 403
+
+def test_import_api_streams_csv_into_catalog(app_state):
+    client = app.test_client()
+    client.post("/api/login", json={"username": "admin", "password": "admin123"})
+    body = export(generate_products(300, seed=1, start_id=1), "csv")
+    
+    response = client.post("/api/admin/products/import?mode=replace&batch_size=100",
+                           data=body, content_type="text/csv")
+    
+    assert response.get_json()["imported"] == 300
+    assert response.get_json()["batches"] == 3
+    assert len(client.get("/api/products").get_json()) == 300
+
+def test_import_command_reports_failed_login(tmp_path):
+    server = make_server("127.0.0.1", 0, create_app(), threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    source = tmp_path / "products.ndjson"
+    source.write_bytes(export(generate_products(3, seed=1), "ndjson"))
+    
+    try:
+        result = app.test_cli_runner().invoke(import_catalog_command, [
+            str(source), "--url", f"http://127.0.0.1:{server.server_port}", "--password", "wrong",
+        ])
+    finally:
+        server.shutdown()
+    
+    assert result.exit_code == 1
+    assert result.output.startswith("Error: login failed: HTTP 401")
+    assert "Traceback" not in result.output
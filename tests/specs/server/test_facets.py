@@ -0,0 +1,106 @@
+"""
+Facet Count Tests
+Demonstrates: Incrementally maintained facet counts agree with a full scan after every write (no browser needed)
+"""
+import random
+from collections import Counter
+
+import pytest
+
+from app import app, products_db
+from benchmarks.columnar_store import dict_filter
+from catalog import ProductCatalog
+from catalog_generator import generate_products
+from facets import FACETS, bitset
+
+FILTERS = [
+    {},
+    {"category": "Audio"},
+    {"in_stock": False},
+    {"search": "pro", "max_price": 80.0},
+    {"category": "Gaming", "search": "ultra", "min_price": 30.0, "in_stock": True},
+]
+
+def scanned_counts(catalog: ProductCatalog, **filters) -> dict:
+    """Reference counts: each facet applies every filter except its own"""
+    products = list(catalog)
+    own_filter = {"category": ("category",), "price": ("min_price", "max_price"), "stock": ("in_stock",)}
+    facets = {}
+    for facet, value_of in FACETS.items():
+        others = {name: value for name, value in filters.items() if name not in own_filter[facet]}
+        facets[facet] = dict(Counter(value_of(products[row]) for row in dict_filter(products, **others)))
+    return {"total": len(dict_filter(products, **filters)), "facets": facets}
+
+def nonzero(result: dict) -> dict:
+    return {
+        "total": result["total"],
+        "facets": {facet: {value: n for value, n in counts.items() if n} for facet, counts in result["facets"].items()},
+    }
+
+@pytest.mark.parametrize("filters", FILTERS)
+def test_counts_match_scan_after_writes(filters):
+    rng = random.Random(5)
+    catalog = ProductCatalog(generate_products(1500, seed=2))
+    catalog.facet_counts(**filters)
+    
+    catalog.add_many(generate_products(500, seed=3, start_id=1501))
+    for product_id in rng.sample(range(1, 2001), 200):
+        catalog.update(product_id, price=rng.uniform(1, 900), stock=rng.choice([0, 5]), category=rng.choice(["Audio", "Toys"]))
+    for product_id in rng.sample(range(1, 2001), 300):
+        if catalog.get(product_id):
+            catalog.delete(product_id)
+    
+    assert nonzero(catalog.facet_counts(**filters)) == scanned_counts(catalog, **filters)
+
+def test_price_index_follows_small_writes():
+    rng = random.Random(8)
+    catalog = ProductCatalog(generate_products(800, seed=4))
+    catalog.facet_counts(min_price=20.0, max_price=300.0)
+    index = catalog._prices
+    
+    catalog.add_many(generate_products(10, seed=5, start_id=801))
+    for product_id in rng.sample(range(1, 811), 50):
+        catalog.update(product_id, price=round(rng.uniform(1, 600), 2))
+    for product_id in rng.sample(range(1, 811), 50):
+        if catalog.get(product_id):
+            catalog.delete(product_id)
+    
+    assert catalog._prices is not index  # patched copies, not rebuilt or mutated
+    for low, high in ((20.0, 300.0), (None, 45.5), (250.0, None)):
+        expected = sorted(catalog.filter(min_price=low, max_price=high).ids())
+        assert sorted(catalog._prices.ids_between(low, high)) == expected
+        assert bitset(catalog._prices.ids_between(low, high)) == bitset(expected)
+
+def test_rename_invalidates_cached_search_counts():
+    catalog = ProductCatalog(products_db)
+    assert catalog.facet_counts(search="zeta")["total"] == 0
+    
+    catalog.update(1, name="Zeta Laptop")
+    
+    assert catalog.facet_counts(search="zeta")["total"] == len(list(catalog.filter(search="zeta"))) == 1
+
+def test_same_bucket_price_change_invalidates_cached_range_counts():
+    catalog = ProductCatalog(products_db)
+    before = catalog.facet_counts(max_price=85)["total"]
+    
+    catalog.update(6, price=90.0)
+    
+    assert catalog.facet_counts(max_price=85)["total"] == len(list(catalog.filter(max_price=85))) == before - 1
+
+def test_emptied_category_disappears():
+    catalog = ProductCatalog([{"id": 1, "name": "Only", "price": 5.0, "category": "Solo", "stock": 1}])
+    
+    catalog.delete(1)
+    
+    assert catalog.facet_counts() == {"total": 0, "facets": {"category": {}, "price": {}, "stock": {}}}
+
+def test_facets_endpoint_and_products_page():
+    client = app.test_client()
+    
+    response = client.get("/api/products/facets?category=Electronics")
+    page = client.get("/products").get_data(as_text=True)
+    
+    assert response.get_json()["total"] == 3
+    assert response.get_json()["facets"]["category"] == {"Accessories": 3, "Electronics": 3}
+    assert response.get_json()["facets"]["price"] == {"0-25": 0, "25-50": 0, "50-100": 1, "250-500": 1, "500+": 1}
+    assert "Accessories (3)" in page
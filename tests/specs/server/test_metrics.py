@@ -0,0 +1,103 @@
+"""
+Metrics Tests
+Demonstrates: Sharded counters and the /metrics endpoint through Flask's test client (no browser needed)
+"""
+import json
+import threading
+
+import pytest
+from flask import Flask
+
+from app import app
+from metrics import Counter, Metrics, SessionTracker
+
+def sample(text: str, line_prefix: str) -> float:
+    """Value of the first exposition line starting with line_prefix (0 when absent)"""
+    return next((float(line.rsplit(" ", 1)[1]) for line in text.splitlines() if line.startswith(line_prefix)), 0.0)
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+def test_counter_shards_sum_across_threads():
+    counter = Counter("demo_total", "demo", ("kind",))
+    
+    def work():
+        for _ in range(1000):
+            counter.inc("a")
+    
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert counter.values.totals()[("a",)] == 8000
+
+def test_thread_per_request_reuses_shards():
+    counter = Counter("demo_total", "demo", ("kind",))
+    
+    def requests(batches: int):
+        for _ in range(batches):
+            batch = [threading.Thread(target=counter.inc, args=("a",)) for _ in range(4)]
+            for thread in batch:
+                thread.start()
+            for thread in batch:
+                thread.join()
+    
+    requests(10)
+    shards = len(counter.values._shards)
+    requests(50)
+    
+    assert counter.values.totals()[("a",)] == 240
+    assert len(counter.values._shards) == shards
+
+def test_login_and_order_outcomes_are_counted(client):
+    before = client.get("/metrics").get_data(as_text=True)
+    
+    client.post("/api/login", json={"username": "testuser", "password": "wrong"})
+    client.post("/api/login", json={"username": "testuser", "password": "password123"})
+    client.post("/api/place-order", json={"items": [1]})
+    after = client.get("/metrics").get_data(as_text=True)
+    
+    def delta(prefix):
+        return sample(after, prefix) - sample(before, prefix)
+    
+    assert delta('logins_total{result="failure"}') == 1
+    assert delta('logins_total{result="success"}') == 1
+    assert delta("orders_total") == 1
+    assert sample(after, "active_sessions") >= 1
+
+def test_logged_in_requests_do_not_rewrite_the_session(client):
+    with client.session_transaction() as session:
+        session["locale"] = "en"
+        session["user"] = "testuser"  # e.g. logged in before the metrics id existed
+    
+    response = client.get("/api/products")
+    
+    assert "Set-Cookie" not in response.headers
+    assert sample(client.get("/metrics").get_data(as_text=True), "active_sessions") >= 1
+
+def test_session_tracker_prunes_on_touch(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr("metrics.time.time", lambda: now)
+    tracker = SessionTracker(window_seconds=60, prune_seconds=10)
+    tracker.touch("old")
+    
+    now += 61
+    tracker.touch("new")
+    
+    assert list(tracker.last_seen) == ["new"]
+
+def test_multiprocess_mode_merges_other_workers(tmp_path):
+    worker, scraper = Metrics(), Metrics(Flask("scraper"))
+    worker.orders.inc(amount=3)
+    worker.latency.observe(0.02, "home")
+    (tmp_path / "metrics-999999.json").write_text(json.dumps(worker.snapshot()))
+    scraper.multiproc_dir = tmp_path
+    scraper.orders.inc()
+    
+    text = scraper.render()
+    
+    assert sample(text, "orders_total") == 4
+    assert sample(text, 'http_request_duration_seconds_count{endpoint="home"}') == 1
@@ -0,0 +1,123 @@
+"""
+Columnar Store Tests
+Demonstrates: Range filters over array/NumPy columns agree with a plain dict scan (no browser needed)
+"""
+import tracemalloc
+
+import pytest
+
+import product_columns
+from app import app
+from benchmarks.columnar_store import dict_filter
+from catalog import ProductCatalog
+from catalog_generator import generate_products
+from product_columns import ProductColumns
+
+PRODUCTS = list(generate_products(3000, seed=11))
+FILTERS = [
+    {"min_price": 20.0, "max_price": 90.0},
+    {"in_stock": True},
+    {"in_stock": False, "category": "Storage"},
+    {"category": "Audio", "search": "pro", "max_price": 100.0},
+    {"category": "Furniture", "min_price": 1.0},
+]
+
+@pytest.fixture(params=["arrays", "numpy"])
+def backend(request, monkeypatch):
+    if request.param == "arrays":
+        monkeypatch.setattr(product_columns, "np", None)
+    elif product_columns.np is None:
+        pytest.skip("numpy is not installed")
+    return request.param
+
+@pytest.mark.parametrize("filters", FILTERS)
+def test_select_matches_dict_scan(backend, filters):
+    columns = ProductColumns(PRODUCTS)
+    
+    assert list(columns.select(len(columns), **filters)) == dict_filter(PRODUCTS, **filters)
+
+def footprint(build) -> int:
+    """Bytes still allocated once build() has returned (and its result is held)"""
+    tracemalloc.start()
+    built = build()
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert len(built) == len(PRODUCTS)
+    return allocated
+
+def test_catalog_holds_less_than_a_dict_list():
+    dict_list = footprint(lambda: [dict(product) for product in PRODUCTS])
+    catalog = footprint(lambda: ProductCatalog(PRODUCTS))
+    
+    assert catalog < dict_list * 0.75
+
+def test_backends_agree_on_stock_predicates():
+    products = [
+        {"id": 1, "name": "Back Order", "price": 5.0, "category": "Audio", "stock": -2},
+        {"id": 2, "name": "Sold Out", "price": 5.0, "category": "Audio", "stock": 0},
+        {"id": 3, "name": "On Shelf", "price": 5.0, "category": "Audio", "stock": 3},
+    ]
+    columns = ProductColumns(products)
+    numpy = product_columns.np
+    results = {}
+    
+    for backend, module in (("arrays", None), ("numpy", numpy)):
+        if backend == "numpy" and numpy is None:
+            continue
+        product_columns.np = module
+        columns._numpy = None
+        try:
+            results[backend] = {in_stock: list(columns.select(3, in_stock=in_stock)) for in_stock in (True, False)}
+        finally:
+            product_columns.np = numpy
+    
+    for selected in results.values():
+        assert selected == {True: [2], False: [0, 1]}
+
+def test_catalog_keeps_columns_in_step_with_writes():
+    catalog = ProductCatalog(PRODUCTS[:100])
+    cheap = lambda: [product["id"] for product in catalog.filter(max_price=10.0)]
+    before = cheap()
+    
+    catalog.add_many([{"id": 5001, "name": "Bargain Cable", "price": 1.5, "category": "Accessories", "stock": 4}])
+    catalog.update(before[0], price=500.0)
+    
+    assert cheap() == before[1:] + [5001]
+
+def test_update_and_delete_patch_a_copy_of_the_columns(backend):
+    catalog = ProductCatalog(PRODUCTS[:100])
+    reader = catalog.filter(max_price=30.0)
+    reader_ids = list(reader.ids())
+    first, second = reader_ids[:2]
+    
+    catalog.update(first, price=500.0, name="Renamed Cable")
+    catalog.delete(second)
+    
+    current = list(catalog)
+    assert catalog.columns is not reader.columns
+    assert catalog.columns.names is reader.columns.names
+    assert list(reader.ids()) == reader_ids
+    assert list(catalog.filter(max_price=30.0)) == [current[row] for row in dict_filter(current, max_price=30.0)]
+    assert [product["id"] for product in catalog.filter(search="renamed")] == [first]
+
+def test_rows_are_built_as_dicts_on_read():
+    catalog = ProductCatalog(PRODUCTS[:10])
+    
+    product = catalog.get(PRODUCTS[3]["id"])
+    product["price"] = 0.0
+    
+    assert product is not catalog.get(PRODUCTS[3]["id"])
+    assert catalog.get(PRODUCTS[3]["id"]) == PRODUCTS[3]
+    assert list(catalog) == PRODUCTS[:10]
+    assert catalog.get(10**9) is None
+
+def test_api_products_range_filters():
+    client = app.test_client()
+    
+    products = client.get("/api/products?min_price=20&max_price=100&in_stock=true").get_json()
+    in_stock = client.get("/api/products?in_stock=1").get_json()
+    sold_out = client.get("/api/products?in_stock=false").get_json()
+    
+    assert [product["name"] for product in products] == ["Wireless Mouse", "Mechanical Keyboard", "Webcam HD"]
+    assert len(in_stock) == 6
+    assert sold_out == []
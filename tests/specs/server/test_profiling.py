@@ -0,0 +1,83 @@
+"""
+Profiling Tests
+Demonstrates: Admin-only profiling hooks through Flask's test client (no browser needed)
+"""
+import os
+import signal
+import threading
+import time
+
+import pytest
+
+from app import app, create_app, profiler
+from profiling import MAX_REQUEST_SAMPLE_SECONDS
+
+@pytest.fixture
+def admin_client():
+    client = app.test_client()
+    client.post("/api/login", json={"username": "admin", "password": "admin123"})
+    return client
+
+def test_profiling_endpoints_require_admin():
+    client = app.test_client()
+    client.post("/api/login", json={"username": "testuser", "password": "password123"})
+    
+    assert client.get("/admin/profile/stacks?seconds=0.01").status_code == 403
+    assert client.get("/admin/profile/requests").status_code == 403
+    assert "X-Profile-Id" not in client.get("/api/products", headers={"X-Profile": "1"}).headers
+
+def test_stack_sampler_returns_collapsed_stacks(admin_client):
+    stop = threading.Event()
+    worker = threading.Thread(target=lambda: stop.wait(5), name="idle-worker")
+    worker.start()
+    
+    response = admin_client.get("/admin/profile/stacks?seconds=0.05&interval_ms=5")
+    stop.set()
+    worker.join()
+    
+    lines = response.get_data(as_text=True).splitlines()
+    assert response.status_code == 200
+    assert any(line.startswith("idle-worker;") for line in lines)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+def test_profile_header_captures_request_for_admin(admin_client):
+    profile_id = admin_client.get("/api/products", headers={"X-Profile": "1"}).headers["X-Profile-Id"]
+    
+    listed = admin_client.get("/admin/profile/requests").get_json()
+    report = admin_client.get(f"/admin/profile/requests/{profile_id}?limit=5").get_data(as_text=True)
+    
+    assert listed[0]["id"] == profile_id and listed[0]["path"] == "/api/products"
+    assert "function calls" in report
+
+def test_stack_window_is_capped(admin_client, monkeypatch):
+    windows = []
+    monkeypatch.setattr(profiler, "sample", lambda seconds, interval: windows.append(seconds))
+    
+    admin_client.get("/admin/profile/stacks?seconds=600")
+    
+    assert windows == [MAX_REQUEST_SAMPLE_SECONDS]
+
+@pytest.mark.skipif(not hasattr(signal, "SIGUSR1"), reason="SIGUSR1 is POSIX-only")
+def test_signal_handler_is_opt_in():
+    before = signal.getsignal(signal.SIGUSR1)
+    
+    create_app({"PRELOAD_CATALOG": False})
+    
+    assert signal.getsignal(signal.SIGUSR1) is before
+
+@pytest.mark.skipif(not hasattr(signal, "SIGUSR1"), reason="SIGUSR1 is POSIX-only")
+def test_sigusr1_writes_collapsed_stacks(tmp_path, monkeypatch):
+    monkeypatch.setattr(profiler, "output_dir", tmp_path)
+    monkeypatch.setattr(profiler, "signal_seconds", 0.05)
+    previous = signal.getsignal(signal.SIGUSR1)
+    profiler.install_signal_handler()
+    
+    try:
+        os.kill(os.getpid(), signal.SIGUSR1)
+        deadline = time.time() + 5
+        while not list(tmp_path.glob("stacks-*.txt")) and time.time() < deadline:
+            time.sleep(0.02)
+    finally:
+        signal.signal(signal.SIGUSR1, previous)
+    
+    assert list(tmp_path.glob("stacks-*.txt"))
@@ -0,0 +1,80 @@
+"""
+Server-Timing Tests
+Demonstrates: Checking server-side instrumentation through Flask's test client (no browser needed)
+"""
+import time
+
+import pytest
+
+from app import app, create_app, server_timing
+from server_timing import DEFAULT_SAMPLE_RATE, SAMPLE_RATE_ENV
+
+def phases(response) -> dict:
+    """Parse 'name;dur=1.234, ...' into {name: milliseconds}"""
+    entries = (entry.split(";dur=") for entry in response.headers["Server-Timing"].split(", "))
+    return {name: float(duration) for name, duration in entries}
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+@pytest.fixture
+def sample_rate():
+    """Set the default app's sample rate for one test"""
+    rate = server_timing.sample_rate
+    
+    def set_rate(value: float):
+        server_timing.sample_rate = value
+    
+    yield set_rate
+    server_timing.sample_rate = rate
+
+@pytest.fixture
+def sampled(sample_rate):
+    sample_rate(1.0)
+
+@pytest.fixture
+def unsampled(sample_rate):
+    sample_rate(0)
+
+def test_html_route_reports_template_phase(client, sampled):
+    timings = phases(client.get("/products"))
+    
+    assert {"session-open", "locale", "view", "template", "total"} <= set(timings)
+    assert timings["total"] >= timings["template"] + timings["view"]
+
+def test_api_route_reports_json_phase(client, sampled):
+    timings = phases(client.get("/api/products?category=Electronics"))
+    
+    assert timings["json"] > 0
+    assert "template" not in timings
+
+def test_later_after_request_hooks_are_not_counted_as_view():
+    app = create_app({"PRELOAD_CATALOG": False, "SERVER_TIMING_SAMPLE_RATE": 1.0})
+    app.after_request(lambda response: time.sleep(0.05) or response)
+    
+    timings = phases(app.test_client().get("/api/products"))
+    
+    assert timings["view"] < 50
+    assert timings["total"] >= 50
+
+def test_unsampled_requests_have_no_header_unless_forced(client, unsampled):
+    assert "Server-Timing" not in client.get("/").headers
+    assert "total" in phases(client.get("/", headers={"X-Server-Timing": "1"}))
+
+def test_sampled_requests_feed_histograms(client, sampled):
+    before = server_timing.histogram("get_products", "total").count
+    
+    client.get("/api/products")
+    
+    assert server_timing.histogram("get_products", "total").count == before + 1
+
+def test_production_default_samples_one_percent(monkeypatch):
+    monkeypatch.delenv(SAMPLE_RATE_ENV, raising=False)
+    client = create_app({"PRELOAD_CATALOG": False}).test_client()
+    
+    headers = [client.get("/api/products").headers for _ in range(200)]
+    
+    assert client.application.config[SAMPLE_RATE_ENV] == DEFAULT_SAMPLE_RATE == 0.01
+    assert sum("Server-Timing" in response_headers for response_headers in headers) < 20
+    assert "Server-Timing" in client.get("/api/products", headers={"X-Server-Timing": "1"}).headers
@@ -0,0 +1,38 @@
+"""
+Streaming Export Tests
+Demonstrates: NDJSON export keeps memory flat as the catalog grows (tracemalloc, no browser needed)
+"""
+import json
+import tracemalloc
+
+from app import app, catalog
+from benchmarks.microbench import synthetic_catalog
+
+def stream_export(path: str = "/api/products/stream", **kwargs) -> tuple[int, int]:
+    """(lines received, peak traced bytes) while consuming the response chunk by chunk"""
+    response = app.test_client().get(path, **kwargs)
+    tracemalloc.start()
+    lines = 0
+    for chunk in response.response:
+        lines += chunk.count(b"\n")
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    response.close()
+    return lines, peak
+
+def test_accept_header_selects_ndjson():
+    response = app.test_client().get("/api/products?category=Electronics", headers={"Accept": "application/x-ndjson"})
+    
+    products = [json.loads(line) for line in response.get_data().splitlines()]
+    assert response.mimetype == "application/x-ndjson"
+    assert {product["category"] for product in products} == {"Electronics"}
+
+def test_stream_peak_memory_does_not_grow_with_catalog(app_state):
+    catalog.replace(synthetic_catalog(10_000))
+    small_lines, small_peak = stream_export()
+    catalog.replace(synthetic_catalog(100_000))
+    large_lines, large_peak = stream_export()
+    
+    assert (small_lines, large_lines) == (10_000, 100_000)
+    # 10x the products must not mean more than a constant amount of extra memory
+    assert large_peak < small_peak * 1.5 + 64 * 1024
@@ -0,0 +1,76 @@
+"""
+Autocomplete Tests
+Demonstrates: Radix-trie suggestions match a brute-force ranking as products and views change (no browser needed)
+"""
+import random
+
+from app import app, catalog, products_db
+from catalog import ProductCatalog
+from catalog_generator import generate_products
+from suggest import SuggestIndex, name_keys
+
+def brute_force(catalog: ProductCatalog, prefix: str, limit: int = 10) -> list[int]:
+    prefix = prefix.lower()
+    matches = [product for product in catalog if any(key.startswith(prefix) for key in name_keys(product["name"]))]
+    matches.sort(key=lambda product: (-catalog.views.get(product["id"], 0), product["name"], product["id"]))
+    return [product["id"] for product in matches[:limit]]
+
+def test_name_keys_start_at_words():
+    assert name_keys("Acme Pro  Mouse") == {"acme pro  mouse", "pro  mouse", "mouse"}
+
+def test_suggestions_match_brute_force_after_writes_and_views():
+    rng = random.Random(9)
+    catalog = ProductCatalog(generate_products(800, seed=4))
+    catalog.suggest("a")
+    
+    catalog.add_many(generate_products(200, seed=5, start_id=801))
+    for product_id in rng.sample(range(1, 1001), 100):
+        catalog.update(product_id, name=f"Renamed {rng.choice(['Mouse', 'Monitor', 'Mic'])} {product_id}")
+    for product_id in rng.sample(range(1, 1001), 100):
+        if catalog.get(product_id):
+            catalog.delete(product_id)
+    for _ in range(3000):
+        catalog.record_view(rng.randint(1, 1000))
+    
+    prefixes = ["", "m", "mo", "mou", "mouse 1", "re", "renamed m", "acme", "nova pro", "zz", "1"]
+    for prefix in prefixes:
+        assert [product["id"] for product in catalog.suggest(prefix)] == (brute_force(catalog, prefix) if prefix else [])
+
+def test_views_do_not_wait_for_a_writer():
+    catalog = ProductCatalog(products_db)
+    catalog.suggest("m")
+    
+    with catalog._lock:  # a long write in progress
+        catalog.record_view(5)
+        catalog.record_view(5)
+        assert catalog.views[5] == 2
+    
+    assert catalog.suggest("m")[0]["id"] == 5
+
+def test_edge_split_keeps_cached_top_lists():
+    index = SuggestIndex([{"id": 1, "name": "Monitor"}, {"id": 2, "name": "Mouse"}, {"id": 3, "name": "Mo"}])
+    
+    index.bump(2)
+    
+    assert index.suggest("mo") == [2, 3, 1]
+    assert index.suggest("mon") == [1]
+    assert index.suggest("moz") == []
+
+def test_suggest_endpoint_ranks_by_views(app_state):
+    client = app.test_client()
+    
+    before = client.get("/api/products/suggest?q=m").get_json()
+    client.get("/product/5")
+    client.get("/product/5")
+    after = client.get("/api/products/suggest?q=m&limit=2").get_json()
+    
+    assert {suggestion["name"] for suggestion in before} == {"Wireless Mouse", "Mechanical Keyboard", 'Monitor 27"'}
+    assert after[0] == {"id": 5, "name": 'Monitor 27"'}
+    assert len(after) == 2
+
+def test_suggest_endpoint_clamps_limit():
+    client = app.test_client()
+    
+    for limit in (-3, 0):
+        assert len(client.get(f"/api/products/suggest?q=m&limit={limit}").get_json()) == 1
+    assert len(client.get("/api/products/suggest?q=m&limit=1000").get_json()) == 3
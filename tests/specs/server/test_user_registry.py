@@ -0,0 +1,68 @@
+"""
+User Registry Tests
+Demonstrates: Racing threads never register a username twice or lose a profile update (no browser needed)
+"""
+import sys
+import threading
+
+import pytest
+
+from app import app, users_db
+from benchmarks.registry_throughput import stress
+from user_registry import UserRegistry
+
+@pytest.fixture
+def tiny_switch_interval():
+    """Switch threads far more often than usual so races actually interleave"""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+@pytest.mark.parametrize("threads", [1, 4, 16])
+def test_concurrent_registrations_are_unique(threads, tiny_switch_interval, record_property):
+    registry = UserRegistry()
+    
+    result = stress(registry, threads, users=300, contended=200)
+    
+    assert result["created"] == result["unique"] == result["expected"] == len(registry)
+    record_property("registrations_per_second", round(result["registrations_per_second"]))
+
+def test_concurrent_profile_updates_are_not_lost(tiny_switch_interval):
+    registry = UserRegistry({"shared": {"password": "pw", "email": "a@example.com", "role": "user"}})
+    barrier = threading.Barrier(8)
+    
+    def worker(slot: int):
+        barrier.wait()
+        for round_number in range(200):
+            registry.update("shared", **{f"field{slot}": round_number})
+    
+    workers = [threading.Thread(target=worker, args=(slot,)) for slot in range(8)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    
+    profile = registry.get("shared")
+    assert all(profile[f"field{slot}"] == 199 for slot in range(8))
+    with pytest.raises(TypeError):
+        profile["email"] = "mutated@example.com"
+
+def test_register_api_admits_one_of_many_racing_requests(app_state, tiny_switch_interval):
+    barrier = threading.Barrier(12)
+    statuses = []
+    
+    def register():
+        client = app.test_client()
+        barrier.wait()
+        response = client.post("/api/register", json={"username": "racer", "email": "r@example.com", "password": "pw"})
+        statuses.append(response.status_code)
+    
+    workers = [threading.Thread(target=register) for _ in range(12)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    
+    assert sorted(statuses) == [200] + [400] * 11
+    assert users_db.authenticate("racer", "pw")["email"] == "r@example.com"
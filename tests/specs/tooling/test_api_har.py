@@ -0,0 +1,43 @@
+"""
+API HAR Tests
+Demonstrates: Committed recordings replay on any server and missing ones fail loudly (no browser needed)
+"""
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from tests.fixtures.network_fixtures import HAR_DIR, ApiHar
+
+def har_request(name: str, update_har: bool = False, base_url: str = "http://127.0.0.1:5001"):
+    marker = pytest.mark.api_har(name).mark
+    return SimpleNamespace(
+        node=SimpleNamespace(get_closest_marker=lambda _: marker, originalname=name),
+        config=SimpleNamespace(getoption=lambda _: update_har),
+        getfixturevalue=lambda _: base_url,
+    )
+
+@pytest.mark.parametrize("path", sorted(HAR_DIR.glob("*.har")), ids=lambda path: path.stem)
+def test_recordings_are_committed_for_products_api(path):
+    entries = json.loads(path.read_text())["log"]["entries"]
+    
+    assert entries
+    assert all("/api/products" in entry["request"]["url"] for entry in entries)
+
+def test_replay_moves_recorded_urls_onto_the_server_under_test():
+    api_har = ApiHar.for_test(har_request("test_products_grid_uses_role_list"))
+    
+    replay = json.loads(api_har.replay_path().read_text())
+    
+    assert not api_har.recording
+    assert {entry["request"]["url"] for entry in replay["log"]["entries"]} == {
+        "http://127.0.0.1:5001/api/products?",
+        "http://127.0.0.1:5001/api/products",
+    }
+
+def test_missing_recording_fails_instead_of_recording():
+    with pytest.raises(pytest.fail.Exception, match="--update-har"):
+        ApiHar.for_test(har_request("test_without_recording"))
+    
+    assert ApiHar.for_test(har_request("test_without_recording", update_har=True)).recording
+    assert not (HAR_DIR / "test_without_recording.har").exists()
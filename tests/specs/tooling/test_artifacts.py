@@ -0,0 +1,57 @@
+"""
+Artifact Recorder Tests
+Demonstrates: Which screenshots and traces a test leaves behind, against a fake browser (no browser needed)
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from tests.fixtures.artifacts import PHASE_REPORTS_KEY, ArtifactRecorder
+
+class FakeTracing:
+    def __init__(self, calls: list):
+        self.calls = calls
+    
+    def start(self, **options):
+        self.calls.append(("trace-start", options))
+    
+    def stop(self, path=None):
+        self.calls.append(("trace-stop", path and path.name))
+
+class FakePage:
+    def __init__(self, calls: list):
+        self.calls = calls
+    
+    def is_closed(self) -> bool:
+        return False
+    
+    def screenshot(self, path, full_page: bool):
+        self.calls.append(("screenshot", path.name))
+
+def record(tmp_path, failed: bool, **modes) -> list:
+    """Start and stop a recorder for one test; returns the browser calls in order"""
+    node = SimpleNamespace(nodeid="specs/test_x.py::test_x", stash={})
+    node.stash[PHASE_REPORTS_KEY] = {"call": SimpleNamespace(failed=failed)}
+    request = SimpleNamespace(node=node, config=SimpleNamespace(getoption=lambda name: str(tmp_path)))
+    calls = []
+    context = SimpleNamespace(tracing=FakeTracing(calls))
+    recorder = ArtifactRecorder(request, **{"tracing": "off", "screenshot": "off", "video": "off", **modes})
+    recorder.start(context)
+    recorder.stop(context, FakePage(calls))
+    return calls
+
+def test_traced_failure_gets_a_final_screenshot_before_the_trace_stops(tmp_path):
+    calls = record(tmp_path, failed=True, tracing="retain-on-failure")
+    
+    assert calls[1:] == [("screenshot", "screenshot.png"), ("trace-stop", "trace.zip")]
+
+def test_passing_test_leaves_nothing(tmp_path):
+    calls = record(tmp_path, failed=False, tracing="retain-on-failure", screenshot="only-on-failure")
+    
+    assert calls[1:] == [("trace-stop", None)]
+
+@pytest.mark.parametrize("trace_sources", [False, True])
+def test_trace_sources_follow_the_profile(tmp_path, trace_sources):
+    calls = record(tmp_path, failed=False, tracing="on", trace_sources=trace_sources)
+    
+    assert calls[0] == ("trace-start", {"screenshots": True, "snapshots": True, "sources": trace_sources})
@@ -0,0 +1,126 @@
+"""
+Context Pool Tests
+Demonstrates: Which finished tests keep their warm context, against a fake browser (no browser needed)
+"""
+from types import SimpleNamespace
+
+from tests.fixtures.context_pool import ContextPool
+
+BASE_URL = "http://localhost:5000"
+
+class FakePage:
+    def __init__(self, context: "FakeContext"):
+        self.context = context
+        self.url = "about:blank"
+        self.viewport_size = None
+        self.handlers = []
+        self.calls = []
+    
+    def on(self, event: str, handler):
+        assert event == "framenavigated"
+        self.handlers.append(handler)
+    
+    def navigate(self, url: str):
+        """What a test does: load a document and let Playwright fire framenavigated"""
+        self.url = url
+        for handler in self.handlers:
+            handler(SimpleNamespace(url=url))
+    
+    def goto(self, url: str):
+        self.calls.append(("goto", url))
+        self.navigate(url)
+    
+    def evaluate(self, script: str):
+        self.calls.append(("evaluate", script))
+        return "complete"
+    
+    def is_closed(self) -> bool:
+        return False
+    
+    def set_extra_http_headers(self, headers: dict):
+        self.calls.append(("set_extra_http_headers", headers))
+
+class FakeContext:
+    def __init__(self):
+        self.pages = []
+        self.page_handlers = []
+        self.calls = []
+    
+    def on(self, event: str, handler):
+        assert event == "page"
+        self.page_handlers.append(handler)
+    
+    def new_page(self) -> FakePage:
+        page = FakePage(self)
+        self.pages.append(page)
+        for handler in self.page_handlers:
+            handler(page)
+        return page
+    
+    def __getattr__(self, action: str):
+        return lambda *args: self.calls.append(action)
+
+class FakeBrowser:
+    def new_context(self, **context_args) -> FakeContext:
+        return FakeContext()
+    
+    def is_connected(self) -> bool:
+        return True
+
+def finish_test(*urls: str) -> tuple[ContextPool, FakeContext, FakePage]:
+    """Run one pooled "test" that visits urls, then hand its context back"""
+    pool = ContextPool(FakeBrowser(), BASE_URL, size=1)
+    context, page = pool.acquire()
+    for url in urls:
+        page.navigate(url)
+    page.calls.clear()
+    pool.release(context, page)
+    return pool, context, page
+
+def storage_cleared(page: FakePage) -> bool:
+    return any("localStorage.clear()" in call[1] for call in page.calls if call[0] == "evaluate")
+
+def test_test_that_stays_on_blank_keeps_its_context():
+    pool, context, page = finish_test()
+    
+    assert pool.acquire() == (context, page)
+    assert (pool.created, pool.discarded) == (1, 0)
+    assert context.calls == ["clear_cookies", "clear_permissions"]
+    assert not storage_cleared(page)
+    assert ("goto", "about:blank") not in page.calls
+
+def test_test_on_app_origin_clears_storage_and_keeps_its_context():
+    pool, context, page = finish_test(f"{BASE_URL}/products")
+    
+    assert pool.acquire() == (context, page)
+    assert storage_cleared(page)
+    assert ("goto", "about:blank") in page.calls
+
+def test_off_origin_test_keeps_its_context_without_storage_clear():
+    pool, context, page = finish_test("https://example.com/")
+    
+    assert pool.acquire() == (context, page)
+    assert pool.discarded == 0
+    assert context.calls[:2] == ["clear_cookies", "clear_permissions"]
+    assert not storage_cleared(page)
+
+def test_leaving_the_app_after_using_it_discards_the_context():
+    pool, context, page = finish_test(f"{BASE_URL}/login", "https://example.com/")
+    
+    assert pool.discarded == 1
+    assert "close" in context.calls
+    assert pool.acquire()[0] is not context
+
+def test_next_lease_starts_untouched():
+    pool, context, page = finish_test(f"{BASE_URL}/login")
+    
+    context, page = pool.acquire()
+    page.calls.clear()
+    pool.release(context, page)
+    
+    assert not storage_cleared(page)
+
+def test_release_drops_headers_a_probe_added():
+    pool, context, page = finish_test()
+    
+    assert ("set_extra_http_headers", {}) in page.calls
@@ -0,0 +1,35 @@
+"""
+Load Generator Tests
+Demonstrates: Pure-Python checks of the latency histogram and scenario mix (no server needed)
+"""
+import pytest
+
+from benchmarks.load_generator import LatencyHistogram, parse_mix
+
+def test_histogram_percentiles_stay_within_bucket_precision():
+    histogram = LatencyHistogram(sub_bucket_bits=5)
+    for value_us in range(1, 100_001):
+        histogram.record(value_us)
+    
+    for pct in (50, 90, 99):
+        exact = pct * 1000
+        assert abs(histogram.percentile(pct) - exact) / exact <= 1 / 32
+    assert histogram.percentile(100) == 100_000
+
+def test_histogram_merge_matches_single_recording():
+    left, right, combined = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for value_us in (120, 950, 4_000, 70_000):
+        left.record(value_us)
+        combined.record(value_us)
+    for value_us in (300, 8_000):
+        right.record(value_us)
+        combined.record(value_us)
+    
+    left.merge(right)
+    
+    assert left.to_dict() == combined.to_dict()
+
+def test_parse_mix_rejects_unknown_scenarios():
+    assert parse_mix("browse=4,checkout") == {"browse": 4.0, "checkout": 1.0}
+    with pytest.raises(ValueError):
+        parse_mix("browse=1,teleport=2")
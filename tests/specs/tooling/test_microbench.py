@@ -0,0 +1,26 @@
+"""
+Microbenchmark Tests
+Demonstrates: Regression detection against a stored baseline (no timing involved)
+"""
+from benchmarks.microbench import find_regressions
+
+BASELINE = {
+    "GET /api/products [n=6]": {"median_us": 500.0, "mad_us": 5.0},
+    "GET / [en]": {"median_us": 800.0, "mad_us": 60.0},
+}
+
+def test_slowdown_beyond_threshold_and_noise_is_reported():
+    results = {"GET /api/products [n=6]": {"median_us": 600.0, "mad_us": 6.0}}
+    
+    regressions = find_regressions(results, BASELINE, threshold=10)
+    
+    assert regressions == ["GET /api/products [n=6]: 500.0 -> 600.0 us (+20.0%)"]
+
+def test_noisy_or_small_slowdowns_are_tolerated():
+    results = {
+        "GET /api/products [n=6]": {"median_us": 540.0, "mad_us": 5.0},   # within threshold
+        "GET / [en]": {"median_us": 950.0, "mad_us": 70.0},                # within 3 MADs
+        "POST /api/register": {"median_us": 900.0, "mad_us": 9.0},          # no baseline yet
+    }
+    
+    assert find_regressions(results, BASELINE, threshold=10) == []
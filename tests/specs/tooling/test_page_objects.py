@@ -0,0 +1,63 @@
+"""
+Page Object Tests
+Demonstrates: Counting the browser calls a page object makes, against a recording fake page (no browser needed)
+"""
+from tests.locators.app_locators import LoginLocators, ProductsLocators
+from tests.pages.app_pages import READ_CARDS_SCRIPT, LoginPage, ProductsPage
+
+class RecordingLocator:
+    """Stands in for a Locator; every action is logged as one browser round trip"""
+    
+    def __init__(self, calls: list, selector: str):
+        self.calls = calls
+        self.selector = selector
+    
+    def locator(self, selector: str) -> "RecordingLocator":
+        return RecordingLocator(self.calls, f"{self.selector} >> {selector}")
+    
+    def __getattr__(self, action: str):
+        def call(*args, **kwargs):
+            self.calls.append((self.selector, action))
+            return {"text_content": "Invalid credentials", "count": 3, "evaluate_all": []}.get(action)
+        return call
+
+class RecordingPage:
+    def __init__(self):
+        self.calls = []
+        self.lookups = 0
+    
+    def get_by_test_id(self, test_id: str) -> RecordingLocator:
+        self.lookups += 1
+        return RecordingLocator(self.calls, test_id)
+
+def test_locators_are_built_once_per_page_object():
+    page = RecordingPage()
+    login_page = LoginPage(page, "http://localhost:5000")
+    
+    for _ in range(3):
+        login_page.login("testuser", "wrong")
+    
+    assert page.lookups == 3
+    assert len(page.calls) == 9
+
+def test_error_message_reuses_one_locator():
+    page = RecordingPage()
+    
+    message = LoginPage(page, "http://localhost:5000").get_error_message()
+    
+    assert message == "Invalid credentials"
+    assert page.lookups == 1
+    assert page.calls == [(LoginLocators.ERROR_MESSAGE, "wait_for"), (LoginLocators.ERROR_MESSAGE, "text_content")]
+
+def test_cards_are_read_in_one_evaluate(monkeypatch):
+    page = RecordingPage()
+    products_page = ProductsPage(page, "http://localhost:5000")
+    monkeypatch.setattr(products_page, "wait_for_results", lambda: None)
+    
+    products_page.read_cards()
+    count = products_page.get_product_count()
+    
+    cards = f"{ProductsLocators.PRODUCTS_GRID} >> {ProductsLocators.PRODUCT_CARD}"
+    assert page.calls == [(cards, "evaluate_all"), (ProductsLocators.LOADING_INDICATOR, "wait_for"), (cards, "count")]
+    assert count == 3
+    assert "product-${field}-${id}" in READ_CARDS_SCRIPT
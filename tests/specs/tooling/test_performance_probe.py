@@ -0,0 +1,53 @@
+"""
+Performance Probe Tests
+Demonstrates: Pure-Python checks of metric aggregation and budgets (no browser needed)
+"""
+import pytest
+
+from tests.pages.performance import MetricsReport, PerformanceProbe, parse_budget, percentile
+
+def test_percentile_uses_nearest_rank():
+    values = [float(value) for value in range(1, 101)]
+    
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 95) == 95.0
+    assert percentile([7.0], 95) == 7.0
+
+def test_report_summarises_each_route_and_skips_missing_metrics():
+    report = MetricsReport()
+    for load in (100.0, 200.0, 300.0):
+        report.add("/products", {"load": load, "lcp": None})
+    report.add("/login", {"load": 50.0})
+    
+    summary = report.summary()
+    
+    assert list(summary) == ["/login", "/products"]
+    assert summary["/products"]["load"] == {"count": 3, "p50": 200.0, "p95": 300.0, "max": 300.0}
+    assert "lcp" not in summary["/products"]
+
+def test_merged_worker_samples_summarise_as_one_report():
+    workers = [MetricsReport(), MetricsReport()]
+    workers[0].add("/products", {"load": 100.0})
+    workers[1].add("/products", {"load": 300.0})
+    workers[1].add("/login", {"load": 50.0})
+    
+    report = MetricsReport()
+    for worker in workers:
+        report.merge(worker.raw())
+    
+    assert report.summary()["/products"]["load"]["count"] == 2
+    assert report.summary()["/products"]["load"]["max"] == 300.0
+    assert report.summary()["/login"]["load"]["count"] == 1
+
+def test_parse_budget_rejects_malformed_specs():
+    assert parse_budget("/products:time_to_first_product=1500") == ("/products", "time_to_first_product", 1500.0)
+    with pytest.raises(ValueError):
+        parse_budget("products=1500")
+
+def test_budget_only_fails_on_its_route():
+    probe = PerformanceProbe(budgets={"/products": {"time_to_first_product": 1000}})
+    
+    probe.check_budgets("/login", {"time_to_first_product": 5000})
+    probe.check_budgets("/products", {"time_to_first_product": 900})
+    with pytest.raises(AssertionError, match="time_to_first_product=1200 > 1000"):
+        probe.check_budgets("/products", {"time_to_first_product": 1200})
@@ -0,0 +1,47 @@
+"""
+Sharding Plugin Tests
+Demonstrates: Pure-Python checks of the shard planner (no browser needed)
+"""
+from tests.plugins.sharding import (
+    estimate,
+    makespan,
+    merge_durations,
+    partition_by_file,
+    partition_lpt,
+)
+
+WEIGHTS = {
+    "specs/components/test_components.py::test_progress_bar": 6.0,
+    "specs/components/test_components.py::test_toast": 4.0,
+    "specs/components/test_components.py::test_tabs": 1.0,
+    "specs/forms/test_forms.py::test_textarea": 0.5,
+    "specs/forms/test_forms.py::test_date_input": 0.5,
+    "specs/auth/test_authentication.py::test_login": 2.0,
+}
+
+def test_lpt_assigns_every_test_exactly_once():
+    shards = partition_lpt(WEIGHTS, 3)
+    
+    assigned = [nodeid for shard in shards for nodeid in shard]
+    assert sorted(assigned) == sorted(WEIGHTS)
+
+def test_lpt_beats_file_based_split():
+    # File-based splitting keeps all slow component tests on one shard
+    by_file = makespan(partition_by_file(WEIGHTS, 2), WEIGHTS)
+    balanced = makespan(partition_lpt(WEIGHTS, 2), WEIGHTS)
+    
+    assert balanced == 7.0
+    assert balanced < by_file
+
+def test_lpt_is_deterministic():
+    assert partition_lpt(WEIGHTS, 4) == partition_lpt(dict(reversed(list(WEIGHTS.items()))), 4)
+
+def test_unknown_tests_get_median_estimate():
+    weights = estimate(["a", "b", "c", "new"], {"a": 1.0, "b": 2.0, "c": 9.0})
+    
+    assert weights["new"] == 2.0
+
+def test_history_is_smoothed():
+    merged = merge_durations({"a": 2.0, "b": 1.0}, {"a": 4.0, "c": 3.0})
+    
+    assert merged == {"a": 3.0, "b": 1.0, "c": 3.0}
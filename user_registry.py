@@ -0,0 +1,75 @@
+"""
+Thread-safe user registry.
+
+Usernames hash onto a fixed set of lock stripes, so registrations and profile
+updates for different users rarely wait on each other while two requests for
+the same username are always serialized. Profiles are read-only mappings that
+are replaced, never mutated, on update, so readers take no lock and never see
+a half-applied change.
+"""
+import threading
+from types import MappingProxyType
+from typing import Mapping
+
+DEFAULT_STRIPES = 64
+
+
+class UserRegistry:
+    """
+    Username -> profile ({'password', 'email', 'role', ...}).
+
+    Reads are lock-free. Writers hold the username's stripe lock; inserts of
+    different usernames into the shared dict are atomic under the GIL.
+    """
+
+    def __init__(self, users: Mapping[str, Mapping] | None = None, stripes: int = DEFAULT_STRIPES):
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self.replace(users or {})
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    def __contains__(self, username: str) -> bool:
+        return username in self._users
+
+    def _lock_for(self, username: str) -> threading.Lock:
+        return self._locks[hash(username) % len(self._locks)]
+
+    def get(self, username: str | None) -> Mapping | None:
+        return self._users.get(username)
+
+    def authenticate(self, username: str | None, password: str | None) -> Mapping | None:
+        """The user's profile if the password matches, else None"""
+        profile = self._users.get(username)
+        if profile is not None and profile["password"] == password:
+            return profile
+        return None
+
+    def create(self, username: str, profile: Mapping) -> bool:
+        """Add the user unless the username is taken; returns whether it was added"""
+        with self._lock_for(username):
+            if username in self._users:
+                return False
+            self._users[username] = MappingProxyType(dict(profile))
+            return True
+
+    def update(self, username: str, **changes) -> Mapping:
+        """Publish a new profile with the changes applied (KeyError for unknown users)"""
+        with self._lock_for(username):
+            updated = MappingProxyType({**self._users[username], **changes})
+            self._users[username] = updated
+            return updated
+
+    def snapshot(self) -> dict[str, dict]:
+        """Plain-dict copy of every user, e.g. to restore after a benchmark"""
+        return {username: dict(profile) for username, profile in list(self._users.items())}
+
+    def checkpoint(self) -> dict[str, Mapping]:
+        """Shallow copy: profiles are immutable, so sharing them is safe"""
+        return dict(self._users)
+
+    def restore(self, checkpoint: dict[str, Mapping]) -> None:
+        self._users = dict(checkpoint)
+
+    def replace(self, users: Mapping[str, Mapping]) -> None:
+        self._users = {username: MappingProxyType(dict(profile)) for username, profile in users.items()}